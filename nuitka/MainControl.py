@@ -44,8 +44,14 @@ from nuitka.PythonVersions import (
 from nuitka.tree import SyntaxErrors
 from nuitka.utils import Execution, InstanceCounters, MemoryUsage, Utils
 from nuitka.utils.AppDirs import getCacheDir
+from nuitka.utils.BuildProfile import (
+    withBuildPhase,
+    withModuleBuildPhase,
+    writeBuildProfileReport,
+)
 from nuitka.utils.FileOperations import (
     deleteFile,
+    getFileList,
     hasFilenameExtension,
     listDir,
     makePath,
@@ -54,7 +60,13 @@ from nuitka.utils.FileOperations import (
 
 from . import ModuleRegistry, Options, TreeXML
 from .build import SconsInterface
-from .codegen import CodeGeneration, ConstantCodes, Reports
+from .codegen import (
+    CodeGeneration,
+    ConstantCodes,
+    ModuleCodeCache,
+    ModuleCodeWorkers,
+    Reports,
+)
 from .finalizations import Finalization
 from .freezer.BytecodeModuleFreezer import generateBytecodeFrozenCode
 from .freezer.Standalone import copyUsedDLLs, detectEarlyImports
@@ -72,12 +84,13 @@ def createNodeTree(filename):
     """
 
     # First, build the raw node tree from the source code.
-    main_module = Building.buildModuleTree(
-        filename=filename,
-        package=None,
-        is_top=True,
-        is_main=not Options.shallMakeModule(),
-    )
+    with withBuildPhase("tree_building"):
+        main_module = Building.buildModuleTree(
+            filename=filename,
+            package=None,
+            is_top=True,
+            is_main=not Options.shallMakeModule(),
+        )
     ModuleRegistry.addRootModule(main_module)
 
     # First remove old object files and old generated files, old binary or
@@ -364,16 +377,31 @@ def makeSourceDirectory(main_module):
     # end only.
     prepared_modules = {}
 
+    # Optionally, this is done in worker processes, and only replayed here.
+    if Options.getCodeGenerationJobLimit() > 1:
+        module_code_datas = ModuleCodeWorkers.prepareModuleCodesInWorkers(
+            global_context=global_context,
+            modules=[
+                module
+                for module in ModuleRegistry.getDoneModules()
+                if module.isCompiledPythonModule()
+            ],
+        )
+    else:
+        module_code_datas = {}
+
     for module in ModuleRegistry.getDoneModules():
         if module.isCompiledPythonModule():
             c_filename = module_filenames[module]
 
             try:
-                prepared_modules[c_filename] = CodeGeneration.prepareModuleCode(
-                    global_context=global_context,
-                    module=module,
-                    module_name=module.getFullName(),
-                )
+                with withModuleBuildPhase(module.getFullName(), "code_generation"):
+                    prepared_modules[c_filename] = CodeGeneration.prepareModuleCode(
+                        global_context=global_context,
+                        module=module,
+                        module_name=module.getFullName(),
+                        module_code_data=module_code_datas.get(module),
+                    )
             except Exception:
                 warning("Problem creating code for module %r." % module)
                 raise
@@ -389,9 +417,10 @@ def makeSourceDirectory(main_module):
 
             template_values, module_context = prepared_modules[c_filename]
 
-            source_code = CodeGeneration.generateModuleCode(
-                module_context=module_context, template_values=template_values
-            )
+            with withModuleBuildPhase(module.getFullName(), "code_generation"):
+                source_code = CodeGeneration.generateModuleCode(
+                    module_context=module_context, template_values=template_values
+                )
 
             writeSourceCode(filename=c_filename, source_code=source_code)
 
@@ -419,6 +448,13 @@ def makeSourceDirectory(main_module):
         else:
             assert False, module
 
+    if Options.shallCacheModuleCode() and Options.isShowProgress():
+        info(
+            "Module code cache had {hits} hits and {misses} misses.".format(
+                hits=ModuleCodeCache.cache_hits, misses=ModuleCodeCache.cache_misses
+            )
+        )
+
     writeSourceCode(
         filename=os.path.join(source_dir, "__constants.c"),
         source_code=ConstantCodes.getConstantsDefinitionCode(context=global_context),
@@ -441,7 +477,7 @@ def _asBoolStr(value):
     return "true" if value else "false"
 
 
-def runScons(main_module, quiet):
+def runScons(main_module, quiet, pgo_mode=None):
     # Scons gets transported many details, that we express as variables, and
     # have checks for them, leading to many branches and statements,
     # pylint: disable=too-many-branches,too-many-statements
@@ -481,6 +517,18 @@ def runScons(main_module, quiet):
     if Options.isLto():
         options["lto_mode"] = "true"
 
+    if pgo_mode is not None:
+        options["pgo_mode"] = pgo_mode
+
+    if Options.shallMapConstantsFile():
+        options["constants_file_mode"] = "true"
+
+    free_list_sizes = Options.getFreeListSizes()
+    if free_list_sizes:
+        options["free_list_sizes"] = ",".join(
+            "%s=%d" % (kind, count) for kind, count in sorted(free_list_sizes.items())
+        )
+
     # For AnaConda default to trying static lib python library, which
     # normally is just not available or if it is even unusable.
     if "Anaconda" in sys.version:
@@ -635,9 +683,10 @@ def compileTree(main_module):
 
     if not Options.shallOnlyExecCCompilerCall():
         # Now build the target language code for the whole tree.
-        makeSourceDirectory(main_module=main_module)
+        with withBuildPhase("code_generation"):
+            makeSourceDirectory(main_module=main_module)
 
-        frozen_code = generateBytecodeFrozenCode()
+            frozen_code = generateBytecodeFrozenCode()
 
         if frozen_code is not None:
             writeSourceCode(
@@ -648,6 +697,15 @@ def compileTree(main_module):
             filename=os.path.join(source_dir, "__constants.bin"),
             binary_data=ConstantCodes.stream_data.getBytes(),
         )
+
+        if Options.isShowProgress():
+            info(
+                "Constants blob size {size} bytes, {requests} values with {hit_rate:.1%} de-duplicated.".format(
+                    size=ConstantCodes.stream_data.getSize(),
+                    requests=ConstantCodes.stream_data.request_count,
+                    hit_rate=ConstantCodes.stream_data.getHitRate(),
+                )
+            )
     else:
         source_dir = getSourceDirectoryPath(main_module)
 
@@ -670,12 +728,64 @@ def compileTree(main_module):
     if Options.shallNotDoExecCCompilerCall():
         return True, {}
 
+    # For PGO, first build the instrumented binary, without old profile
+    # information around, as it would be added to.
+    if Options.isPgoMode():
+        _removePgoProfiles(source_dir)
+
     # Run the Scons to build things.
-    result, options = runScons(main_module=main_module, quiet=not Options.isShowScons())
+    with withBuildPhase("c_compilation"):
+        result, options = runScons(
+            main_module=main_module,
+            quiet=not Options.isShowScons(),
+            pgo_mode="generate" if Options.isPgoMode() else None,
+        )
 
     return result, options
 
 
+def _getPgoProfiles(source_dir):
+    return [
+        filename
+        for filename in getFileList(source_dir)
+        if hasFilenameExtension(filename, ".gcda")
+    ]
+
+
+def _removePgoProfiles(source_dir):
+    for filename in _getPgoProfiles(source_dir):
+        deleteFile(filename, must_exist=True)
+
+
+def runPgoTraining(main_module):
+    """ Run the instrumented binary, so it writes profile information.
+
+        The training run is done with the PGO arguments, and optionally
+        through a user provided command.
+    """
+
+    if Options.getPgoExecutable() is not None:
+        command = [Options.getPgoExecutable()]
+    else:
+        command = [os.path.abspath(getResultFullpath(main_module))]
+
+    command += Options.getPgoArgs()
+
+    if Options.isShowProgress():
+        info("Running '%s' to collect profile information." % " ".join(command))
+
+    exit_code = subprocess.call(command)
+
+    if exit_code != 0:
+        warning(
+            "Profile information run exited with code %d, it may be incomplete."
+            % exit_code
+        )
+
+    if not _getPgoProfiles(getSourceDirectoryPath(main_module)):
+        sys.exit("Error, the profile information run did not write any profile.")
+
+
 def handleSyntaxError(e):
     # Syntax or indentation errors, output them to the user and abort. If
     # we are not in full compat, and user has not specified the Python
@@ -762,6 +872,8 @@ def main():
             if Options.isShowMemory():
                 MemoryUsage.showMemoryTrace()
 
+            writeBuildProfileReport()
+
             sys.exit(0)
 
         if Options.isStandaloneMode():
@@ -781,11 +893,12 @@ def main():
                     Plugins.considerExtraDlls(dist_dir, module)
                 )
 
-            copyUsedDLLs(
-                source_dir=getSourceDirectoryPath(main_module),
-                dist_dir=dist_dir,
-                standalone_entry_points=standalone_entry_points,
-            )
+            with withBuildPhase("dll_scanning"):
+                copyUsedDLLs(
+                    source_dir=getSourceDirectoryPath(main_module),
+                    dist_dir=dist_dir,
+                    standalone_entry_points=standalone_entry_points,
+                )
 
             for module in ModuleRegistry.getDoneModules():
                 data_files.extend(Plugins.considerDataFiles(module))
@@ -799,6 +912,31 @@ def main():
 
                 shutil.copy2(source_filename, target_filename)
 
+        # For PGO, run the instrumented binary, and build it again, using the
+        # profile information. In standalone mode, that is done in the final
+        # distribution folder, and the DLLs are copied for the new binary.
+        if Options.isPgoMode():
+            with withBuildPhase("pgo_training"):
+                runPgoTraining(main_module)
+
+            with withBuildPhase("c_compilation_pgo"):
+                result, options = runScons(
+                    main_module=main_module,
+                    quiet=not Options.isShowScons(),
+                    pgo_mode="use",
+                )
+
+            if not result:
+                sys.exit(1)
+
+            if Options.isStandaloneMode():
+                with withBuildPhase("dll_scanning"):
+                    copyUsedDLLs(
+                        source_dir=getSourceDirectoryPath(main_module),
+                        dist_dir=getStandaloneDirectoryPath(main_module),
+                        standalone_entry_points=standalone_entry_points,
+                    )
+
         # Remove the source directory (now build directory too) if asked to.
         if Options.isRemoveBuildDir():
             removeDirectory(
@@ -843,6 +981,8 @@ __name__ = ...
                     }
                 )
 
+        writeBuildProfileReport()
+
         # Execute the module immediately if option was given.
         if Options.shallExecuteImmediately():
             if Options.shallMakeModule():
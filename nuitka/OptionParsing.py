@@ -348,6 +348,58 @@ compatibility reasons, the "__file__" value will always have ".py" suffix
 independent of what it really is.""",
 )
 
+codegen_group.add_option(
+    "--cache-module-code",
+    action="store_true",
+    dest="cache_module_code",
+    default=False,
+    help="""\
+Keep the generated C code of modules in the Nuitka cache directory and reuse
+it for modules that are unchanged after optimization in later compilations.
+The cache is keyed by the optimized module tree, the source code, the Nuitka
+and Python versions, and the relevant options. Parsing and optimization are
+still done for all modules, only C code generation is saved. Defaults to
+off.""",
+)
+
+codegen_group.add_option(
+    "--lazy-constants",
+    action="store_true",
+    dest="lazy_constants",
+    default=False,
+    help="""\
+Create constants shared by multiple modules when the first module using them
+is imported, rather than all at program start. This helps startup time and
+memory usage of programs that import only a part of the included modules.
+Defaults to off.""",
+)
+
+codegen_group.add_option(
+    "--mmap-constants",
+    action="store_true",
+    dest="mmap_constants",
+    default=False,
+    help="""\
+Do not link the constants data into the executable, but put it into a file
+next to it, that is mapped into memory read-only at program start. This makes
+linking faster for large programs, and the memory is shared between processes
+running the same executable. The program refuses to run with a file from
+another build. On Windows, the data is a resource of the executable, which is
+shared already. Defaults to off.""",
+)
+
+codegen_group.add_option(
+    "--codegen-jobs",
+    action="store",
+    dest="codegen_jobs",
+    metavar="N",
+    default="1",
+    help="""\
+Specify the allowed number of processes to generate the C code of modules in
+parallel. The output is the same as with generating it one module after the
+other. Not available on Windows. Defaults to 1.""",
+)
+
 parser.add_option_group(codegen_group)
 
 output_group = OptionGroup(parser, "Output choices")
@@ -500,30 +552,29 @@ debug_group.add_option(
     help=SUPPRESS_HELP,
 )
 
-if os.name == "nt":
-    debug_group.add_option(
-        "--disable-dll-dependency-cache",
-        action="store_true",
-        dest="no_dependency_cache",
-        default=False,
-        help="""\
+debug_group.add_option(
+    "--disable-dll-dependency-cache",
+    action="store_true",
+    dest="no_dependency_cache",
+    default=False,
+    help="""\
 Disable the dependency walker cache. Will result in much longer times to create
 the distribution folder, but might be used in case the cache is suspect to cause
 errors.
 """,
-    )
+)
 
-    debug_group.add_option(
-        "--force-dll-dependency-cache-update",
-        action="store_true",
-        dest="update_dependency_cache",
-        default=False,
-        help="""\
+debug_group.add_option(
+    "--force-dll-dependency-cache-update",
+    action="store_true",
+    dest="update_dependency_cache",
+    default=False,
+    help="""\
 For an update of the dependency walker cache. Will result in much longer times
 to create the distribution folder, but might be used in case the cache is suspect
 to cause errors or known to need an update.
 """,
-    )
+)
 
 # This is for testing framework, "coverage.py" hates to loose the process. And
 # we can use it to make sure it's not done unknowingly.
@@ -595,6 +646,56 @@ Use link time optimizations if available and usable (gcc 4.6 and higher).
 Defaults to off.""",
 )
 
+c_compiler_group.add_option(
+    "--pgo",
+    action="store_true",
+    dest="is_pgo",
+    default=False,
+    help="""\
+Use profile guided optimization. The program is built with instrumentation
+first, run to collect profile information, and then built again using it, so
+the C compiler knows e.g. the error paths not taken. Only for executables, and
+gcc. Defaults to off.""",
+)
+
+c_compiler_group.add_option(
+    "--pgo-args",
+    action="store",
+    dest="pgo_args",
+    default="",
+    help="""\
+Arguments to be passed in case of profile guided optimization. These are
+passed to the instrumented binary when it is run to collect profile
+information. Default empty.""",
+)
+
+c_compiler_group.add_option(
+    "--pgo-executable",
+    action="store",
+    dest="pgo_executable",
+    default=None,
+    help="""\
+Command to execute when collecting profile information, given the arguments
+from '--pgo-args' too. Use this only if you need to launch the program through
+a script that prepares it to run. Default using the created program.""",
+)
+
+c_compiler_group.add_option(
+    "--free-list-size",
+    action="append",
+    dest="free_list_sizes",
+    metavar="KIND=COUNT",
+    default=[],
+    help="""\
+Maximum number of deallocated compiled objects of a kind kept for reuse. The
+kinds are "asyncgen", "cell", "coroutine", "frame", "function", "generator",
+"method", and "traceback". Can be given multiple times. The usage of the free
+lists can be checked at run time with "get_free_list_stats()" of the Nuitka
+loader, which is "__loader__" of compiled modules on Python3, and also in
+"sys.meta_path". Defaults to 1000 for cells and tracebacks, and 100 for the
+others.""",
+)
+
 parser.add_option_group(c_compiler_group)
 
 tracing_group = OptionGroup(parser, "Tracing features")
@@ -627,6 +728,18 @@ tracing_group.add_option(
 Defaults to off.""",
 )
 
+tracing_group.add_option(
+    "--build-profile-report",
+    action="store",
+    dest="build_profile_report",
+    metavar="REPORT_FILENAME",
+    default=None,
+    help="""\
+Write a JSON report of the wall and CPU time, and the memory used by Nuitka
+for each phase of the compilation, and for each module in these phases. Use
+this to find out what makes a compilation expensive. Default is off.""",
+)
+
 
 tracing_group.add_option(
     "--show-modules",
@@ -19,6 +19,7 @@
 
 import logging
 import os
+import shlex
 import sys
 
 from nuitka.OptionParsing import parseOptions
@@ -114,6 +115,36 @@ mode where filenames are mandatory, and not for standalone where there is a
 sane default used inside the dist folder."""
         )
 
+    if options.mmap_constants and shallMakeModule():
+        sys.exit(
+            """\
+Error, can only map constants from a file for executables, not for modules."""
+        )
+
+    if options.is_pgo and shallMakeModule():
+        sys.exit(
+            """\
+Error, can only use profile guided optimization for executables, not for
+modules."""
+        )
+
+    for free_list_size in options.free_list_sizes:
+        kind, _, count = free_list_size.partition("=")
+
+        if kind not in free_list_kinds or not count.isdigit():
+            sys.exit(
+                """\
+Error, '--free-list-size' takes a kind of %s and a count, not '%s'."""
+                % (", ".join(free_list_kinds), free_list_size)
+            )
+
+    if getCodeGenerationJobLimit() > 1 and not hasattr(os, "fork"):
+        sys.exit(
+            """\
+Error, parallel code generation with '--codegen-jobs' needs 'fork' and is not
+available on this platform."""
+        )
+
 
 def isVerbose():
     return options.verbose
@@ -275,6 +306,22 @@ def shallClearPythonPathEnvironment():
     return not options.keep_pythonpath
 
 
+def shallCacheModuleCode():
+    return options.cache_module_code
+
+
+def shallCreateConstantsLazily():
+    return options.lazy_constants
+
+
+def shallMapConstantsFile():
+    return options.mmap_constants
+
+
+def getCodeGenerationJobLimit():
+    return int(options.codegen_jobs)
+
+
 def isShowScons():
     return options.show_scons
 
@@ -283,10 +330,46 @@ def getJobLimit():
     return int(options.jobs)
 
 
+free_list_kinds = (
+    "asyncgen",
+    "cell",
+    "coroutine",
+    "frame",
+    "function",
+    "generator",
+    "method",
+    "traceback",
+)
+
+
+def getFreeListSizes():
+    """ Maximum counts of free lists given by the user, by kind. """
+
+    result = {}
+
+    for free_list_size in options.free_list_sizes:
+        kind, count = free_list_size.split("=")
+        result[kind] = int(count)
+
+    return result
+
+
 def isLto():
     return options.lto
 
 
+def isPgoMode():
+    return options.is_pgo
+
+
+def getPgoArgs():
+    return shlex.split(options.pgo_args)
+
+
+def getPgoExecutable():
+    return options.pgo_executable
+
+
 def isClang():
     return options.clang
 
@@ -315,6 +398,13 @@ def isShowMemory():
     return options is not None and options.show_memory
 
 
+def getBuildProfileReportFilename():
+    if options is None:
+        return None
+
+    return options.build_profile_report
+
+
 def isShowInclusion():
     return options.show_inclusion
 
@@ -25,6 +25,7 @@ module variable references.
 
 from nuitka.__past__ import iterItems
 from nuitka.nodes.shapes.StandardShapes import ShapeUnknown
+from nuitka.Options import isExperimental
 from nuitka.utils import InstanceCounters, Utils
 
 complete = False
@@ -218,8 +219,24 @@ class Variable(object):
 
         return None
 
+    def getSingleAssignSource(self):
+        """ The assigned value, if all assignments are done by one node. """
+        result = None
+
+        for trace in self.traces:
+            if trace.isAssignTrace():
+                assign_source = trace.getAssignNode().getAssignSource()
+
+                if result is not None and assign_source is not result:
+                    return None
+
+                result = assign_source
+
+        return result
+
     def getTypeShapes(self):
         result = set()
+        may_be_unassigned = False
 
         for trace in self.traces:
             if trace.isAssignTrace():
@@ -228,7 +245,7 @@ class Variable(object):
                 result.add(ShapeUnknown)
             elif trace.isUninitTrace():
                 if trace.hasDefiniteUsages() or trace.hasPotentialUsages():
-                    result.add(ShapeUnknown)
+                    may_be_unassigned = True
             elif trace.isInitTrace():
                 result.add(ShapeUnknown)
             elif trace.isMergeTrace():
@@ -239,6 +256,15 @@ class Variable(object):
             else:
                 assert False, trace
 
+        # The C int type has an unassigned state of its own, e.g. for loop
+        # variables used after the loop, other types need the object for it.
+        if may_be_unassigned and not (
+            isExperimental("nuitka_ilong")
+            and result
+            and all(shape.getCType().c_type == "nuitka_ilong" for shape in result)
+        ):
+            result.add(ShapeUnknown)
+
         return result
 
 
@@ -43,6 +43,56 @@ NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_BUILTIN(PyObject *name) {
     return result;
 }
 
+#if PYTHON_VERSION >= 360
+// Cache of a module variable lookup, one per access site. The dictionary
+// entry found is valid as long as neither the module dictionary nor the
+// built-in dictionary changed their version tag, as adding or removing keys
+// always does that. Updating the value in place keeps the entry, so reading
+// through it gives the current value.
+typedef struct {
+    uint64_t module_dict_version;
+    uint64_t builtin_dict_version;
+    Nuitka_DictEntryHandle entry;
+} Nuitka_ModuleVariableCache;
+
+NUITKA_MAY_BE_UNUSED static PyObject *GET_MODULE_VARIABLE_VALUE_CACHED(PyDictObject *module_dict,
+                                                                      Nuitka_StringObject *var_name,
+                                                                      Nuitka_ModuleVariableCache *cache) {
+    CHECK_OBJECT((PyObject *)dict_builtin);
+
+    // New dictionaries never have version tag 0, so a fresh cache is never
+    // considered valid.
+    if (likely(cache->module_dict_version == module_dict->ma_version_tag &&
+               cache->builtin_dict_version == dict_builtin->ma_version_tag)) {
+        if (cache->entry == NULL) {
+            return NULL;
+        }
+
+        return GET_DICT_ENTRY_VALUE(cache->entry);
+    }
+
+    Nuitka_DictEntryHandle entry = GET_STRING_DICT_ENTRY(module_dict, var_name);
+
+    if (entry == NULL || GET_DICT_ENTRY_VALUE(entry) == NULL) {
+        entry = GET_STRING_DICT_ENTRY(dict_builtin, var_name);
+
+        if (entry != NULL && GET_DICT_ENTRY_VALUE(entry) == NULL) {
+            entry = NULL;
+        }
+    }
+
+    cache->module_dict_version = module_dict->ma_version_tag;
+    cache->builtin_dict_version = dict_builtin->ma_version_tag;
+    cache->entry = entry;
+
+    if (entry == NULL) {
+        return NULL;
+    }
+
+    return GET_DICT_ENTRY_VALUE(entry);
+}
+#endif
+
 extern void _initBuiltinModule();
 
 #define NUITKA_DECLARE_BUILTIN(name) extern PyObject *_python_original_builtin_value_##name;
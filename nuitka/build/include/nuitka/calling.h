@@ -78,9 +78,91 @@ NUITKA_MAY_BE_UNUSED static PyObject *CALL_FUNCTION_WITH_KEYARGS(PyObject *funct
     return CALL_FUNCTION(function_object, const_tuple_empty, named_args);
 }
 
+// Function call variant with positional and keyword argument values in arrays,
+// the keyword names are given as a tuple of the same size as their values.
+NUITKA_MAY_BE_UNUSED static PyObject *CALL_FUNCTION_WITH_ARGS_KW_NAMES(PyObject *function_object, PyObject **args,
+                                                                       Py_ssize_t args_size, PyObject **kw_values,
+                                                                       PyObject *kw_names) {
+    PyObject *positional_args = PyTuple_New(args_size);
+
+    for (Py_ssize_t i = 0; i < args_size; i++) {
+        CHECK_OBJECT(args[i]);
+
+        Py_INCREF(args[i]);
+        PyTuple_SET_ITEM(positional_args, i, args[i]);
+    }
+
+    Py_ssize_t kw_size = PyTuple_GET_SIZE(kw_names);
+    PyObject *named_args = _PyDict_NewPresized(kw_size);
+
+    for (Py_ssize_t i = 0; i < kw_size; i++) {
+        CHECK_OBJECT(kw_values[i]);
+
+        int res = PyDict_SetItem(named_args, PyTuple_GET_ITEM(kw_names, i), kw_values[i]);
+
+        if (unlikely(res != 0)) {
+            Py_DECREF(positional_args);
+            Py_DECREF(named_args);
+
+            return NULL;
+        }
+    }
+
+    PyObject *result = CALL_FUNCTION(function_object, positional_args, named_args);
+
+    Py_DECREF(positional_args);
+    Py_DECREF(named_args);
+
+    return result;
+}
+
 // Method call variant with no arguments provided at all.
 extern PyObject *CALL_METHOD_NO_ARGS(PyObject *source, PyObject *attribute);
 
+// Check if a built-in method descriptor can be called directly for the
+// object, with the given calling convention, avoiding to create a bound
+// method object. Python2 does not expose the method descriptor type.
+NUITKA_MAY_BE_UNUSED static bool IS_METHOD_DESCRIPTOR_DIRECT_CALL(PyObject *descr, PyObject *source, int flags) {
+#if PYTHON_VERSION < 300
+    return false;
+#else
+    if (Py_TYPE(descr) != &PyMethodDescr_Type) {
+        return false;
+    }
+
+    PyMethodDescrObject *method_descr = (PyMethodDescrObject *)descr;
+
+    if (method_descr->d_method->ml_flags != flags) {
+        return false;
+    }
+
+    return PyObject_TypeCheck(source, PyDescr_TYPE(method_descr));
+#endif
+}
+
+// Call a built-in method descriptor directly, "arg" is NULL for "METH_NOARGS".
+NUITKA_MAY_BE_UNUSED static PyObject *CALL_METHOD_DESCRIPTOR_DIRECT(PyObject *descr, PyObject *source, PyObject *arg) {
+    PyCFunction method = ((PyMethodDescrObject *)descr)->d_method->ml_meth;
+
+    PyObject *result = (*method)(source, arg);
+
+    if (result != NULL) {
+        // Some buggy C functions do set an error, but do not indicate it
+        // and Nuitka inner workings can get upset/confused from it.
+        DROP_ERROR_OCCURRED();
+
+        return result;
+    } else {
+        // Other buggy C functions do this, return NULL, but with
+        // no error set, not allowed.
+        if (unlikely(!ERROR_OCCURRED())) {
+            PyErr_Format(PyExc_SystemError, "NULL result without error in PyObject_Call");
+        }
+
+        return NULL;
+    }
+}
+
 // Convenience wrapper for single argument calls to not require an array
 // of args. TODO: Maybe fully specialize this too.
 NUITKA_MAY_BE_UNUSED static inline PyObject *CALL_FUNCTION_WITH_SINGLE_ARG(PyObject *called, PyObject *arg) {
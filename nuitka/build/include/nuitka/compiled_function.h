@@ -52,6 +52,10 @@ struct Nuitka_FunctionObject {
     // Same as code_object->co_varnames
     PyObject **m_varnames;
 
+    // Dictionary of keyword argument names to their index, only for functions
+    // with many arguments, NULL otherwise.
+    PyObject *m_keyword_index;
+
     function_impl_code m_c_code;
 
     PyObject *m_dict;
@@ -102,6 +106,32 @@ static inline PyObject *Nuitka_Function_GetName(PyObject *object) {
     return ((struct Nuitka_FunctionObject *)object)->m_name;
 }
 
+// Check for a compiled function with the given implementation, used to guard
+// direct calls of functions known at compile time.
+static inline bool Nuitka_Function_CheckCode(PyObject *object, function_impl_code c_code) {
+    return Nuitka_Function_Check(object) && ((struct Nuitka_FunctionObject *)object)->m_c_code == c_code;
+}
+
+// Call the implementation of a compiled function directly, with all of its
+// arguments given positionally, so there is no parsing of arguments needed.
+// The implementation is known at compile time, so it can be inlined.
+static inline PyObject *Nuitka_CallFunctionDirect(PyObject *called, function_impl_code c_code, PyObject **args,
+                                                  Py_ssize_t args_size) {
+    if (unlikely(Py_EnterRecursiveCall((char *)" while calling a Python object"))) {
+        return NULL;
+    }
+
+    for (Py_ssize_t i = 0; i < args_size; i++) {
+        Py_INCREF(args[i]);
+    }
+
+    PyObject *result = c_code((struct Nuitka_FunctionObject const *)called, args);
+
+    Py_LeaveRecursiveCall();
+
+    return result;
+}
+
 extern bool parseArgumentsPos(struct Nuitka_FunctionObject const *function, PyObject **python_pars, PyObject **args,
                               Py_ssize_t args_size);
 extern bool parseArgumentsMethodPos(struct Nuitka_FunctionObject const *function, PyObject **python_pars,
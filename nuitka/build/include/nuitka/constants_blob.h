@@ -21,12 +21,12 @@
 /* There are multiple ways, the constants binary is accessed, and its
  * definition depends on how that is done.
  *
- * It could be a Windows resource, then it must be a pointer. If it's defined
- * externally in a C file, or at link time with "ld", it must be an array. This
- * hides these facts.
+ * It could be a Windows resource, or a file mapped into memory, then it must
+ * be a pointer. If it's defined externally in a C file, or at link time with
+ * "ld", it must be an array. This hides these facts.
  */
 
-#if defined(_NUITKA_CONSTANTS_FROM_RESOURCE)
+#if defined(_NUITKA_CONSTANTS_FROM_RESOURCE) || defined(_NUITKA_CONSTANTS_FROM_FILE)
 extern const unsigned char *constant_bin;
 #else
 #ifdef __cplusplus
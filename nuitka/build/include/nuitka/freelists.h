@@ -19,21 +19,94 @@
 #ifndef __NUITKA_FREELISTS_H__
 #define __NUITKA_FREELISTS_H__
 
+// Maximum numbers of deallocated objects kept for reuse. These can be given
+// at build time, e.g. with "--free-list-size=function=200".
+#ifndef MAX_CELL_FREE_LIST_COUNT
+#define MAX_CELL_FREE_LIST_COUNT 1000
+#endif
+#ifndef MAX_FUNCTION_FREE_LIST_COUNT
+#define MAX_FUNCTION_FREE_LIST_COUNT 100
+#endif
+#ifndef MAX_METHOD_FREE_LIST_COUNT
+#define MAX_METHOD_FREE_LIST_COUNT 100
+#endif
+#ifndef MAX_GENERATOR_FREE_LIST_COUNT
+#define MAX_GENERATOR_FREE_LIST_COUNT 100
+#endif
+#ifndef MAX_COROUTINE_FREE_LIST_COUNT
+#define MAX_COROUTINE_FREE_LIST_COUNT 100
+#endif
+#ifndef MAX_ASYNCGEN_FREE_LIST_COUNT
+#define MAX_ASYNCGEN_FREE_LIST_COUNT 100
+#endif
+#ifndef MAX_FRAME_FREE_LIST_COUNT
+#define MAX_FRAME_FREE_LIST_COUNT 100
+#endif
+#ifndef MAX_TRACEBACK_FREE_LIST_COUNT
+#define MAX_TRACEBACK_FREE_LIST_COUNT 1000
+#endif
+
+// Usage of a free list, for sizing them from actual programs, see
+// "Nuitka_GetFreeListStats".
+struct Nuitka_FreeListStats {
+    char const *name;
+    int max_count;
+
+    // Objects currently in the free list.
+    int count;
+
+    // Allocations done from the free list, and those that were not.
+    Py_ssize_t hits;
+    Py_ssize_t misses;
+
+    // Deallocations that did not go to the free list, because it was full.
+    Py_ssize_t drops;
+};
+
+// Dictionary of all free lists usage, names mapping to their statistics.
+extern PyObject *Nuitka_GetFreeListStats(void);
+
+// Variable size objects are kept in a free list per size class. Allocations
+// are rounded up to the capacity of their class, so objects taken from a free
+// list are large enough, and need not be resized.
+#define FREE_LIST_SIZE_CLASS_COUNT 16
+
+static inline Py_ssize_t getFreeListSizeClassCapacity(int size_class) {
+    return size_class == 0 ? 0 : ((Py_ssize_t)1 << (size_class - 1));
+}
+
+// Returns "FREE_LIST_SIZE_CLASS_COUNT" for sizes too large for free lists.
+static inline int getFreeListSizeClass(Py_ssize_t size) {
+    int size_class = 0;
+
+    while (size_class < FREE_LIST_SIZE_CLASS_COUNT && getFreeListSizeClassCapacity(size_class) < size) {
+        size_class += 1;
+    }
+
+    return size_class;
+}
+
 #define allocateFromFreeList(free_list, object_type, type_type, size)                                                  \
-    if (free_list != NULL) {                                                                                           \
-        result = free_list;                                                                                            \
-        free_list = *((object_type **)free_list);                                                                      \
-        free_list##_count -= 1;                                                                                        \
-        assert(free_list##_count >= 0);                                                                                \
+    {                                                                                                                  \
+        int size_class = getFreeListSizeClass(size);                                                                   \
                                                                                                                        \
-        if (Py_SIZE(result) < size) {                                                                                  \
-            result = PyObject_GC_Resize(object_type, result, size);                                                    \
-            assert(result != NULL);                                                                                    \
-        }                                                                                                              \
+        if (size_class < FREE_LIST_SIZE_CLASS_COUNT && free_list[size_class] != NULL) {                                \
+            result = free_list[size_class];                                                                            \
+            free_list[size_class] = *((object_type **)result);                                                         \
+            free_list##_stats.count -= 1;                                                                              \
+            assert(free_list##_stats.count >= 0);                                                                      \
+            free_list##_stats.hits += 1;                                                                               \
                                                                                                                        \
-        _Py_NewReference((PyObject *)result);                                                                          \
-    } else {                                                                                                           \
-        result = (object_type *)Nuitka_GC_NewVar(&type_type, size);                                                    \
+            assert(Py_SIZE(result) >= size);                                                                           \
+                                                                                                                       \
+            _Py_NewReference((PyObject *)result);                                                                      \
+        } else {                                                                                                       \
+            free_list##_stats.misses += 1;                                                                             \
+                                                                                                                       \
+            result = (object_type *)Nuitka_GC_NewVar(                                                                  \
+                &type_type,                                                                                            \
+                size_class < FREE_LIST_SIZE_CLASS_COUNT ? getFreeListSizeClassCapacity(size_class) : size);            \
+        }                                                                                                              \
     }                                                                                                                  \
     CHECK_OBJECT(result);
 
@@ -41,32 +114,44 @@
     if (free_list != NULL) {                                                                                           \
         result = free_list;                                                                                            \
         free_list = *((object_type **)free_list);                                                                      \
-        free_list##_count -= 1;                                                                                        \
-        assert(free_list##_count >= 0);                                                                                \
+        free_list##_stats.count -= 1;                                                                                  \
+        assert(free_list##_stats.count >= 0);                                                                          \
+        free_list##_stats.hits += 1;                                                                                   \
                                                                                                                        \
         _Py_NewReference((PyObject *)result);                                                                          \
     } else {                                                                                                           \
+        free_list##_stats.misses += 1;                                                                                 \
+                                                                                                                       \
         result = (object_type *)PyObject_GC_New(object_type, &type_type);                                              \
     }                                                                                                                  \
     CHECK_OBJECT(result);
 
 #define releaseToFreeList(free_list, object, max_free_list_count)                                                      \
-    if (free_list != NULL) {                                                                                           \
-        if (free_list##_count > max_free_list_count) {                                                                 \
-            PyObject_GC_Del(object);                                                                                   \
-        } else {                                                                                                       \
-            *((void **)object) = (void *)free_list;                                                                    \
-            free_list = object;                                                                                        \
+    if (free_list##_stats.count >= max_free_list_count) {                                                              \
+        free_list##_stats.drops += 1;                                                                                  \
                                                                                                                        \
-            free_list##_count += 1;                                                                                    \
-        }                                                                                                              \
+        PyObject_GC_Del(object);                                                                                       \
     } else {                                                                                                           \
+        *((void **)object) = (void *)free_list;                                                                        \
         free_list = object;                                                                                            \
-        *((void **)object) = NULL;                                                                                     \
                                                                                                                        \
-        assert(free_list##_count == 0);                                                                                \
+        free_list##_stats.count += 1;                                                                                  \
+    }
+
+#define releaseToFreeListSized(free_list, object, max_free_list_count)                                                 \
+    {                                                                                                                  \
+        int size_class = getFreeListSizeClass(Py_SIZE(object));                                                        \
+                                                                                                                       \
+        if (size_class == FREE_LIST_SIZE_CLASS_COUNT || free_list##_stats.count >= max_free_list_count) {              \
+            free_list##_stats.drops += 1;                                                                              \
                                                                                                                        \
-        free_list##_count += 1;                                                                                        \
+            PyObject_GC_Del(object);                                                                                   \
+        } else {                                                                                                       \
+            *((void **)object) = (void *)free_list[size_class];                                                        \
+            free_list[size_class] = object;                                                                            \
+                                                                                                                       \
+            free_list##_stats.count += 1;                                                                              \
+        }                                                                                                              \
     }
 
 #endif
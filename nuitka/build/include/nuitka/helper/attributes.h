@@ -18,9 +18,49 @@
 #ifndef __NUITKA_HELPER_ATTRIBUTES_H__
 #define __NUITKA_HELPER_ATTRIBUTES_H__
 
+// Cache of the type attribute lookup, one per access site. It is valid as
+// long as the type is the same and has the version tag it had, as changes
+// to the type or its bases invalidate the version tag.
+typedef struct {
+    PyTypeObject *type;
+    unsigned int type_version;
+    PyObject *descr;
+} Nuitka_AttributeCache;
+
+// Lookup of an attribute in the type and its bases, borrowed reference,
+// using the cache if one is given.
+NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_TYPE_ATTRIBUTE_CACHED(PyTypeObject *type, PyObject *attr_name,
+                                                                  Nuitka_AttributeCache *cache) {
+    if (cache == NULL) {
+        return _PyType_Lookup(type, attr_name);
+    }
+
+    if (likely(cache->type == type && PyType_HasFeature(type, Py_TPFLAGS_VALID_VERSION_TAG) &&
+               cache->type_version == type->tp_version_tag)) {
+        return cache->descr;
+    }
+
+    PyObject *descr = _PyType_Lookup(type, attr_name);
+
+    // The lookup assigns a version tag to the type if it can.
+    if (PyType_HasFeature(type, Py_TPFLAGS_VALID_VERSION_TAG)) {
+        cache->type = type;
+        cache->type_version = type->tp_version_tag;
+        cache->descr = descr;
+    }
+
+    return descr;
+}
+
 // Attribute lookup except special slots below.
 extern PyObject *LOOKUP_ATTRIBUTE(PyObject *source, PyObject *attr_name);
 
+// Attribute lookup except special slots below, with a cache for the access site.
+extern PyObject *LOOKUP_ATTRIBUTE_CACHED(PyObject *source, PyObject *attr_name, Nuitka_AttributeCache *cache);
+
+// Method call without arguments, with a cache for the access site.
+extern PyObject *CALL_METHOD_NO_ARGS_CACHED(PyObject *source, PyObject *attr_name, Nuitka_AttributeCache *cache);
+
 // Attribute lookup of attribute slot "__dict__".
 extern PyObject *LOOKUP_ATTRIBUTE_DICT_SLOT(PyObject *source);
 
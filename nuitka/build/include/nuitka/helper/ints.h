@@ -46,7 +46,10 @@ typedef struct {
     long long_value;
 } nuitka_long;
 
-#if PYTHON_VERSION < 300
+/* An "int" or "long" value for Python2, an "int" value for Python3, which
+ * can be held as a C "long" value, as an object, or both. The object is only
+ * created when needed, e.g. for passing the value to object code.
+ */
 typedef enum {
     NUITKA_ILONG_UNASSIGNED = 0,
     NUITKA_ILONG_OBJECT_VALID = 1,
@@ -61,18 +64,192 @@ typedef struct {
     long ilong_value;
 } nuitka_ilong;
 
-NUITKA_MAY_BE_UNUSED static void ENFORCE_ILONG_OBJECT_VALUE(nuitka_ilong *value)
-{
-    assert( value->validity != NUITKA_ILONG_UNASSIGNED );
+// For initialization of variables, also when these are in structures.
+NUITKA_MAY_BE_UNUSED static nuitka_ilong const nuitka_ilong_unassigned_value = {NUITKA_ILONG_UNASSIGNED, NULL, 0};
+
+#define IS_NUITKA_ILONG_OBJECT_VALID(value) (((value)->validity & NUITKA_ILONG_OBJECT_VALID) != 0)
+#define IS_NUITKA_ILONG_VALUE_VALID(value) (((value)->validity & NUITKA_ILONG_VALUE_VALID) != 0)
+
+// Get the C value of an object, if it is an exact "int" that fits.
+NUITKA_MAY_BE_UNUSED static bool GET_ILONG_VALUE_FROM_OBJECT(PyObject *value, long *result) {
+    CHECK_OBJECT(value);
 
-    if ((value->validity & NUITKA_ILONG_OBJECT_VALID) == 0)
-    {
-        value->ilong_object = PyLong_FromLong(value->ilong_value);
+#if PYTHON_VERSION < 300
+    if (PyInt_CheckExact(value)) {
+        *result = PyInt_AS_LONG(value);
+        return true;
+    }
+#else
+    if (PyLong_CheckExact(value)) {
+        int overflow;
+        *result = PyLong_AsLongAndOverflow(value, &overflow);
+
+        return overflow == 0;
+    }
+#endif
+
+    return false;
+}
+
+NUITKA_MAY_BE_UNUSED static void ENFORCE_ILONG_OBJECT_VALUE(nuitka_ilong *value) {
+    assert(value->validity != NUITKA_ILONG_UNASSIGNED);
+
+    if (!IS_NUITKA_ILONG_OBJECT_VALID(value)) {
+        value->ilong_object = PyInt_FromLong(value->ilong_value);
 
         value->validity = NUITKA_ILONG_BOTH_VALID;
     }
 }
 
-#endif
+// Assign from an object, taking over the reference, the C value is set
+// too, if it can be had cheaply.
+NUITKA_MAY_BE_UNUSED static void SET_ILONG_FROM_OBJECT(nuitka_ilong *value, PyObject *object) {
+    CHECK_OBJECT(object);
+
+    value->ilong_object = object;
+
+    if (GET_ILONG_VALUE_FROM_OBJECT(object, &value->ilong_value)) {
+        value->validity = NUITKA_ILONG_BOTH_VALID;
+    } else {
+        value->validity = NUITKA_ILONG_OBJECT_VALID;
+    }
+}
+
+NUITKA_MAY_BE_UNUSED static void RELEASE_ILONG_VALUE(nuitka_ilong *value) {
+    if (IS_NUITKA_ILONG_OBJECT_VALID(value)) {
+        Py_DECREF(value->ilong_object);
+    }
+
+    value->validity = NUITKA_ILONG_UNASSIGNED;
+}
+
+NUITKA_MAY_BE_UNUSED static int CHECK_IF_ILONG_TRUE(nuitka_ilong const *value) {
+    assert(value->validity != NUITKA_ILONG_UNASSIGNED);
+
+    if (IS_NUITKA_ILONG_VALUE_VALID(value)) {
+        return value->ilong_value != 0 ? 1 : 0;
+    } else {
+        // Cannot fail for "int" and "long" objects.
+        return PyObject_IsTrue(value->ilong_object);
+    }
+}
+
+// The object of the value, as a new reference, which is also created if the
+// value is only held as a C value, without storing it there.
+NUITKA_MAY_BE_UNUSED static PyObject *GET_ILONG_OBJECT_VALUE(nuitka_ilong const *value) {
+    assert(value->validity != NUITKA_ILONG_UNASSIGNED);
+
+    if (IS_NUITKA_ILONG_OBJECT_VALID(value)) {
+        Py_INCREF(value->ilong_object);
+        return value->ilong_object;
+    } else {
+        return PyInt_FromLong(value->ilong_value);
+    }
+}
+
+// Update the value in place for the "+" operation, only falling back to the
+// object operation, when overflowing the C value.
+NUITKA_MAY_BE_UNUSED static bool _ILONG_OPERATION_INPLACE_OBJECT(nuitka_ilong *value, PyObject *operand,
+                                                                 binaryfunc slot) {
+    CHECK_OBJECT(operand);
+
+    ENFORCE_ILONG_OBJECT_VALUE(value);
+
+    PyObject *result = slot(value->ilong_object, operand);
+
+    if (unlikely(result == NULL)) {
+        return false;
+    }
+
+    Py_DECREF(value->ilong_object);
+    SET_ILONG_FROM_OBJECT(value, result);
+
+    return true;
+}
+
+NUITKA_MAY_BE_UNUSED static void _SET_ILONG_FROM_LONG(nuitka_ilong *value, long x) {
+    if (IS_NUITKA_ILONG_OBJECT_VALID(value)) {
+        Py_DECREF(value->ilong_object);
+    }
+
+    value->ilong_value = x;
+    value->validity = NUITKA_ILONG_VALUE_VALID;
+}
+
+NUITKA_MAY_BE_UNUSED static bool ILONG_ADD_OBJECT_INPLACE(nuitka_ilong *value, PyObject *operand) {
+    assert(value->validity != NUITKA_ILONG_UNASSIGNED);
+
+    long b;
+
+    if (IS_NUITKA_ILONG_VALUE_VALID(value) && GET_ILONG_VALUE_FROM_OBJECT(operand, &b)) {
+        const long a = value->ilong_value;
+        const long x = (long)((unsigned long)a + b);
+
+        if ((x ^ a) >= 0 || (x ^ b) >= 0) {
+            _SET_ILONG_FROM_LONG(value, x);
+            return true;
+        }
+    }
+
+    return _ILONG_OPERATION_INPLACE_OBJECT(value, operand, PyNumber_InPlaceAdd);
+}
+
+NUITKA_MAY_BE_UNUSED static bool ILONG_SUB_OBJECT_INPLACE(nuitka_ilong *value, PyObject *operand) {
+    assert(value->validity != NUITKA_ILONG_UNASSIGNED);
+
+    long b;
+
+    if (IS_NUITKA_ILONG_VALUE_VALID(value) && GET_ILONG_VALUE_FROM_OBJECT(operand, &b)) {
+        const long a = value->ilong_value;
+        const long x = (long)((unsigned long)a - b);
+
+        if ((x ^ a) >= 0 || (x ^ ~b) >= 0) {
+            _SET_ILONG_FROM_LONG(value, x);
+            return true;
+        }
+    }
+
+    return _ILONG_OPERATION_INPLACE_OBJECT(value, operand, PyNumber_InPlaceSubtract);
+}
+
+// Rich comparison with an object, giving a C result, -1 for errors.
+NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_ILONG_OBJECT(nuitka_ilong const *value, PyObject *operand, int op) {
+    assert(value->validity != NUITKA_ILONG_UNASSIGNED);
+
+    long b;
+
+    if (IS_NUITKA_ILONG_VALUE_VALID(value) && GET_ILONG_VALUE_FROM_OBJECT(operand, &b)) {
+        const long a = value->ilong_value;
+
+        switch (op) {
+        case Py_LT:
+            return a < b;
+        case Py_LE:
+            return a <= b;
+        case Py_EQ:
+            return a == b;
+        case Py_NE:
+            return a != b;
+        case Py_GT:
+            return a > b;
+        case Py_GE:
+            return a >= b;
+        default:
+            assert(false);
+        }
+    }
+
+    PyObject *object = GET_ILONG_OBJECT_VALUE(value);
+
+    if (unlikely(object == NULL)) {
+        return -1;
+    }
+
+    int result = PyObject_RichCompareBool(object, operand, op);
+
+    Py_DECREF(object);
+
+    return result;
+}
 
 #endif
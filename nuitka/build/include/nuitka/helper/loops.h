@@ -0,0 +1,282 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_HELPER_LOOPS_H__
+#define __NUITKA_HELPER_LOOPS_H__
+
+/* The iteration state of a "for" loop, used when the iterated value is known
+ * to be a "list", "tuple", "dict", or range. These are then iterated directly,
+ * without an iterator object, and ranges with C values only. Other values, e.g.
+ * ranges with values too large, use an iterator object.
+ */
+typedef enum {
+    NUITKA_LOOP_ITER_UNASSIGNED = 0,
+    NUITKA_LOOP_ITER_OBJECT = 1,
+    NUITKA_LOOP_ITER_LIST = 2,
+    NUITKA_LOOP_ITER_TUPLE = 3,
+    NUITKA_LOOP_ITER_DICT = 4,
+    NUITKA_LOOP_ITER_RANGE = 5
+} nuitka_loop_iter_kind;
+
+typedef struct {
+    nuitka_loop_iter_kind kind;
+
+    // The iterated "list", "tuple", or "dict", or the iterator object, NULL
+    // for ranges.
+    PyObject *object;
+
+    // Position in the iterated object, for ranges the count of values given.
+    Py_ssize_t index;
+
+    // For ranges the start and step values, and the count of values, for
+    // "dict" the size it must keep during the iteration.
+    long start;
+    long step;
+    Py_ssize_t length;
+} nuitka_loop_iter;
+
+// For initialization of variables, also when these are in structures.
+NUITKA_MAY_BE_UNUSED static nuitka_loop_iter const nuitka_loop_iter_unassigned_value = {
+    NUITKA_LOOP_ITER_UNASSIGNED, NULL, 0, 0, 0, 0};
+
+// Same as CPython, the count of values of a range, with unsigned arithmetic
+// to not overflow.
+NUITKA_MAY_BE_UNUSED static unsigned long _getLoopRangeLength(long low, long high, long step) {
+    assert(step != 0);
+
+    if (step > 0 && low < high) {
+        return 1UL + (high - 1UL - low) / step;
+    } else if (step < 0 && low > high) {
+        return 1UL + (low - 1UL - high) / (0UL - step);
+    } else {
+        return 0UL;
+    }
+}
+
+// Initialize for a range from C values, false if these are not usable, then
+// the range object must be used.
+NUITKA_MAY_BE_UNUSED static bool _INIT_LOOP_ITER_RANGE_VALUES(nuitka_loop_iter *iter, long low, long high,
+                                                              long step) {
+    if (unlikely(step == 0)) {
+        return false;
+    }
+
+    unsigned long length = _getLoopRangeLength(low, high, step);
+
+    if (unlikely(length > (unsigned long)LONG_MAX || length > (unsigned long)PY_SSIZE_T_MAX)) {
+        return false;
+    }
+
+    iter->kind = NUITKA_LOOP_ITER_RANGE;
+    iter->object = NULL;
+    iter->index = 0;
+    iter->start = low;
+    iter->step = step;
+    iter->length = (Py_ssize_t)length;
+
+    return true;
+}
+
+// Initialize for a range object, false if its values do not fit C values.
+NUITKA_MAY_BE_UNUSED static bool _INIT_LOOP_ITER_RANGE_OBJECT(nuitka_loop_iter *iter, PyObject *range) {
+#if PYTHON_VERSION < 300
+    struct _rangeobject2 *range_object = (struct _rangeobject2 *)range;
+
+    iter->kind = NUITKA_LOOP_ITER_RANGE;
+    iter->object = NULL;
+    iter->index = 0;
+    iter->start = range_object->start;
+    iter->step = range_object->step;
+    iter->length = range_object->len;
+
+    return true;
+#else
+    long start, stop, step, length;
+
+    // All values must fit, or else the iteration values might not.
+    if (!GET_ILONG_VALUE_FROM_OBJECT(PyRange_Start(range), &start) ||
+        !GET_ILONG_VALUE_FROM_OBJECT(PyRange_Stop(range), &stop) ||
+        !GET_ILONG_VALUE_FROM_OBJECT(PyRange_Step(range), &step) ||
+        !GET_ILONG_VALUE_FROM_OBJECT(((struct _rangeobject3 *)range)->length, &length)) {
+        return false;
+    }
+
+    if (unlikely(length < 0 || (unsigned long)length > (unsigned long)PY_SSIZE_T_MAX)) {
+        return false;
+    }
+
+    iter->kind = NUITKA_LOOP_ITER_RANGE;
+    iter->object = NULL;
+    iter->index = 0;
+    iter->start = start;
+    iter->step = step;
+    iter->length = (Py_ssize_t)length;
+
+    return true;
+#endif
+}
+
+// Initialize for iterating a value, not taking a reference to it.
+NUITKA_MAY_BE_UNUSED static bool INIT_LOOP_ITER(nuitka_loop_iter *iter, PyObject *value) {
+    CHECK_OBJECT(value);
+
+    if (PyList_CheckExact(value)) {
+        iter->kind = NUITKA_LOOP_ITER_LIST;
+    } else if (PyTuple_CheckExact(value)) {
+        iter->kind = NUITKA_LOOP_ITER_TUPLE;
+    } else if (PyDict_CheckExact(value)) {
+        iter->kind = NUITKA_LOOP_ITER_DICT;
+        iter->length = ((PyDictObject *)value)->ma_used;
+    } else if (PyRange_Check(value) && _INIT_LOOP_ITER_RANGE_OBJECT(iter, value)) {
+        return true;
+    } else {
+        PyObject *iterator = MAKE_ITERATOR(value);
+
+        if (unlikely(iterator == NULL)) {
+            return false;
+        }
+
+        iter->kind = NUITKA_LOOP_ITER_OBJECT;
+        iter->object = iterator;
+
+        return true;
+    }
+
+    iter->object = value;
+    Py_INCREF(value);
+
+    iter->index = 0;
+
+    return true;
+}
+
+// Initialize for "range" (Python3) or "xrange" (Python2) calls, these only
+// create the range object, if the values do not fit C values, or are wrong.
+NUITKA_MAY_BE_UNUSED static bool _INIT_LOOP_ITER_RANGE_FALLBACK(nuitka_loop_iter *iter, PyObject *range) {
+    if (unlikely(range == NULL)) {
+        return false;
+    }
+
+    bool result = INIT_LOOP_ITER(iter, range);
+
+    Py_DECREF(range);
+
+    return result;
+}
+
+NUITKA_MAY_BE_UNUSED static bool INIT_LOOP_ITER_XRANGE1(nuitka_loop_iter *iter, PyObject *high) {
+    long int_high;
+
+    if (GET_ILONG_VALUE_FROM_OBJECT(high, &int_high) && _INIT_LOOP_ITER_RANGE_VALUES(iter, 0, int_high, 1)) {
+        return true;
+    }
+
+    return _INIT_LOOP_ITER_RANGE_FALLBACK(iter, BUILTIN_XRANGE1(high));
+}
+
+NUITKA_MAY_BE_UNUSED static bool INIT_LOOP_ITER_XRANGE2(nuitka_loop_iter *iter, PyObject *low, PyObject *high) {
+    long int_low, int_high;
+
+    if (GET_ILONG_VALUE_FROM_OBJECT(low, &int_low) && GET_ILONG_VALUE_FROM_OBJECT(high, &int_high) &&
+        _INIT_LOOP_ITER_RANGE_VALUES(iter, int_low, int_high, 1)) {
+        return true;
+    }
+
+    return _INIT_LOOP_ITER_RANGE_FALLBACK(iter, BUILTIN_XRANGE2(low, high));
+}
+
+NUITKA_MAY_BE_UNUSED static bool INIT_LOOP_ITER_XRANGE3(nuitka_loop_iter *iter, PyObject *low, PyObject *high,
+                                                        PyObject *step) {
+    long int_low, int_high, int_step;
+
+    if (GET_ILONG_VALUE_FROM_OBJECT(low, &int_low) && GET_ILONG_VALUE_FROM_OBJECT(high, &int_high) &&
+        GET_ILONG_VALUE_FROM_OBJECT(step, &int_step) && _INIT_LOOP_ITER_RANGE_VALUES(iter, int_low, int_high, int_step)) {
+        return true;
+    }
+
+    return _INIT_LOOP_ITER_RANGE_FALLBACK(iter, BUILTIN_XRANGE3(low, high, step));
+}
+
+// The next value of the iteration as a new reference. When exhausted, NULL is
+// returned without an error set, like "ITERATOR_NEXT" does.
+NUITKA_MAY_BE_UNUSED static PyObject *LOOP_ITER_NEXT(nuitka_loop_iter *iter) {
+    PyObject *result;
+
+    switch (iter->kind) {
+    case NUITKA_LOOP_ITER_LIST:
+        // The list may be changed during the iteration, so check every time.
+        if (iter->index >= PyList_GET_SIZE(iter->object)) {
+            return NULL;
+        }
+
+        result = PyList_GET_ITEM(iter->object, iter->index);
+        iter->index += 1;
+
+        Py_INCREF(result);
+        return result;
+    case NUITKA_LOOP_ITER_TUPLE:
+        if (iter->index >= PyTuple_GET_SIZE(iter->object)) {
+            return NULL;
+        }
+
+        result = PyTuple_GET_ITEM(iter->object, iter->index);
+        iter->index += 1;
+
+        Py_INCREF(result);
+        return result;
+    case NUITKA_LOOP_ITER_DICT:
+        if (unlikely(((PyDictObject *)iter->object)->ma_used != iter->length)) {
+            PyErr_Format(PyExc_RuntimeError, "dictionary changed size during iteration");
+
+            // Make this state sticky, like CPython does.
+            iter->length = -1;
+
+            return NULL;
+        }
+
+        if (!PyDict_Next(iter->object, &iter->index, &result, NULL)) {
+            return NULL;
+        }
+
+        Py_INCREF(result);
+        return result;
+    case NUITKA_LOOP_ITER_RANGE:
+        if (iter->index >= iter->length) {
+            return NULL;
+        }
+
+        // Unsigned arithmetic, so that the last value cannot overflow.
+        result = PyInt_FromLong((long)((unsigned long)iter->start + (unsigned long)iter->index * iter->step));
+        iter->index += 1;
+
+        return result;
+    case NUITKA_LOOP_ITER_OBJECT:
+        return ITERATOR_NEXT(iter->object);
+    default:
+        NUITKA_CANNOT_GET_HERE(LOOP_ITER_NEXT);
+        return NULL;
+    }
+}
+
+NUITKA_MAY_BE_UNUSED static void RELEASE_LOOP_ITER(nuitka_loop_iter *iter) {
+    Py_XDECREF(iter->object);
+
+    iter->kind = NUITKA_LOOP_ITER_UNASSIGNED;
+    iter->object = NULL;
+}
+
+#endif
@@ -949,4 +949,8 @@ NUITKA_MAY_BE_UNUSED static bool POWER_OPERATION_INPLACE(PyObject **operand1, Py
     return true;
 }
 
+// Type specialized helpers for the other binary operations, these are
+// generated code.
+#include "nuitka/helper/operations_binary_specialized.h"
+
 #endif
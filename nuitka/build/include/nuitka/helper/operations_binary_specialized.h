@@ -0,0 +1,258 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+// This file is generated by "nuitka.tools.specialize" from the tables in
+// "nuitka/codegen/OperatorCodes.py", do not edit it manually.
+
+#ifndef __NUITKA_OPERATIONS_BINARY_SPECIALIZED_H__
+#define __NUITKA_OPERATIONS_BINARY_SPECIALIZED_H__
+
+// Helpers to execute "&" on fully or partially known types.
+#if PYTHON_VERSION < 300
+extern PyObject *BINARY_OPERATION_BITAND_INT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_BITAND_INT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_BITAND_OBJECT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_BITAND_OBJECT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_BITAND_INT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_BITAND_INT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+#endif
+extern PyObject *BINARY_OPERATION_BITAND_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_BITAND_LONG_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_BITAND_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_BITAND_OBJECT_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_BITAND_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_BITAND_LONG_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+
+// Helpers to execute "|" on fully or partially known types.
+#if PYTHON_VERSION < 300
+extern PyObject *BINARY_OPERATION_BITOR_INT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_BITOR_INT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_BITOR_OBJECT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_BITOR_OBJECT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_BITOR_INT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_BITOR_INT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+#endif
+extern PyObject *BINARY_OPERATION_BITOR_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_BITOR_LONG_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_BITOR_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_BITOR_OBJECT_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_BITOR_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_BITOR_LONG_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+
+// Helpers to execute "^" on fully or partially known types.
+#if PYTHON_VERSION < 300
+extern PyObject *BINARY_OPERATION_BITXOR_INT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_BITXOR_INT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_BITXOR_OBJECT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_BITXOR_OBJECT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_BITXOR_INT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_BITXOR_INT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+#endif
+extern PyObject *BINARY_OPERATION_BITXOR_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_BITXOR_LONG_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_BITXOR_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_BITXOR_OBJECT_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_BITXOR_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_BITXOR_LONG_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+
+// Helpers to execute "/" on fully or partially known types.
+#if PYTHON_VERSION < 300
+extern PyObject *BINARY_OPERATION_DIV_INT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_DIV_INT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_DIV_OBJECT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_DIV_OBJECT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_DIV_INT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_DIV_INT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_DIV_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_DIV_LONG_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_DIV_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_DIV_OBJECT_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_DIV_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_DIV_LONG_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_DIV_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_DIV_FLOAT_FLOAT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_DIV_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_DIV_OBJECT_FLOAT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_DIV_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_DIV_FLOAT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+#endif
+
+// Helpers to execute "//" on fully or partially known types.
+#if PYTHON_VERSION < 300
+extern PyObject *BINARY_OPERATION_FLOORDIV_INT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_FLOORDIV_INT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_FLOORDIV_OBJECT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_FLOORDIV_OBJECT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_FLOORDIV_INT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_FLOORDIV_INT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+#endif
+extern PyObject *BINARY_OPERATION_FLOORDIV_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_FLOORDIV_LONG_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_FLOORDIV_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_FLOORDIV_OBJECT_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_FLOORDIV_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_FLOORDIV_LONG_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_FLOORDIV_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_FLOORDIV_FLOAT_FLOAT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_FLOORDIV_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_FLOORDIV_OBJECT_FLOAT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_FLOORDIV_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_FLOORDIV_FLOAT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+
+// Helpers to execute "<<" on fully or partially known types.
+#if PYTHON_VERSION < 300
+extern PyObject *BINARY_OPERATION_LSHIFT_INT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_LSHIFT_INT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_LSHIFT_OBJECT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_LSHIFT_OBJECT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_LSHIFT_INT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_LSHIFT_INT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+#endif
+extern PyObject *BINARY_OPERATION_LSHIFT_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_LSHIFT_LONG_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_LSHIFT_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_LSHIFT_OBJECT_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_LSHIFT_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_LSHIFT_LONG_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+
+// Helpers to execute "%" on fully or partially known types.
+#if PYTHON_VERSION < 300
+extern PyObject *BINARY_OPERATION_REMAINDER_INT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_REMAINDER_INT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_REMAINDER_OBJECT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_REMAINDER_OBJECT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_REMAINDER_INT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_REMAINDER_INT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+#endif
+extern PyObject *BINARY_OPERATION_REMAINDER_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_REMAINDER_LONG_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_REMAINDER_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_REMAINDER_OBJECT_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_REMAINDER_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_REMAINDER_LONG_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_REMAINDER_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_REMAINDER_FLOAT_FLOAT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_REMAINDER_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_REMAINDER_OBJECT_FLOAT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_REMAINDER_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_REMAINDER_FLOAT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+
+// Helpers to execute "*" on fully or partially known types.
+#if PYTHON_VERSION < 300
+extern PyObject *BINARY_OPERATION_MUL_INT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_MUL_INT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_MUL_OBJECT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_MUL_OBJECT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_MUL_INT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_MUL_INT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+#endif
+extern PyObject *BINARY_OPERATION_MUL_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_MUL_LONG_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_MUL_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_MUL_OBJECT_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_MUL_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_MUL_LONG_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_MUL_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_MUL_FLOAT_FLOAT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_MUL_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_MUL_OBJECT_FLOAT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_MUL_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_MUL_FLOAT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+
+// Helpers to execute "**" on fully or partially known types.
+#if PYTHON_VERSION < 300
+extern PyObject *BINARY_OPERATION_POW_INT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_POW_INT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_POW_OBJECT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_POW_OBJECT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_POW_INT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_POW_INT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+#endif
+extern PyObject *BINARY_OPERATION_POW_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_POW_LONG_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_POW_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_POW_OBJECT_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_POW_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_POW_LONG_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_POW_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_POW_FLOAT_FLOAT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_POW_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_POW_OBJECT_FLOAT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_POW_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_POW_FLOAT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+
+// Helpers to execute ">>" on fully or partially known types.
+#if PYTHON_VERSION < 300
+extern PyObject *BINARY_OPERATION_RSHIFT_INT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_RSHIFT_INT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_RSHIFT_OBJECT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_RSHIFT_OBJECT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_RSHIFT_INT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_RSHIFT_INT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+#endif
+extern PyObject *BINARY_OPERATION_RSHIFT_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_RSHIFT_LONG_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_RSHIFT_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_RSHIFT_OBJECT_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_RSHIFT_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_RSHIFT_LONG_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+
+// Helpers to execute "-" on fully or partially known types.
+#if PYTHON_VERSION < 300
+extern PyObject *BINARY_OPERATION_SUB_INT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_SUB_INT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_SUB_OBJECT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_SUB_OBJECT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_SUB_INT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_SUB_INT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+#endif
+extern PyObject *BINARY_OPERATION_SUB_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_SUB_LONG_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_SUB_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_SUB_OBJECT_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_SUB_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_SUB_LONG_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_SUB_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_SUB_FLOAT_FLOAT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_SUB_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_SUB_OBJECT_FLOAT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_SUB_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_SUB_FLOAT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+
+// Helpers to execute "/" on fully or partially known types.
+#if PYTHON_VERSION < 300
+extern PyObject *BINARY_OPERATION_TRUEDIV_INT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_TRUEDIV_INT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_TRUEDIV_OBJECT_INT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_TRUEDIV_OBJECT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_TRUEDIV_INT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_TRUEDIV_INT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+#endif
+extern PyObject *BINARY_OPERATION_TRUEDIV_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_TRUEDIV_LONG_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_TRUEDIV_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_TRUEDIV_OBJECT_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_TRUEDIV_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_TRUEDIV_LONG_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_TRUEDIV_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_TRUEDIV_FLOAT_FLOAT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_TRUEDIV_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_TRUEDIV_OBJECT_FLOAT_INPLACE(PyObject **operand1, PyObject *operand2);
+extern PyObject *BINARY_OPERATION_TRUEDIV_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern bool BINARY_OPERATION_TRUEDIV_FLOAT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
+
+#endif
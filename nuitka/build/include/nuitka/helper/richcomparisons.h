@@ -74,4 +74,7 @@ extern PyObject *RICH_COMPARE_NOTEQ_OBJECT_OBJECT(PyObject *operand1, PyObject *
 extern PyObject *RICH_COMPARE_GT_OBJECT_OBJECT(PyObject *operand1, PyObject *operand2);
 extern PyObject *RICH_COMPARE_GTE_OBJECT_OBJECT(PyObject *operand1, PyObject *operand2);
 
+// Type specialized helpers for Python3 types, these are generated code.
+#include "nuitka/helper/richcomparisons_specialized.h"
+
 #endif
@@ -0,0 +1,247 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+// This file is generated by "nuitka.tools.specialize" from the tables in
+// "nuitka/codegen/OperatorCodes.py", do not edit it manually.
+
+#ifndef __NUITKA_RICHCOMPARISONS_SPECIALIZED_H__
+#define __NUITKA_RICHCOMPARISONS_SPECIALIZED_H__
+
+#if PYTHON_VERSION >= 300
+
+// Helpers to compare fully or partially known long values.
+extern PyObject *RICH_COMPARE_LT_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LT_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LT_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LT_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LT_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LT_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LTE_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LTE_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LTE_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LTE_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LTE_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LTE_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_OBJECT_LONG_NORECURSE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_LONG_OBJECT_NORECURSE(PyObject *operand1, PyObject *operand2);
+#define RICH_COMPARE_EQ_LONG_LONG_NORECURSE RICH_COMPARE_EQ_LONG_LONG
+extern int RICH_COMPARE_BOOL_EQ_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_OBJECT_LONG_NORECURSE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_LONG_OBJECT_NORECURSE(PyObject *operand1, PyObject *operand2);
+#define RICH_COMPARE_BOOL_EQ_LONG_LONG_NORECURSE RICH_COMPARE_BOOL_EQ_LONG_LONG
+extern PyObject *RICH_COMPARE_NOTEQ_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_NOTEQ_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_NOTEQ_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_NOTEQ_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_NOTEQ_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_NOTEQ_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GT_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GT_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GT_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GT_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GT_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GT_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GTE_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GTE_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GTE_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GTE_LONG_LONG(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GTE_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GTE_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+
+// Helpers to compare fully or partially known float values.
+extern PyObject *RICH_COMPARE_LT_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LT_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LT_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LT_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LT_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LT_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LTE_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LTE_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LTE_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LTE_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LTE_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LTE_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_OBJECT_FLOAT_NORECURSE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_FLOAT_OBJECT_NORECURSE(PyObject *operand1, PyObject *operand2);
+#define RICH_COMPARE_EQ_FLOAT_FLOAT_NORECURSE RICH_COMPARE_EQ_FLOAT_FLOAT
+extern int RICH_COMPARE_BOOL_EQ_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_OBJECT_FLOAT_NORECURSE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_FLOAT_OBJECT_NORECURSE(PyObject *operand1, PyObject *operand2);
+#define RICH_COMPARE_BOOL_EQ_FLOAT_FLOAT_NORECURSE RICH_COMPARE_BOOL_EQ_FLOAT_FLOAT
+extern PyObject *RICH_COMPARE_NOTEQ_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_NOTEQ_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_NOTEQ_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_NOTEQ_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_NOTEQ_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_NOTEQ_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GT_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GT_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GT_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GT_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GT_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GT_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GTE_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GTE_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GTE_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GTE_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GTE_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GTE_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2);
+
+// Helpers to compare fully or partially known unicode values.
+extern PyObject *RICH_COMPARE_LT_UNICODE_UNICODE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LT_OBJECT_UNICODE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LT_UNICODE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LT_UNICODE_UNICODE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LT_OBJECT_UNICODE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LT_UNICODE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LTE_UNICODE_UNICODE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LTE_OBJECT_UNICODE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LTE_UNICODE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LTE_UNICODE_UNICODE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LTE_OBJECT_UNICODE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LTE_UNICODE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_UNICODE_UNICODE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_OBJECT_UNICODE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_OBJECT_UNICODE_NORECURSE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_UNICODE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_UNICODE_OBJECT_NORECURSE(PyObject *operand1, PyObject *operand2);
+#define RICH_COMPARE_EQ_UNICODE_UNICODE_NORECURSE RICH_COMPARE_EQ_UNICODE_UNICODE
+extern int RICH_COMPARE_BOOL_EQ_UNICODE_UNICODE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_OBJECT_UNICODE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_OBJECT_UNICODE_NORECURSE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_UNICODE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_UNICODE_OBJECT_NORECURSE(PyObject *operand1, PyObject *operand2);
+#define RICH_COMPARE_BOOL_EQ_UNICODE_UNICODE_NORECURSE RICH_COMPARE_BOOL_EQ_UNICODE_UNICODE
+extern PyObject *RICH_COMPARE_NOTEQ_UNICODE_UNICODE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_NOTEQ_OBJECT_UNICODE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_NOTEQ_UNICODE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_NOTEQ_UNICODE_UNICODE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_NOTEQ_OBJECT_UNICODE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_NOTEQ_UNICODE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GT_UNICODE_UNICODE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GT_OBJECT_UNICODE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GT_UNICODE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GT_UNICODE_UNICODE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GT_OBJECT_UNICODE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GT_UNICODE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GTE_UNICODE_UNICODE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GTE_OBJECT_UNICODE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GTE_UNICODE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GTE_UNICODE_UNICODE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GTE_OBJECT_UNICODE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GTE_UNICODE_OBJECT(PyObject *operand1, PyObject *operand2);
+
+// Helpers to compare fully or partially known bytes values.
+extern PyObject *RICH_COMPARE_LT_BYTES_BYTES(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LT_OBJECT_BYTES(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LT_BYTES_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LT_BYTES_BYTES(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LT_OBJECT_BYTES(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LT_BYTES_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LTE_BYTES_BYTES(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LTE_OBJECT_BYTES(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LTE_BYTES_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LTE_BYTES_BYTES(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LTE_OBJECT_BYTES(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LTE_BYTES_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_BYTES_BYTES(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_OBJECT_BYTES(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_OBJECT_BYTES_NORECURSE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_BYTES_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_BYTES_OBJECT_NORECURSE(PyObject *operand1, PyObject *operand2);
+#define RICH_COMPARE_EQ_BYTES_BYTES_NORECURSE RICH_COMPARE_EQ_BYTES_BYTES
+extern int RICH_COMPARE_BOOL_EQ_BYTES_BYTES(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_OBJECT_BYTES(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_OBJECT_BYTES_NORECURSE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_BYTES_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_BYTES_OBJECT_NORECURSE(PyObject *operand1, PyObject *operand2);
+#define RICH_COMPARE_BOOL_EQ_BYTES_BYTES_NORECURSE RICH_COMPARE_BOOL_EQ_BYTES_BYTES
+extern PyObject *RICH_COMPARE_NOTEQ_BYTES_BYTES(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_NOTEQ_OBJECT_BYTES(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_NOTEQ_BYTES_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_NOTEQ_BYTES_BYTES(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_NOTEQ_OBJECT_BYTES(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_NOTEQ_BYTES_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GT_BYTES_BYTES(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GT_OBJECT_BYTES(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GT_BYTES_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GT_BYTES_BYTES(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GT_OBJECT_BYTES(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GT_BYTES_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GTE_BYTES_BYTES(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GTE_OBJECT_BYTES(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GTE_BYTES_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GTE_BYTES_BYTES(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GTE_OBJECT_BYTES(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GTE_BYTES_OBJECT(PyObject *operand1, PyObject *operand2);
+
+// Helpers to compare fully or partially known tuple values.
+extern PyObject *RICH_COMPARE_LT_TUPLE_TUPLE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LT_OBJECT_TUPLE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LT_TUPLE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LT_TUPLE_TUPLE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LT_OBJECT_TUPLE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LT_TUPLE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LTE_TUPLE_TUPLE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LTE_OBJECT_TUPLE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_LTE_TUPLE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LTE_TUPLE_TUPLE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LTE_OBJECT_TUPLE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_LTE_TUPLE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_TUPLE_TUPLE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_TUPLE_TUPLE_NORECURSE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_OBJECT_TUPLE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_OBJECT_TUPLE_NORECURSE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_TUPLE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_EQ_TUPLE_OBJECT_NORECURSE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_TUPLE_TUPLE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_TUPLE_TUPLE_NORECURSE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_OBJECT_TUPLE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_OBJECT_TUPLE_NORECURSE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_TUPLE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_EQ_TUPLE_OBJECT_NORECURSE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_NOTEQ_TUPLE_TUPLE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_NOTEQ_OBJECT_TUPLE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_NOTEQ_TUPLE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_NOTEQ_TUPLE_TUPLE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_NOTEQ_OBJECT_TUPLE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_NOTEQ_TUPLE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GT_TUPLE_TUPLE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GT_OBJECT_TUPLE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GT_TUPLE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GT_TUPLE_TUPLE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GT_OBJECT_TUPLE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GT_TUPLE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GTE_TUPLE_TUPLE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GTE_OBJECT_TUPLE(PyObject *operand1, PyObject *operand2);
+extern PyObject *RICH_COMPARE_GTE_TUPLE_OBJECT(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GTE_TUPLE_TUPLE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GTE_OBJECT_TUPLE(PyObject *operand1, PyObject *operand2);
+extern int RICH_COMPARE_BOOL_GTE_TUPLE_OBJECT(PyObject *operand1, PyObject *operand2);
+#endif
+
+#endif
@@ -79,6 +79,9 @@ static inline PyObject *Nuitka_Function_GetName(PyObject *object);
 static inline bool Nuitka_Generator_Check(PyObject *object);
 static inline PyObject *Nuitka_Generator_GetName(PyObject *object);
 
+// The attribute cache is used by method call helpers.
+#include "nuitka/helper/attributes.h"
+
 #include "nuitka/calling.h"
 
 NUITKA_MAY_BE_UNUSED static PyObject *TO_FLOAT(PyObject *value) {
@@ -180,7 +183,6 @@ NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_VARS(PyObject *source) {
     return result;
 }
 
-#include "nuitka/helper/attributes.h"
 #include "nuitka/helper/bytearrays.h"
 #include "nuitka/helper/iterators.h"
 #include "nuitka/helper/lists.h"
@@ -189,6 +191,9 @@ NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_VARS(PyObject *source) {
 #include "nuitka/helper/subscripts.h"
 #include "nuitka/helper/tuples.h"
 
+// Uses the iterator and range helpers.
+#include "nuitka/helper/loops.h"
+
 #include "nuitka/builtins.h"
 
 #include "nuitka/allocator.h"
@@ -379,7 +384,7 @@ NUITKA_MAY_BE_UNUSED static PyObject *MODULE_NAME(PyObject *module) {
     return PyDict_GetItem(module_dict, const_str_plain___name__);
 }
 
-#if defined(_NUITKA_STANDALONE) || _NUITKA_FROZEN > 0
+#if defined(_NUITKA_STANDALONE) || _NUITKA_FROZEN > 0 || defined(_NUITKA_CONSTANTS_FROM_FILE)
 // Get the binary directory, translated to UTF8 or usable as a native path,
 // e.g. ANSI on Windows.
 extern char *getBinaryDirectoryUTF8Encoded();
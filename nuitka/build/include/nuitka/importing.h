@@ -33,6 +33,23 @@ extern PyObject *IMPORT_MODULE5(PyObject *module_name, PyObject *globals, PyObje
 extern PyObject *IMPORT_MODULE_KW(PyObject *module_name, PyObject *globals, PyObject *locals, PyObject *import_items,
                                   PyObject *level);
 
+// Cache of an import, one per import site. The result is used again as long
+// as "__import__" was not replaced, "sys.modules" still has the imported
+// module, and for "import a.b" also the top level package. For packages the
+// names of the import list must also still be there.
+typedef struct {
+    PyObject *import_function;
+    PyObject *module;
+    PyObject *result;
+    PyObject *result_name;
+    bool check_import_items;
+} Nuitka_ImportCache;
+
+// Import with a cache for the import site, "full_name" is the absolute name
+// of the imported module, level may be NULL to use the default.
+extern PyObject *IMPORT_MODULE_CACHED(PyObject *full_name, PyObject *module_name, PyObject *globals, PyObject *locals,
+                                      PyObject *import_items, PyObject *level, Nuitka_ImportCache *cache);
+
 extern bool IMPORT_MODULE_STAR(PyObject *target, bool is_module, PyObject *module);
 
 extern PyObject *IMPORT_EMBEDDED_MODULE(PyObject *module_name, char const *name);
@@ -532,9 +532,8 @@ static PyObject *Nuitka_Asyncgen_athrow(struct Nuitka_AsyncgenObject *asyncgen,
     return Nuitka_AsyncgenAthrow_New(asyncgen, args);
 }
 
-#define MAX_ASYNCGEN_FREE_LIST_COUNT 100
-static struct Nuitka_AsyncgenObject *free_list_asyncgens = NULL;
-static int free_list_asyncgens_count = 0;
+static struct Nuitka_AsyncgenObject *free_list_asyncgens[FREE_LIST_SIZE_CLASS_COUNT];
+struct Nuitka_FreeListStats free_list_asyncgens_stats = {"asyncgens", MAX_ASYNCGEN_FREE_LIST_COUNT};
 
 // TODO: This might have to be finalize actually.
 static void Nuitka_Asyncgen_tp_dealloc(struct Nuitka_AsyncgenObject *asyncgen) {
@@ -598,7 +597,7 @@ static void Nuitka_Asyncgen_tp_dealloc(struct Nuitka_AsyncgenObject *asyncgen) {
     Py_DECREF(asyncgen->m_qualname);
 
     /* Put the object into freelist or release to GC */
-    releaseToFreeList(free_list_asyncgens, asyncgen, MAX_ASYNCGEN_FREE_LIST_COUNT);
+    releaseToFreeListSized(free_list_asyncgens, asyncgen, MAX_ASYNCGEN_FREE_LIST_COUNT);
 
     RESTORE_ERROR_OCCURRED(save_exception_type, save_exception_value, save_exception_tb);
 }
@@ -757,7 +756,8 @@ struct Nuitka_AsyncgenWrappedValueObject {
 };
 
 static struct Nuitka_AsyncgenWrappedValueObject *free_list_asyncgen_value_wrappers = NULL;
-static int free_list_asyncgen_value_wrappers_count = 0;
+struct Nuitka_FreeListStats free_list_asyncgen_value_wrappers_stats =
+    {"asyncgen_value_wrappers", MAX_ASYNCGEN_FREE_LIST_COUNT};
 
 static void asyncgen_value_wrapper_tp_dealloc(struct Nuitka_AsyncgenWrappedValueObject *asyncgen_value_wrapper) {
     Nuitka_GC_UnTrack((PyObject *)asyncgen_value_wrapper);
@@ -892,7 +892,7 @@ static PyObject *Nuitka_Asyncgen_unwrap_value(struct Nuitka_AsyncgenObject *asyn
 }
 
 static struct Nuitka_AsyncgenAsendObject *free_list_asyncgen_asends = NULL;
-static int free_list_asyncgen_asends_count = 0;
+struct Nuitka_FreeListStats free_list_asyncgen_asends_stats = {"asyncgen_asends", MAX_ASYNCGEN_FREE_LIST_COUNT};
 
 static void Nuitka_AsyncgenAsend_tp_dealloc(struct Nuitka_AsyncgenAsendObject *asyncgen_asend) {
     Nuitka_GC_UnTrack(asyncgen_asend);
@@ -1082,7 +1082,7 @@ struct Nuitka_AsyncgenAthrowObject {
 };
 
 static struct Nuitka_AsyncgenAthrowObject *free_list_asyncgen_athrows = NULL;
-static int free_list_asyncgen_athrows_count = 0;
+struct Nuitka_FreeListStats free_list_asyncgen_athrows_stats = {"asyncgen_athrows", MAX_ASYNCGEN_FREE_LIST_COUNT};
 
 static void Nuitka_AsyncgenAthrow_dealloc(struct Nuitka_AsyncgenAthrowObject *asyncgen_athrow) {
     Nuitka_GC_UnTrack(asyncgen_athrow);
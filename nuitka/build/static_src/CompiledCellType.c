@@ -20,9 +20,8 @@
 
 #include "nuitka/freelists.h"
 
-#define MAX_CELL_FREE_LIST_COUNT 1000
 static struct Nuitka_CellObject *free_list_cells = NULL;
-static int free_list_cells_count = 0;
+struct Nuitka_FreeListStats free_list_cells_stats = {"cells", MAX_CELL_FREE_LIST_COUNT};
 
 static void Nuitka_Cell_tp_dealloc(struct Nuitka_CellObject *cell) {
     Nuitka_GC_UnTrack(cell);
@@ -29,6 +29,7 @@
 
 #include "HelpersBuiltin.c"
 #include "HelpersClasses.c"
+#include "HelpersFreeLists.c"
 #include "HelpersHeapStorage.c"
 #include "HelpersImport.c"
 #include "HelpersPathTools.c"
@@ -1998,6 +1999,11 @@ void _initSlotIternext() {
 #endif
 
 #include "HelpersComparison.c"
+#include "HelpersComparisonBytes.c"
+#include "HelpersComparisonFloat.c"
+#include "HelpersComparisonLong.c"
+#include "HelpersComparisonTuple.c"
+#include "HelpersComparisonUnicode.c"
 
 #include "HelpersDeepcopy.c"
 
@@ -2005,6 +2011,30 @@ void _initSlotIternext() {
 
 #include "HelpersOperationBinaryAdd.c"
 #include "HelpersOperationBinaryInplaceAdd.c"
+#include "HelpersOperationBinarySub.c"
+#include "HelpersOperationBinaryInplaceSub.c"
+#include "HelpersOperationBinaryMult.c"
+#include "HelpersOperationBinaryInplaceMult.c"
+#include "HelpersOperationBinaryDiv.c"
+#include "HelpersOperationBinaryInplaceDiv.c"
+#include "HelpersOperationBinaryFloorDiv.c"
+#include "HelpersOperationBinaryInplaceFloorDiv.c"
+#include "HelpersOperationBinaryTrueDiv.c"
+#include "HelpersOperationBinaryInplaceTrueDiv.c"
+#include "HelpersOperationBinaryMod.c"
+#include "HelpersOperationBinaryInplaceMod.c"
+#include "HelpersOperationBinaryPow.c"
+#include "HelpersOperationBinaryInplacePow.c"
+#include "HelpersOperationBinaryLShift.c"
+#include "HelpersOperationBinaryInplaceLShift.c"
+#include "HelpersOperationBinaryRShift.c"
+#include "HelpersOperationBinaryInplaceRShift.c"
+#include "HelpersOperationBinaryBitAnd.c"
+#include "HelpersOperationBinaryInplaceBitAnd.c"
+#include "HelpersOperationBinaryBitOr.c"
+#include "HelpersOperationBinaryInplaceBitOr.c"
+#include "HelpersOperationBinaryBitXor.c"
+#include "HelpersOperationBinaryInplaceBitXor.c"
 
 #if _NUITKA_PROFILE
 #include "HelpersProfiling.c"
@@ -754,7 +754,7 @@ static long Nuitka_Coroutine_tp_traverse(PyObject *coroutine, visitproc visit, v
 }
 
 static struct Nuitka_CoroutineWrapperObject *free_list_coro_wrappers = NULL;
-static int free_list_coro_wrappers_count = 0;
+struct Nuitka_FreeListStats free_list_coro_wrappers_stats = {"coroutine_wrappers", MAX_COROUTINE_FREE_LIST_COUNT};
 
 static PyObject *Nuitka_Coroutine_await(struct Nuitka_CoroutineObject *coroutine) {
 #if _DEBUG_COROUTINE
@@ -779,9 +779,8 @@ static PyObject *Nuitka_Coroutine_await(struct Nuitka_CoroutineObject *coroutine
     return (PyObject *)result;
 }
 
-#define MAX_COROUTINE_FREE_LIST_COUNT 100
-static struct Nuitka_CoroutineObject *free_list_coros = NULL;
-static int free_list_coros_count = 0;
+static struct Nuitka_CoroutineObject *free_list_coros[FREE_LIST_SIZE_CLASS_COUNT];
+struct Nuitka_FreeListStats free_list_coros_stats = {"coroutines", MAX_COROUTINE_FREE_LIST_COUNT};
 
 static void Nuitka_Coroutine_tp_dealloc(struct Nuitka_CoroutineObject *coroutine) {
     // Revive temporarily.
@@ -820,7 +819,7 @@ static void Nuitka_Coroutine_tp_dealloc(struct Nuitka_CoroutineObject *coroutine
     Py_DECREF(coroutine->m_qualname);
 
     /* Put the object into freelist or release to GC */
-    releaseToFreeList(free_list_coros, coroutine, MAX_COROUTINE_FREE_LIST_COUNT);
+    releaseToFreeListSized(free_list_coros, coroutine, MAX_COROUTINE_FREE_LIST_COUNT);
 
     RESTORE_ERROR_OCCURRED(save_exception_type, save_exception_value, save_exception_tb);
 }
@@ -1247,7 +1246,8 @@ static int Nuitka_AIterWrapper_traverse(struct Nuitka_AIterWrapper *aw, visitpro
 }
 
 static struct Nuitka_AIterWrapper *free_list_coroutine_aiter_wrappers = NULL;
-static int free_list_coroutine_aiter_wrappers_count = 0;
+struct Nuitka_FreeListStats free_list_coroutine_aiter_wrappers_stats =
+    {"coroutine_aiter_wrappers", MAX_COROUTINE_FREE_LIST_COUNT};
 
 static void Nuitka_AIterWrapper_dealloc(struct Nuitka_AIterWrapper *aw) {
     Nuitka_GC_UnTrack((PyObject *)aw);
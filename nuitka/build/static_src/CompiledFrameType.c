@@ -137,7 +137,8 @@ static PyObject *Nuitka_Frame_getlocals(struct Nuitka_FrameObject *frame, void *
         while (*w != 0) {
             switch (*w) {
             case NUITKA_TYPE_DESCRIPTION_OBJECT:
-            case NUITKA_TYPE_DESCRIPTION_OBJECT_PTR: {
+            case NUITKA_TYPE_DESCRIPTION_OBJECT_PTR:
+            case NUITKA_TYPE_DESCRIPTION_ILONG: {
                 PyObject *value = *(PyObject **)t;
 
                 if (value != NULL) {
@@ -270,7 +271,8 @@ static void Nuitka_Frame_tp_clear(struct Nuitka_FrameObject *frame) {
         while (*w != 0) {
             switch (*w) {
             case NUITKA_TYPE_DESCRIPTION_OBJECT:
-            case NUITKA_TYPE_DESCRIPTION_OBJECT_PTR: {
+            case NUITKA_TYPE_DESCRIPTION_OBJECT_PTR:
+            case NUITKA_TYPE_DESCRIPTION_ILONG: {
                 PyObject *value = *(PyObject **)t;
                 Py_XDECREF(value);
 
@@ -309,9 +311,8 @@ static void Nuitka_Frame_tp_clear(struct Nuitka_FrameObject *frame) {
 
 void Nuitka_Frame_ReleaseLocals(struct Nuitka_FrameObject *frame) { Nuitka_Frame_tp_clear(frame); }
 
-#define MAX_FRAME_FREE_LIST_COUNT 100
-static struct Nuitka_FrameObject *free_list_frames = NULL;
-static int free_list_frames_count = 0;
+static struct Nuitka_FrameObject *free_list_frames[FREE_LIST_SIZE_CLASS_COUNT];
+struct Nuitka_FreeListStats free_list_frames_stats = {"frames", MAX_FRAME_FREE_LIST_COUNT};
 
 static void Nuitka_Frame_tp_dealloc(struct Nuitka_FrameObject *nuitka_frame) {
 #ifndef __NUITKA_NO_ASSERT__
@@ -339,7 +340,7 @@ static void Nuitka_Frame_tp_dealloc(struct Nuitka_FrameObject *nuitka_frame) {
 
     Nuitka_Frame_tp_clear(nuitka_frame);
 
-    releaseToFreeList(free_list_frames, nuitka_frame, MAX_FRAME_FREE_LIST_COUNT);
+    releaseToFreeListSized(free_list_frames, nuitka_frame, MAX_FRAME_FREE_LIST_COUNT);
 
 #ifndef __NUITKA_NO_ASSERT__
     PyThreadState *tstate = PyThreadState_GET();
@@ -694,6 +695,23 @@ void Nuitka_Frame_AttachLocals(struct Nuitka_FrameObject *frame, char const *typ
             t += sizeof(value);
             break;
         }
+        case NUITKA_TYPE_DESCRIPTION_ILONG: {
+            /* We store the object only, creating it if necessary. */
+            nuitka_ilong *value = va_arg(ap, nuitka_ilong *);
+            PyObject *object = NULL;
+
+            if (value->validity != NUITKA_ILONG_UNASSIGNED) {
+                ENFORCE_ILONG_OBJECT_VALUE(value);
+
+                object = value->ilong_object;
+                Py_INCREF(object);
+            }
+
+            memcpy(t, &object, sizeof(object));
+            t += sizeof(object);
+
+            break;
+        }
         default:
             assert(false);
         }
@@ -455,9 +455,8 @@ static PyObject *Nuitka_Function_reduce(struct Nuitka_FunctionObject *function)
     return result;
 }
 
-#define MAX_FUNCTION_FREE_LIST_COUNT 100
-static struct Nuitka_FunctionObject *free_list_functions = NULL;
-static int free_list_functions_count = 0;
+static struct Nuitka_FunctionObject *free_list_functions[FREE_LIST_SIZE_CLASS_COUNT];
+struct Nuitka_FreeListStats free_list_functions_stats = {"functions", MAX_FUNCTION_FREE_LIST_COUNT};
 
 static void Nuitka_Function_tp_dealloc(struct Nuitka_FunctionObject *function) {
 #ifndef __NUITKA_NO_ASSERT__
@@ -483,6 +482,8 @@ static void Nuitka_Function_tp_dealloc(struct Nuitka_FunctionObject *function) {
     Py_XDECREF(function->m_dict);
     Py_DECREF(function->m_defaults);
 
+    Py_XDECREF(function->m_keyword_index);
+
     Py_XDECREF(function->m_doc);
 
 #if PYTHON_VERSION >= 300
@@ -499,7 +500,7 @@ static void Nuitka_Function_tp_dealloc(struct Nuitka_FunctionObject *function) {
     }
 
     /* Put the object into freelist or release to GC */
-    releaseToFreeList(free_list_functions, function, MAX_FUNCTION_FREE_LIST_COUNT);
+    releaseToFreeListSized(free_list_functions, function, MAX_FUNCTION_FREE_LIST_COUNT);
 
 #ifndef __NUITKA_NO_ASSERT__
     PyThreadState *tstate = PyThreadState_GET();
@@ -572,6 +573,31 @@ PyTypeObject Nuitka_Function_Type = {
 
 void _initCompiledFunctionType(void) { PyType_Ready(&Nuitka_Function_Type); }
 
+// For functions with at least this many arguments, keyword arguments are
+// found through an index, otherwise by scanning the argument names.
+#define MIN_FUNCTION_KEYWORD_INDEX_COUNT 8
+
+static PyObject *makeKeywordIndex(PyObject **varnames, Py_ssize_t keywords_count) {
+    PyObject *result = _PyDict_NewPresized(keywords_count);
+
+    for (Py_ssize_t i = 0; i < keywords_count; i++) {
+#if PYTHON_VERSION < 300
+        PyObject *index = PyInt_FromSsize_t(i);
+#else
+        PyObject *index = PyLong_FromSsize_t(i);
+#endif
+        int res = PyDict_SetItem(result, varnames[i], index);
+        Py_DECREF(index);
+
+        if (unlikely(res != 0)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+    }
+
+    return result;
+}
+
 // Make a function with closure.
 #if PYTHON_VERSION < 300
 struct Nuitka_FunctionObject *Nuitka_Function_New(function_impl_code c_code, PyObject *name, PyCodeObject *code_object,
@@ -660,6 +686,17 @@ struct Nuitka_FunctionObject *Nuitka_Function_New(function_impl_code c_code, PyO
 
     result->m_varnames = &PyTuple_GET_ITEM(code_object->co_varnames, 0);
 
+    if (result->m_args_keywords_count >= MIN_FUNCTION_KEYWORD_INDEX_COUNT) {
+        result->m_keyword_index = makeKeywordIndex(result->m_varnames, result->m_args_keywords_count);
+
+        // Not having the index is only slower.
+        if (unlikely(result->m_keyword_index == NULL)) {
+            CLEAR_ERROR_OCCURRED();
+        }
+    } else {
+        result->m_keyword_index = NULL;
+    }
+
     result->m_module = module;
 
     Py_XINCREF(doc);
@@ -930,6 +967,38 @@ static void formatErrorTooFewKwOnlyArguments(struct Nuitka_FunctionObject const
 }
 #endif
 
+// Find the argument index of a keyword argument name, -1 if not found.
+static Py_ssize_t findKeywordArgIndex(struct Nuitka_FunctionObject const *function, PyObject *key) {
+    Py_ssize_t keywords_count = function->m_args_keywords_count;
+    PyObject **varnames = function->m_varnames;
+
+    if (function->m_keyword_index != NULL) {
+        PyObject *index = PyDict_GetItem(function->m_keyword_index, key);
+
+        if (index != NULL) {
+#if PYTHON_VERSION < 300
+            return PyInt_AS_LONG(index);
+#else
+            return PyLong_AsSsize_t(index);
+#endif
+        }
+    } else {
+        for (Py_ssize_t i = 0; i < keywords_count; i++) {
+            if (varnames[i] == key) {
+                return i;
+            }
+        }
+    }
+
+    for (Py_ssize_t i = 0; i < keywords_count; i++) {
+        if (RICH_COMPARE_BOOL_EQ_OBJECT_OBJECT_NORECURSE(varnames[i], key)) {
+            return i;
+        }
+    }
+
+    return -1;
+}
+
 #if PYTHON_VERSION < 300
 static Py_ssize_t handleKeywordArgs(struct Nuitka_FunctionObject const *function, PyObject **python_pars, PyObject *kw)
 #else
@@ -937,8 +1006,6 @@ static Py_ssize_t handleKeywordArgs(struct Nuitka_FunctionObject const *function
                                     Py_ssize_t *kw_only_found, PyObject *kw)
 #endif
 {
-    Py_ssize_t keywords_count = function->m_args_keywords_count;
-
 #if PYTHON_VERSION >= 300
     Py_ssize_t keyword_after_index = function->m_args_positional_count;
 #endif
@@ -960,48 +1027,12 @@ static Py_ssize_t handleKeywordArgs(struct Nuitka_FunctionObject const *function
             return -1;
         }
 
-        NUITKA_MAY_BE_UNUSED bool found = false;
-
         Py_INCREF(key);
         Py_INCREF(value);
 
-        for (Py_ssize_t i = 0; i < keywords_count; i++) {
-            if (function->m_varnames[i] == key) {
-                assert(python_pars[i] == NULL);
-                python_pars[i] = value;
-
-#if PYTHON_VERSION >= 300
-                if (i >= keyword_after_index) {
-                    *kw_only_found += 1;
-                }
-#endif
+        Py_ssize_t index = findKeywordArgIndex(function, key);
 
-                found = true;
-                break;
-            }
-        }
-
-        if (found == false) {
-            PyObject **varnames = function->m_varnames;
-
-            for (Py_ssize_t i = 0; i < keywords_count; i++) {
-                if (RICH_COMPARE_BOOL_EQ_OBJECT_OBJECT_NORECURSE(varnames[i], key)) {
-                    assert(python_pars[i] == NULL);
-                    python_pars[i] = value;
-
-#if PYTHON_VERSION >= 300
-                    if (i >= keyword_after_index) {
-                        *kw_only_found += 1;
-                    }
-#endif
-
-                    found = true;
-                    break;
-                }
-            }
-        }
-
-        if (unlikely(found == false)) {
+        if (unlikely(index == -1)) {
             PyErr_Format(PyExc_TypeError, "%s() got an unexpected keyword argument '%s'",
                          Nuitka_String_AsString(function->m_name),
                          Nuitka_String_Check(key) ? Nuitka_String_AsString(key) : "<non-string>");
@@ -1012,6 +1043,15 @@ static Py_ssize_t handleKeywordArgs(struct Nuitka_FunctionObject const *function
             return -1;
         }
 
+        assert(python_pars[index] == NULL);
+        python_pars[index] = value;
+
+#if PYTHON_VERSION >= 300
+        if (index >= keyword_after_index) {
+            *kw_only_found += 1;
+        }
+#endif
+
         Py_DECREF(key);
 
         kw_found += 1;
@@ -377,9 +377,8 @@ static long Nuitka_Method_tp_hash(struct Nuitka_MethodObject *method) {
     return method->m_function->m_counter;
 }
 
-#define MAX_METHOD_FREE_LIST_COUNT 100
 static struct Nuitka_MethodObject *free_list_methods = NULL;
-static int free_list_methods_count = 0;
+struct Nuitka_FreeListStats free_list_methods_stats = {"methods", MAX_METHOD_FREE_LIST_COUNT};
 
 static void Nuitka_Method_tp_dealloc(struct Nuitka_MethodObject *method) {
 #ifndef __NUITKA_NO_ASSERT__
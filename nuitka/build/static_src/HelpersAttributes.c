@@ -104,6 +104,10 @@ static PyObject *LOOKUP_INSTANCE(PyObject *source, PyObject *attr_name) {
 #endif
 
 PyObject *LOOKUP_ATTRIBUTE(PyObject *source, PyObject *attr_name) {
+    return LOOKUP_ATTRIBUTE_CACHED(source, attr_name, NULL);
+}
+
+PyObject *LOOKUP_ATTRIBUTE_CACHED(PyObject *source, PyObject *attr_name, Nuitka_AttributeCache *cache) {
     /* Note: There are 2 specializations of this function, that need to be
      * updated in line with this: LOOKUP_ATTRIBUTE_[DICT|CLASS]_SLOT
      */
@@ -121,7 +125,7 @@ PyObject *LOOKUP_ATTRIBUTE(PyObject *source, PyObject *attr_name) {
             }
         }
 
-        PyObject *descr = _PyType_Lookup(type, attr_name);
+        PyObject *descr = LOOKUP_TYPE_ATTRIBUTE_CACHED(type, attr_name, cache);
         descrgetfunc func = NULL;
 
         if (descr != NULL) {
@@ -333,6 +333,10 @@ PyObject *CALL_METHOD_WITH_POSARGS(PyObject *source, PyObject *attribute, PyObje
 }
 
 PyObject *CALL_METHOD_NO_ARGS(PyObject *source, PyObject *attr_name) {
+    return CALL_METHOD_NO_ARGS_CACHED(source, attr_name, NULL);
+}
+
+PyObject *CALL_METHOD_NO_ARGS_CACHED(PyObject *source, PyObject *attr_name, Nuitka_AttributeCache *cache) {
     CHECK_OBJECT(source);
     CHECK_OBJECT(attr_name);
 
@@ -346,7 +350,7 @@ PyObject *CALL_METHOD_NO_ARGS(PyObject *source, PyObject *attr_name) {
             }
         }
 
-        PyObject *descr = _PyType_Lookup(type, attr_name);
+        PyObject *descr = LOOKUP_TYPE_ATTRIBUTE_CACHED(type, attr_name, cache);
         descrgetfunc func = NULL;
 
         if (descr != NULL) {
@@ -361,6 +365,10 @@ PyObject *CALL_METHOD_NO_ARGS(PyObject *source, PyObject *attr_name) {
                     PyObject *called_object = func(descr, source, (PyObject *)type);
                     Py_DECREF(descr);
 
+                    if (unlikely(called_object == NULL)) {
+                        return NULL;
+                    }
+
                     PyObject *result = CALL_FUNCTION_NO_ARGS(called_object);
                     Py_DECREF(called_object);
                     return result;
@@ -417,13 +425,21 @@ PyObject *CALL_METHOD_NO_ARGS(PyObject *source, PyObject *attr_name) {
 
                 Py_DECREF(descr);
 
+                return result;
+            } else if (IS_METHOD_DESCRIPTOR_DIRECT_CALL(descr, source, METH_NOARGS)) {
+                PyObject *result = CALL_METHOD_DESCRIPTOR_DIRECT(descr, source, NULL);
+
+                Py_DECREF(descr);
+
                 return result;
             } else {
                 PyObject *called_object = func(descr, source, (PyObject *)type);
-                CHECK_OBJECT(called_object);
-
                 Py_DECREF(descr);
 
+                if (unlikely(called_object == NULL)) {
+                    return NULL;
+                }
+
                 PyObject *result = CALL_FUNCTION_NO_ARGS(called_object);
                 Py_DECREF(called_object);
 
@@ -0,0 +1,609 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+// This file is generated by "nuitka.tools.specialize" from the tables in
+// "nuitka/codegen/OperatorCodes.py", do not edit it manually.
+
+/* C helpers for type specialized "bytes" rich comparisons */
+
+#if PYTHON_VERSION >= 300
+
+PyObject *RICH_COMPARE_LT_BYTES_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+    assert(PyBytes_CheckExact(operand2));
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyBytes_Type.tp_richcompare(operand1, operand2, Py_LT);
+    assert(result != Py_NotImplemented);
+
+    return result;
+}
+
+PyObject *RICH_COMPARE_LT_OBJECT_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand2));
+
+    if (PyBytes_CheckExact(operand1)) {
+        return RICH_COMPARE_LT_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_LT_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_LT_BYTES_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+
+    if (PyBytes_CheckExact(operand2)) {
+        return RICH_COMPARE_LT_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_LT_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_LT_BYTES_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+    assert(PyBytes_CheckExact(operand2));
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyBytes_Type.tp_richcompare(operand1, operand2, Py_LT);
+    assert(result != Py_NotImplemented);
+
+    if (unlikely(result == NULL)) {
+        return -1;
+    }
+
+    int res = result == Py_True;
+
+    Py_DECREF(result);
+
+    return res;
+}
+
+int RICH_COMPARE_BOOL_LT_OBJECT_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand2));
+
+    if (PyBytes_CheckExact(operand1)) {
+        return RICH_COMPARE_BOOL_LT_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_LT_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_LT_BYTES_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+
+    if (PyBytes_CheckExact(operand2)) {
+        return RICH_COMPARE_BOOL_LT_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_LT_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_LTE_BYTES_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+    assert(PyBytes_CheckExact(operand2));
+
+    // Quick path for avoidable checks, compatible with CPython.
+    if (operand1 == operand2) {
+        Py_INCREF(Py_True);
+        return Py_True;
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyBytes_Type.tp_richcompare(operand1, operand2, Py_LE);
+    assert(result != Py_NotImplemented);
+
+    return result;
+}
+
+PyObject *RICH_COMPARE_LTE_OBJECT_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand2));
+
+    if (PyBytes_CheckExact(operand1)) {
+        return RICH_COMPARE_LTE_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_LTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_LTE_BYTES_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+
+    if (PyBytes_CheckExact(operand2)) {
+        return RICH_COMPARE_LTE_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_LTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_LTE_BYTES_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+    assert(PyBytes_CheckExact(operand2));
+
+    // Quick path for avoidable checks, compatible with CPython.
+    if (operand1 == operand2) {
+        return 1;
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyBytes_Type.tp_richcompare(operand1, operand2, Py_LE);
+    assert(result != Py_NotImplemented);
+
+    if (unlikely(result == NULL)) {
+        return -1;
+    }
+
+    int res = result == Py_True;
+
+    Py_DECREF(result);
+
+    return res;
+}
+
+int RICH_COMPARE_BOOL_LTE_OBJECT_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand2));
+
+    if (PyBytes_CheckExact(operand1)) {
+        return RICH_COMPARE_BOOL_LTE_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_LTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_LTE_BYTES_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+
+    if (PyBytes_CheckExact(operand2)) {
+        return RICH_COMPARE_BOOL_LTE_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_LTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_EQ_BYTES_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+    assert(PyBytes_CheckExact(operand2));
+
+    // Quick path for avoidable checks, compatible with CPython.
+    if (operand1 == operand2) {
+        Py_INCREF(Py_True);
+        return Py_True;
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyBytes_Type.tp_richcompare(operand1, operand2, Py_EQ);
+    assert(result != Py_NotImplemented);
+
+    return result;
+}
+
+PyObject *RICH_COMPARE_EQ_OBJECT_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand2));
+
+    if (PyBytes_CheckExact(operand1)) {
+        return RICH_COMPARE_EQ_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_EQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_EQ_OBJECT_BYTES_NORECURSE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand2));
+
+    if (PyBytes_CheckExact(operand1)) {
+        return RICH_COMPARE_EQ_BYTES_BYTES_NORECURSE(operand1, operand2);
+    }
+
+    return RICH_COMPARE_EQ_OBJECT_OBJECT_NORECURSE(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_EQ_BYTES_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+
+    if (PyBytes_CheckExact(operand2)) {
+        return RICH_COMPARE_EQ_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_EQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_EQ_BYTES_OBJECT_NORECURSE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+
+    if (PyBytes_CheckExact(operand2)) {
+        return RICH_COMPARE_EQ_BYTES_BYTES_NORECURSE(operand1, operand2);
+    }
+
+    return RICH_COMPARE_EQ_OBJECT_OBJECT_NORECURSE(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_EQ_BYTES_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+    assert(PyBytes_CheckExact(operand2));
+
+    // Quick path for avoidable checks, compatible with CPython.
+    if (operand1 == operand2) {
+        return 1;
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyBytes_Type.tp_richcompare(operand1, operand2, Py_EQ);
+    assert(result != Py_NotImplemented);
+
+    if (unlikely(result == NULL)) {
+        return -1;
+    }
+
+    int res = result == Py_True;
+
+    Py_DECREF(result);
+
+    return res;
+}
+
+int RICH_COMPARE_BOOL_EQ_OBJECT_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand2));
+
+    if (PyBytes_CheckExact(operand1)) {
+        return RICH_COMPARE_BOOL_EQ_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_EQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_EQ_OBJECT_BYTES_NORECURSE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand2));
+
+    if (PyBytes_CheckExact(operand1)) {
+        return RICH_COMPARE_BOOL_EQ_BYTES_BYTES_NORECURSE(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_EQ_OBJECT_OBJECT_NORECURSE(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_EQ_BYTES_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+
+    if (PyBytes_CheckExact(operand2)) {
+        return RICH_COMPARE_BOOL_EQ_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_EQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_EQ_BYTES_OBJECT_NORECURSE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+
+    if (PyBytes_CheckExact(operand2)) {
+        return RICH_COMPARE_BOOL_EQ_BYTES_BYTES_NORECURSE(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_EQ_OBJECT_OBJECT_NORECURSE(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_NOTEQ_BYTES_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+    assert(PyBytes_CheckExact(operand2));
+
+    // Quick path for avoidable checks, compatible with CPython.
+    if (operand1 == operand2) {
+        Py_INCREF(Py_False);
+        return Py_False;
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyBytes_Type.tp_richcompare(operand1, operand2, Py_NE);
+    assert(result != Py_NotImplemented);
+
+    return result;
+}
+
+PyObject *RICH_COMPARE_NOTEQ_OBJECT_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand2));
+
+    if (PyBytes_CheckExact(operand1)) {
+        return RICH_COMPARE_NOTEQ_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_NOTEQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_NOTEQ_BYTES_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+
+    if (PyBytes_CheckExact(operand2)) {
+        return RICH_COMPARE_NOTEQ_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_NOTEQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_NOTEQ_BYTES_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+    assert(PyBytes_CheckExact(operand2));
+
+    // Quick path for avoidable checks, compatible with CPython.
+    if (operand1 == operand2) {
+        return 0;
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyBytes_Type.tp_richcompare(operand1, operand2, Py_NE);
+    assert(result != Py_NotImplemented);
+
+    if (unlikely(result == NULL)) {
+        return -1;
+    }
+
+    int res = result == Py_True;
+
+    Py_DECREF(result);
+
+    return res;
+}
+
+int RICH_COMPARE_BOOL_NOTEQ_OBJECT_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand2));
+
+    if (PyBytes_CheckExact(operand1)) {
+        return RICH_COMPARE_BOOL_NOTEQ_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_NOTEQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_NOTEQ_BYTES_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+
+    if (PyBytes_CheckExact(operand2)) {
+        return RICH_COMPARE_BOOL_NOTEQ_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_NOTEQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_GT_BYTES_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+    assert(PyBytes_CheckExact(operand2));
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyBytes_Type.tp_richcompare(operand1, operand2, Py_GT);
+    assert(result != Py_NotImplemented);
+
+    return result;
+}
+
+PyObject *RICH_COMPARE_GT_OBJECT_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand2));
+
+    if (PyBytes_CheckExact(operand1)) {
+        return RICH_COMPARE_GT_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_GT_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_GT_BYTES_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+
+    if (PyBytes_CheckExact(operand2)) {
+        return RICH_COMPARE_GT_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_GT_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_GT_BYTES_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+    assert(PyBytes_CheckExact(operand2));
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyBytes_Type.tp_richcompare(operand1, operand2, Py_GT);
+    assert(result != Py_NotImplemented);
+
+    if (unlikely(result == NULL)) {
+        return -1;
+    }
+
+    int res = result == Py_True;
+
+    Py_DECREF(result);
+
+    return res;
+}
+
+int RICH_COMPARE_BOOL_GT_OBJECT_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand2));
+
+    if (PyBytes_CheckExact(operand1)) {
+        return RICH_COMPARE_BOOL_GT_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_GT_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_GT_BYTES_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+
+    if (PyBytes_CheckExact(operand2)) {
+        return RICH_COMPARE_BOOL_GT_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_GT_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_GTE_BYTES_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+    assert(PyBytes_CheckExact(operand2));
+
+    // Quick path for avoidable checks, compatible with CPython.
+    if (operand1 == operand2) {
+        Py_INCREF(Py_True);
+        return Py_True;
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyBytes_Type.tp_richcompare(operand1, operand2, Py_GE);
+    assert(result != Py_NotImplemented);
+
+    return result;
+}
+
+PyObject *RICH_COMPARE_GTE_OBJECT_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand2));
+
+    if (PyBytes_CheckExact(operand1)) {
+        return RICH_COMPARE_GTE_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_GTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_GTE_BYTES_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+
+    if (PyBytes_CheckExact(operand2)) {
+        return RICH_COMPARE_GTE_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_GTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_GTE_BYTES_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+    assert(PyBytes_CheckExact(operand2));
+
+    // Quick path for avoidable checks, compatible with CPython.
+    if (operand1 == operand2) {
+        return 1;
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyBytes_Type.tp_richcompare(operand1, operand2, Py_GE);
+    assert(result != Py_NotImplemented);
+
+    if (unlikely(result == NULL)) {
+        return -1;
+    }
+
+    int res = result == Py_True;
+
+    Py_DECREF(result);
+
+    return res;
+}
+
+int RICH_COMPARE_BOOL_GTE_OBJECT_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand2));
+
+    if (PyBytes_CheckExact(operand1)) {
+        return RICH_COMPARE_BOOL_GTE_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_GTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_GTE_BYTES_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand1));
+
+    if (PyBytes_CheckExact(operand2)) {
+        return RICH_COMPARE_BOOL_GTE_BYTES_BYTES(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_GTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+#endif
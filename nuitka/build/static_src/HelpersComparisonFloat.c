@@ -0,0 +1,517 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+// This file is generated by "nuitka.tools.specialize" from the tables in
+// "nuitka/codegen/OperatorCodes.py", do not edit it manually.
+
+/* C helpers for type specialized "float" rich comparisons */
+
+#if PYTHON_VERSION >= 300
+
+PyObject *RICH_COMPARE_LT_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+    assert(PyFloat_CheckExact(operand2));
+
+    const double a = PyFloat_AS_DOUBLE(operand1);
+    const double b = PyFloat_AS_DOUBLE(operand2);
+
+    PyObject *result = BOOL_FROM(a < b);
+    Py_INCREF(result);
+    return result;
+}
+
+PyObject *RICH_COMPARE_LT_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return RICH_COMPARE_LT_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_LT_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_LT_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+
+    if (PyFloat_CheckExact(operand2)) {
+        return RICH_COMPARE_LT_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_LT_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_LT_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+    assert(PyFloat_CheckExact(operand2));
+
+    const double a = PyFloat_AS_DOUBLE(operand1);
+    const double b = PyFloat_AS_DOUBLE(operand2);
+
+    return a < b;
+}
+
+int RICH_COMPARE_BOOL_LT_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return RICH_COMPARE_BOOL_LT_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_LT_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_LT_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+
+    if (PyFloat_CheckExact(operand2)) {
+        return RICH_COMPARE_BOOL_LT_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_LT_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_LTE_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+    assert(PyFloat_CheckExact(operand2));
+
+    const double a = PyFloat_AS_DOUBLE(operand1);
+    const double b = PyFloat_AS_DOUBLE(operand2);
+
+    PyObject *result = BOOL_FROM(a <= b);
+    Py_INCREF(result);
+    return result;
+}
+
+PyObject *RICH_COMPARE_LTE_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return RICH_COMPARE_LTE_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_LTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_LTE_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+
+    if (PyFloat_CheckExact(operand2)) {
+        return RICH_COMPARE_LTE_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_LTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_LTE_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+    assert(PyFloat_CheckExact(operand2));
+
+    const double a = PyFloat_AS_DOUBLE(operand1);
+    const double b = PyFloat_AS_DOUBLE(operand2);
+
+    return a <= b;
+}
+
+int RICH_COMPARE_BOOL_LTE_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return RICH_COMPARE_BOOL_LTE_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_LTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_LTE_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+
+    if (PyFloat_CheckExact(operand2)) {
+        return RICH_COMPARE_BOOL_LTE_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_LTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_EQ_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+    assert(PyFloat_CheckExact(operand2));
+
+    const double a = PyFloat_AS_DOUBLE(operand1);
+    const double b = PyFloat_AS_DOUBLE(operand2);
+
+    PyObject *result = BOOL_FROM(a == b);
+    Py_INCREF(result);
+    return result;
+}
+
+PyObject *RICH_COMPARE_EQ_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return RICH_COMPARE_EQ_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_EQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_EQ_OBJECT_FLOAT_NORECURSE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return RICH_COMPARE_EQ_FLOAT_FLOAT_NORECURSE(operand1, operand2);
+    }
+
+    return RICH_COMPARE_EQ_OBJECT_OBJECT_NORECURSE(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_EQ_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+
+    if (PyFloat_CheckExact(operand2)) {
+        return RICH_COMPARE_EQ_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_EQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_EQ_FLOAT_OBJECT_NORECURSE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+
+    if (PyFloat_CheckExact(operand2)) {
+        return RICH_COMPARE_EQ_FLOAT_FLOAT_NORECURSE(operand1, operand2);
+    }
+
+    return RICH_COMPARE_EQ_OBJECT_OBJECT_NORECURSE(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_EQ_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+    assert(PyFloat_CheckExact(operand2));
+
+    const double a = PyFloat_AS_DOUBLE(operand1);
+    const double b = PyFloat_AS_DOUBLE(operand2);
+
+    return a == b;
+}
+
+int RICH_COMPARE_BOOL_EQ_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return RICH_COMPARE_BOOL_EQ_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_EQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_EQ_OBJECT_FLOAT_NORECURSE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return RICH_COMPARE_BOOL_EQ_FLOAT_FLOAT_NORECURSE(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_EQ_OBJECT_OBJECT_NORECURSE(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_EQ_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+
+    if (PyFloat_CheckExact(operand2)) {
+        return RICH_COMPARE_BOOL_EQ_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_EQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_EQ_FLOAT_OBJECT_NORECURSE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+
+    if (PyFloat_CheckExact(operand2)) {
+        return RICH_COMPARE_BOOL_EQ_FLOAT_FLOAT_NORECURSE(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_EQ_OBJECT_OBJECT_NORECURSE(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_NOTEQ_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+    assert(PyFloat_CheckExact(operand2));
+
+    const double a = PyFloat_AS_DOUBLE(operand1);
+    const double b = PyFloat_AS_DOUBLE(operand2);
+
+    PyObject *result = BOOL_FROM(a != b);
+    Py_INCREF(result);
+    return result;
+}
+
+PyObject *RICH_COMPARE_NOTEQ_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return RICH_COMPARE_NOTEQ_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_NOTEQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_NOTEQ_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+
+    if (PyFloat_CheckExact(operand2)) {
+        return RICH_COMPARE_NOTEQ_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_NOTEQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_NOTEQ_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+    assert(PyFloat_CheckExact(operand2));
+
+    const double a = PyFloat_AS_DOUBLE(operand1);
+    const double b = PyFloat_AS_DOUBLE(operand2);
+
+    return a != b;
+}
+
+int RICH_COMPARE_BOOL_NOTEQ_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return RICH_COMPARE_BOOL_NOTEQ_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_NOTEQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_NOTEQ_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+
+    if (PyFloat_CheckExact(operand2)) {
+        return RICH_COMPARE_BOOL_NOTEQ_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_NOTEQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_GT_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+    assert(PyFloat_CheckExact(operand2));
+
+    const double a = PyFloat_AS_DOUBLE(operand1);
+    const double b = PyFloat_AS_DOUBLE(operand2);
+
+    PyObject *result = BOOL_FROM(a > b);
+    Py_INCREF(result);
+    return result;
+}
+
+PyObject *RICH_COMPARE_GT_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return RICH_COMPARE_GT_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_GT_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_GT_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+
+    if (PyFloat_CheckExact(operand2)) {
+        return RICH_COMPARE_GT_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_GT_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_GT_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+    assert(PyFloat_CheckExact(operand2));
+
+    const double a = PyFloat_AS_DOUBLE(operand1);
+    const double b = PyFloat_AS_DOUBLE(operand2);
+
+    return a > b;
+}
+
+int RICH_COMPARE_BOOL_GT_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return RICH_COMPARE_BOOL_GT_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_GT_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_GT_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+
+    if (PyFloat_CheckExact(operand2)) {
+        return RICH_COMPARE_BOOL_GT_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_GT_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_GTE_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+    assert(PyFloat_CheckExact(operand2));
+
+    const double a = PyFloat_AS_DOUBLE(operand1);
+    const double b = PyFloat_AS_DOUBLE(operand2);
+
+    PyObject *result = BOOL_FROM(a >= b);
+    Py_INCREF(result);
+    return result;
+}
+
+PyObject *RICH_COMPARE_GTE_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return RICH_COMPARE_GTE_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_GTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_GTE_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+
+    if (PyFloat_CheckExact(operand2)) {
+        return RICH_COMPARE_GTE_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_GTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_GTE_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+    assert(PyFloat_CheckExact(operand2));
+
+    const double a = PyFloat_AS_DOUBLE(operand1);
+    const double b = PyFloat_AS_DOUBLE(operand2);
+
+    return a >= b;
+}
+
+int RICH_COMPARE_BOOL_GTE_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return RICH_COMPARE_BOOL_GTE_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_GTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_GTE_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+
+    if (PyFloat_CheckExact(operand2)) {
+        return RICH_COMPARE_BOOL_GTE_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_GTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+#endif
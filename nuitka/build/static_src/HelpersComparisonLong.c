@@ -0,0 +1,721 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+// This file is generated by "nuitka.tools.specialize" from the tables in
+// "nuitka/codegen/OperatorCodes.py", do not edit it manually.
+
+/* C helpers for type specialized "long" rich comparisons */
+
+#if PYTHON_VERSION >= 300
+
+PyObject *RICH_COMPARE_LT_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+    assert(PyLong_CheckExact(operand2));
+
+    const Py_ssize_t size1 = Py_SIZE(operand1);
+    const Py_ssize_t size2 = Py_SIZE(operand2);
+
+    // Values of at most one digit are the normal case, and can be compared
+    // as C values.
+    if (likely(size1 >= -1 && size1 <= 1 && size2 >= -1 && size2 <= 1)) {
+        const long a = size1 == 0 ? 0 : size1 * (long)((PyLongObject *)operand1)->ob_digit[0];
+        const long b = size2 == 0 ? 0 : size2 * (long)((PyLongObject *)operand2)->ob_digit[0];
+
+        PyObject *result = BOOL_FROM(a < b);
+        Py_INCREF(result);
+        return result;
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyLong_Type.tp_richcompare(operand1, operand2, Py_LT);
+    assert(result != Py_NotImplemented);
+
+    return result;
+}
+
+PyObject *RICH_COMPARE_LT_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return RICH_COMPARE_LT_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_LT_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_LT_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+
+    if (PyLong_CheckExact(operand2)) {
+        return RICH_COMPARE_LT_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_LT_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_LT_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+    assert(PyLong_CheckExact(operand2));
+
+    const Py_ssize_t size1 = Py_SIZE(operand1);
+    const Py_ssize_t size2 = Py_SIZE(operand2);
+
+    // Values of at most one digit are the normal case, and can be compared
+    // as C values.
+    if (likely(size1 >= -1 && size1 <= 1 && size2 >= -1 && size2 <= 1)) {
+        const long a = size1 == 0 ? 0 : size1 * (long)((PyLongObject *)operand1)->ob_digit[0];
+        const long b = size2 == 0 ? 0 : size2 * (long)((PyLongObject *)operand2)->ob_digit[0];
+
+        return a < b;
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyLong_Type.tp_richcompare(operand1, operand2, Py_LT);
+    assert(result != Py_NotImplemented);
+
+    if (unlikely(result == NULL)) {
+        return -1;
+    }
+
+    int res = result == Py_True;
+
+    Py_DECREF(result);
+
+    return res;
+}
+
+int RICH_COMPARE_BOOL_LT_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return RICH_COMPARE_BOOL_LT_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_LT_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_LT_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+
+    if (PyLong_CheckExact(operand2)) {
+        return RICH_COMPARE_BOOL_LT_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_LT_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_LTE_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+    assert(PyLong_CheckExact(operand2));
+
+    const Py_ssize_t size1 = Py_SIZE(operand1);
+    const Py_ssize_t size2 = Py_SIZE(operand2);
+
+    // Values of at most one digit are the normal case, and can be compared
+    // as C values.
+    if (likely(size1 >= -1 && size1 <= 1 && size2 >= -1 && size2 <= 1)) {
+        const long a = size1 == 0 ? 0 : size1 * (long)((PyLongObject *)operand1)->ob_digit[0];
+        const long b = size2 == 0 ? 0 : size2 * (long)((PyLongObject *)operand2)->ob_digit[0];
+
+        PyObject *result = BOOL_FROM(a <= b);
+        Py_INCREF(result);
+        return result;
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyLong_Type.tp_richcompare(operand1, operand2, Py_LE);
+    assert(result != Py_NotImplemented);
+
+    return result;
+}
+
+PyObject *RICH_COMPARE_LTE_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return RICH_COMPARE_LTE_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_LTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_LTE_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+
+    if (PyLong_CheckExact(operand2)) {
+        return RICH_COMPARE_LTE_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_LTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_LTE_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+    assert(PyLong_CheckExact(operand2));
+
+    const Py_ssize_t size1 = Py_SIZE(operand1);
+    const Py_ssize_t size2 = Py_SIZE(operand2);
+
+    // Values of at most one digit are the normal case, and can be compared
+    // as C values.
+    if (likely(size1 >= -1 && size1 <= 1 && size2 >= -1 && size2 <= 1)) {
+        const long a = size1 == 0 ? 0 : size1 * (long)((PyLongObject *)operand1)->ob_digit[0];
+        const long b = size2 == 0 ? 0 : size2 * (long)((PyLongObject *)operand2)->ob_digit[0];
+
+        return a <= b;
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyLong_Type.tp_richcompare(operand1, operand2, Py_LE);
+    assert(result != Py_NotImplemented);
+
+    if (unlikely(result == NULL)) {
+        return -1;
+    }
+
+    int res = result == Py_True;
+
+    Py_DECREF(result);
+
+    return res;
+}
+
+int RICH_COMPARE_BOOL_LTE_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return RICH_COMPARE_BOOL_LTE_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_LTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_LTE_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+
+    if (PyLong_CheckExact(operand2)) {
+        return RICH_COMPARE_BOOL_LTE_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_LTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_EQ_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+    assert(PyLong_CheckExact(operand2));
+
+    const Py_ssize_t size1 = Py_SIZE(operand1);
+    const Py_ssize_t size2 = Py_SIZE(operand2);
+
+    // Values of at most one digit are the normal case, and can be compared
+    // as C values.
+    if (likely(size1 >= -1 && size1 <= 1 && size2 >= -1 && size2 <= 1)) {
+        const long a = size1 == 0 ? 0 : size1 * (long)((PyLongObject *)operand1)->ob_digit[0];
+        const long b = size2 == 0 ? 0 : size2 * (long)((PyLongObject *)operand2)->ob_digit[0];
+
+        PyObject *result = BOOL_FROM(a == b);
+        Py_INCREF(result);
+        return result;
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyLong_Type.tp_richcompare(operand1, operand2, Py_EQ);
+    assert(result != Py_NotImplemented);
+
+    return result;
+}
+
+PyObject *RICH_COMPARE_EQ_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return RICH_COMPARE_EQ_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_EQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_EQ_OBJECT_LONG_NORECURSE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return RICH_COMPARE_EQ_LONG_LONG_NORECURSE(operand1, operand2);
+    }
+
+    return RICH_COMPARE_EQ_OBJECT_OBJECT_NORECURSE(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_EQ_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+
+    if (PyLong_CheckExact(operand2)) {
+        return RICH_COMPARE_EQ_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_EQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_EQ_LONG_OBJECT_NORECURSE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+
+    if (PyLong_CheckExact(operand2)) {
+        return RICH_COMPARE_EQ_LONG_LONG_NORECURSE(operand1, operand2);
+    }
+
+    return RICH_COMPARE_EQ_OBJECT_OBJECT_NORECURSE(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_EQ_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+    assert(PyLong_CheckExact(operand2));
+
+    const Py_ssize_t size1 = Py_SIZE(operand1);
+    const Py_ssize_t size2 = Py_SIZE(operand2);
+
+    // Values of at most one digit are the normal case, and can be compared
+    // as C values.
+    if (likely(size1 >= -1 && size1 <= 1 && size2 >= -1 && size2 <= 1)) {
+        const long a = size1 == 0 ? 0 : size1 * (long)((PyLongObject *)operand1)->ob_digit[0];
+        const long b = size2 == 0 ? 0 : size2 * (long)((PyLongObject *)operand2)->ob_digit[0];
+
+        return a == b;
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyLong_Type.tp_richcompare(operand1, operand2, Py_EQ);
+    assert(result != Py_NotImplemented);
+
+    if (unlikely(result == NULL)) {
+        return -1;
+    }
+
+    int res = result == Py_True;
+
+    Py_DECREF(result);
+
+    return res;
+}
+
+int RICH_COMPARE_BOOL_EQ_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return RICH_COMPARE_BOOL_EQ_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_EQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_EQ_OBJECT_LONG_NORECURSE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return RICH_COMPARE_BOOL_EQ_LONG_LONG_NORECURSE(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_EQ_OBJECT_OBJECT_NORECURSE(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_EQ_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+
+    if (PyLong_CheckExact(operand2)) {
+        return RICH_COMPARE_BOOL_EQ_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_EQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_EQ_LONG_OBJECT_NORECURSE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+
+    if (PyLong_CheckExact(operand2)) {
+        return RICH_COMPARE_BOOL_EQ_LONG_LONG_NORECURSE(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_EQ_OBJECT_OBJECT_NORECURSE(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_NOTEQ_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+    assert(PyLong_CheckExact(operand2));
+
+    const Py_ssize_t size1 = Py_SIZE(operand1);
+    const Py_ssize_t size2 = Py_SIZE(operand2);
+
+    // Values of at most one digit are the normal case, and can be compared
+    // as C values.
+    if (likely(size1 >= -1 && size1 <= 1 && size2 >= -1 && size2 <= 1)) {
+        const long a = size1 == 0 ? 0 : size1 * (long)((PyLongObject *)operand1)->ob_digit[0];
+        const long b = size2 == 0 ? 0 : size2 * (long)((PyLongObject *)operand2)->ob_digit[0];
+
+        PyObject *result = BOOL_FROM(a != b);
+        Py_INCREF(result);
+        return result;
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyLong_Type.tp_richcompare(operand1, operand2, Py_NE);
+    assert(result != Py_NotImplemented);
+
+    return result;
+}
+
+PyObject *RICH_COMPARE_NOTEQ_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return RICH_COMPARE_NOTEQ_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_NOTEQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_NOTEQ_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+
+    if (PyLong_CheckExact(operand2)) {
+        return RICH_COMPARE_NOTEQ_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_NOTEQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_NOTEQ_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+    assert(PyLong_CheckExact(operand2));
+
+    const Py_ssize_t size1 = Py_SIZE(operand1);
+    const Py_ssize_t size2 = Py_SIZE(operand2);
+
+    // Values of at most one digit are the normal case, and can be compared
+    // as C values.
+    if (likely(size1 >= -1 && size1 <= 1 && size2 >= -1 && size2 <= 1)) {
+        const long a = size1 == 0 ? 0 : size1 * (long)((PyLongObject *)operand1)->ob_digit[0];
+        const long b = size2 == 0 ? 0 : size2 * (long)((PyLongObject *)operand2)->ob_digit[0];
+
+        return a != b;
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyLong_Type.tp_richcompare(operand1, operand2, Py_NE);
+    assert(result != Py_NotImplemented);
+
+    if (unlikely(result == NULL)) {
+        return -1;
+    }
+
+    int res = result == Py_True;
+
+    Py_DECREF(result);
+
+    return res;
+}
+
+int RICH_COMPARE_BOOL_NOTEQ_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return RICH_COMPARE_BOOL_NOTEQ_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_NOTEQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_NOTEQ_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+
+    if (PyLong_CheckExact(operand2)) {
+        return RICH_COMPARE_BOOL_NOTEQ_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_NOTEQ_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_GT_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+    assert(PyLong_CheckExact(operand2));
+
+    const Py_ssize_t size1 = Py_SIZE(operand1);
+    const Py_ssize_t size2 = Py_SIZE(operand2);
+
+    // Values of at most one digit are the normal case, and can be compared
+    // as C values.
+    if (likely(size1 >= -1 && size1 <= 1 && size2 >= -1 && size2 <= 1)) {
+        const long a = size1 == 0 ? 0 : size1 * (long)((PyLongObject *)operand1)->ob_digit[0];
+        const long b = size2 == 0 ? 0 : size2 * (long)((PyLongObject *)operand2)->ob_digit[0];
+
+        PyObject *result = BOOL_FROM(a > b);
+        Py_INCREF(result);
+        return result;
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyLong_Type.tp_richcompare(operand1, operand2, Py_GT);
+    assert(result != Py_NotImplemented);
+
+    return result;
+}
+
+PyObject *RICH_COMPARE_GT_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return RICH_COMPARE_GT_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_GT_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_GT_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+
+    if (PyLong_CheckExact(operand2)) {
+        return RICH_COMPARE_GT_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_GT_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_GT_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+    assert(PyLong_CheckExact(operand2));
+
+    const Py_ssize_t size1 = Py_SIZE(operand1);
+    const Py_ssize_t size2 = Py_SIZE(operand2);
+
+    // Values of at most one digit are the normal case, and can be compared
+    // as C values.
+    if (likely(size1 >= -1 && size1 <= 1 && size2 >= -1 && size2 <= 1)) {
+        const long a = size1 == 0 ? 0 : size1 * (long)((PyLongObject *)operand1)->ob_digit[0];
+        const long b = size2 == 0 ? 0 : size2 * (long)((PyLongObject *)operand2)->ob_digit[0];
+
+        return a > b;
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyLong_Type.tp_richcompare(operand1, operand2, Py_GT);
+    assert(result != Py_NotImplemented);
+
+    if (unlikely(result == NULL)) {
+        return -1;
+    }
+
+    int res = result == Py_True;
+
+    Py_DECREF(result);
+
+    return res;
+}
+
+int RICH_COMPARE_BOOL_GT_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return RICH_COMPARE_BOOL_GT_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_GT_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_GT_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+
+    if (PyLong_CheckExact(operand2)) {
+        return RICH_COMPARE_BOOL_GT_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_GT_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_GTE_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+    assert(PyLong_CheckExact(operand2));
+
+    const Py_ssize_t size1 = Py_SIZE(operand1);
+    const Py_ssize_t size2 = Py_SIZE(operand2);
+
+    // Values of at most one digit are the normal case, and can be compared
+    // as C values.
+    if (likely(size1 >= -1 && size1 <= 1 && size2 >= -1 && size2 <= 1)) {
+        const long a = size1 == 0 ? 0 : size1 * (long)((PyLongObject *)operand1)->ob_digit[0];
+        const long b = size2 == 0 ? 0 : size2 * (long)((PyLongObject *)operand2)->ob_digit[0];
+
+        PyObject *result = BOOL_FROM(a >= b);
+        Py_INCREF(result);
+        return result;
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyLong_Type.tp_richcompare(operand1, operand2, Py_GE);
+    assert(result != Py_NotImplemented);
+
+    return result;
+}
+
+PyObject *RICH_COMPARE_GTE_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return RICH_COMPARE_GTE_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_GTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+PyObject *RICH_COMPARE_GTE_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+
+    if (PyLong_CheckExact(operand2)) {
+        return RICH_COMPARE_GTE_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_GTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_GTE_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+    assert(PyLong_CheckExact(operand2));
+
+    const Py_ssize_t size1 = Py_SIZE(operand1);
+    const Py_ssize_t size2 = Py_SIZE(operand2);
+
+    // Values of at most one digit are the normal case, and can be compared
+    // as C values.
+    if (likely(size1 >= -1 && size1 <= 1 && size2 >= -1 && size2 <= 1)) {
+        const long a = size1 == 0 ? 0 : size1 * (long)((PyLongObject *)operand1)->ob_digit[0];
+        const long b = size2 == 0 ? 0 : size2 * (long)((PyLongObject *)operand2)->ob_digit[0];
+
+        return a >= b;
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyLong_Type.tp_richcompare(operand1, operand2, Py_GE);
+    assert(result != Py_NotImplemented);
+
+    if (unlikely(result == NULL)) {
+        return -1;
+    }
+
+    int res = result == Py_True;
+
+    Py_DECREF(result);
+
+    return res;
+}
+
+int RICH_COMPARE_BOOL_GTE_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return RICH_COMPARE_BOOL_GTE_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_GTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+int RICH_COMPARE_BOOL_GTE_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+
+    if (PyLong_CheckExact(operand2)) {
+        return RICH_COMPARE_BOOL_GTE_LONG_LONG(operand1, operand2);
+    }
+
+    return RICH_COMPARE_BOOL_GTE_OBJECT_OBJECT(operand1, operand2);
+}
+
+#endif
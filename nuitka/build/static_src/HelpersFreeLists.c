@@ -0,0 +1,108 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+/** For sizing the free lists of compiled objects.
+ *
+ * These report how the free lists were used at run time.
+ *
+ **/
+
+#include "nuitka/freelists.h"
+
+extern struct Nuitka_FreeListStats free_list_cells_stats;
+extern struct Nuitka_FreeListStats free_list_functions_stats;
+extern struct Nuitka_FreeListStats free_list_methods_stats;
+extern struct Nuitka_FreeListStats free_list_generators_stats;
+#if PYTHON_VERSION >= 350
+extern struct Nuitka_FreeListStats free_list_coros_stats;
+extern struct Nuitka_FreeListStats free_list_coro_wrappers_stats;
+extern struct Nuitka_FreeListStats free_list_coroutine_aiter_wrappers_stats;
+#endif
+#if PYTHON_VERSION >= 360
+extern struct Nuitka_FreeListStats free_list_asyncgens_stats;
+extern struct Nuitka_FreeListStats free_list_asyncgen_value_wrappers_stats;
+extern struct Nuitka_FreeListStats free_list_asyncgen_asends_stats;
+extern struct Nuitka_FreeListStats free_list_asyncgen_athrows_stats;
+#endif
+extern struct Nuitka_FreeListStats free_list_frames_stats;
+extern struct Nuitka_FreeListStats free_list_tracebacks_stats;
+
+static struct Nuitka_FreeListStats *free_lists_stats[] = {&free_list_cells_stats,
+                                                          &free_list_functions_stats,
+                                                          &free_list_methods_stats,
+                                                          &free_list_generators_stats,
+#if PYTHON_VERSION >= 350
+                                                          &free_list_coros_stats,
+                                                          &free_list_coro_wrappers_stats,
+                                                          &free_list_coroutine_aiter_wrappers_stats,
+#endif
+#if PYTHON_VERSION >= 360
+                                                          &free_list_asyncgens_stats,
+                                                          &free_list_asyncgen_value_wrappers_stats,
+                                                          &free_list_asyncgen_asends_stats,
+                                                          &free_list_asyncgen_athrows_stats,
+#endif
+                                                          &free_list_frames_stats,
+                                                          &free_list_tracebacks_stats,
+                                                          NULL};
+
+static bool _addFreeListStatsValue(PyObject *dict, char const *name, Py_ssize_t value) {
+    PyObject *value_object = PyInt_FromSsize_t(value);
+
+    if (unlikely(value_object == NULL)) {
+        return false;
+    }
+
+    int res = PyDict_SetItemString(dict, name, value_object);
+    Py_DECREF(value_object);
+
+    return res == 0;
+}
+
+PyObject *Nuitka_GetFreeListStats(void) {
+    PyObject *result = PyDict_New();
+
+    if (unlikely(result == NULL)) {
+        return NULL;
+    }
+
+    for (struct Nuitka_FreeListStats **current = free_lists_stats; *current != NULL; current++) {
+        struct Nuitka_FreeListStats *stats = *current;
+
+        PyObject *stats_dict = PyDict_New();
+
+        if (unlikely(stats_dict == NULL)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+
+        if (!_addFreeListStatsValue(stats_dict, "max_count", stats->max_count) ||
+            !_addFreeListStatsValue(stats_dict, "count", stats->count) ||
+            !_addFreeListStatsValue(stats_dict, "hits", stats->hits) ||
+            !_addFreeListStatsValue(stats_dict, "misses", stats->misses) ||
+            !_addFreeListStatsValue(stats_dict, "drops", stats->drops) ||
+            PyDict_SetItemString(result, stats->name, stats_dict) != 0) {
+            Py_DECREF(stats_dict);
+            Py_DECREF(result);
+            return NULL;
+        }
+
+        Py_DECREF(stats_dict);
+    }
+
+    return result;
+}
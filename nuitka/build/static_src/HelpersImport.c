@@ -143,6 +143,179 @@ PyObject *IMPORT_MODULE5(PyObject *module_name, PyObject *globals, PyObject *loc
     return import_result;
 }
 
+extern PyObject *const_str_plain___path__;
+
+#if PYTHON_VERSION >= 340
+extern PyObject *const_str_plain___spec__;
+extern PyObject *const_str_plain__initializing;
+#endif
+
+// Check if a module is still being imported, then it must not be cached, as
+// the import of it would wait for that to complete in another thread.
+static bool isModuleInitializing(PyObject *module) {
+#if PYTHON_VERSION < 300
+    // Modules are only initialized while holding the import lock.
+    static PyObject *lock_held_function = NULL;
+
+    if (lock_held_function == NULL) {
+        PyObject *imp_module = PyImport_ImportModule("imp");
+
+        if (unlikely(imp_module == NULL)) {
+            CLEAR_ERROR_OCCURRED();
+            return true;
+        }
+
+        lock_held_function = PyObject_GetAttrString(imp_module, "lock_held");
+        Py_DECREF(imp_module);
+
+        if (unlikely(lock_held_function == NULL)) {
+            CLEAR_ERROR_OCCURRED();
+            return true;
+        }
+    }
+
+    PyObject *value = CALL_FUNCTION_NO_ARGS(lock_held_function);
+#elif PYTHON_VERSION < 340
+    PyObject *value = PyObject_GetAttrString(module, "__initializing__");
+#else
+    PyObject *spec_value = PyObject_GetAttr(module, const_str_plain___spec__);
+
+    if (spec_value == NULL) {
+        CLEAR_ERROR_OCCURRED();
+        return false;
+    }
+
+    PyObject *value = PyObject_GetAttr(spec_value, const_str_plain__initializing);
+    Py_DECREF(spec_value);
+#endif
+
+    if (value == NULL) {
+        CLEAR_ERROR_OCCURRED();
+        return false;
+    }
+
+    int res = PyObject_IsTrue(value);
+    Py_DECREF(value);
+
+    if (unlikely(res == -1)) {
+        CLEAR_ERROR_OCCURRED();
+        return true;
+    }
+
+    return res == 1;
+}
+
+static bool hasImportItems(PyObject *module, PyObject *import_items) {
+    Py_ssize_t size = PyTuple_GET_SIZE(import_items);
+
+    for (Py_ssize_t i = 0; i < size; i++) {
+        int res = PyObject_HasAttr(module, PyTuple_GET_ITEM(import_items, i));
+
+        if (res != 1) {
+            return false;
+        }
+    }
+
+    return true;
+}
+
+static void clearImportCache(Nuitka_ImportCache *cache) {
+    Py_CLEAR(cache->import_function);
+    Py_CLEAR(cache->module);
+    Py_CLEAR(cache->result);
+    Py_CLEAR(cache->result_name);
+}
+
+PyObject *IMPORT_MODULE_CACHED(PyObject *full_name, PyObject *module_name, PyObject *globals, PyObject *locals,
+                               PyObject *import_items, PyObject *level, Nuitka_ImportCache *cache) {
+    CHECK_OBJECT(full_name);
+
+    NUITKA_ASSIGN_BUILTIN(__import__);
+
+    PyObject *import_function = NUITKA_ACCESS_BUILTIN(__import__);
+
+    // The cache holds references, so none of the compared objects can be
+    // released and replaced by another one at the same address.
+    if (likely(cache->module != NULL && cache->import_function == import_function)) {
+        PyObject *modules_dict = PyImport_GetModuleDict();
+
+        if (likely(PyDict_GetItem(modules_dict, full_name) == cache->module &&
+                   (cache->result_name == NULL || PyDict_GetItem(modules_dict, cache->result_name) == cache->result))) {
+            PyObject *result = cache->result;
+            Py_INCREF(result);
+
+            // With an import list, the result is the module, and checking it
+            // may run code of the module, that could clear the cache.
+            if (likely(cache->check_import_items == false || hasImportItems(result, import_items))) {
+                return result;
+            }
+
+            Py_DECREF(result);
+        }
+    }
+
+    PyObject *import_result;
+
+    if (level != NULL) {
+        import_result = IMPORT_MODULE5(module_name, globals, locals, import_items, level);
+    } else {
+        import_result = IMPORT_MODULE4(module_name, globals, locals, import_items);
+    }
+
+    clearImportCache(cache);
+
+    if (unlikely(import_result == NULL)) {
+        return NULL;
+    }
+
+    // Only the built-in "__import__" is known to give the same result again.
+    if (!PyCFunction_Check(import_function) ||
+        strcmp(((PyCFunctionObject *)import_function)->m_ml->ml_name, "__import__") != 0) {
+        return import_result;
+    }
+
+    PyObject *module = PyDict_GetItem(PyImport_GetModuleDict(), full_name);
+
+    if (module == NULL || isModuleInitializing(module)) {
+        return import_result;
+    }
+
+    // For "import a.b" the top level package is the result.
+    PyObject *result_name = NULL;
+
+    if (import_result != module) {
+        if (import_items != Py_None) {
+            return import_result;
+        }
+
+        result_name = LOOKUP_ATTRIBUTE(import_result, const_str_plain___name__);
+
+        if (result_name == NULL) {
+            CLEAR_ERROR_OCCURRED();
+            return import_result;
+        }
+
+        if (PyDict_GetItem(PyImport_GetModuleDict(), result_name) != import_result) {
+            Py_DECREF(result_name);
+            return import_result;
+        }
+    }
+
+    Py_INCREF(import_function);
+    cache->import_function = import_function;
+    Py_INCREF(module);
+    cache->module = module;
+    Py_INCREF(import_result);
+    cache->result = import_result;
+    cache->result_name = result_name;
+
+    // Packages import the names from the import list as sub-modules, unless
+    // they are present already.
+    cache->check_import_items = import_items != Py_None && PyObject_HasAttr(module, const_str_plain___path__) == 1;
+
+    return import_result;
+}
+
 extern PyObject *const_str_plain___all__;
 
 bool IMPORT_MODULE_STAR(PyObject *target, bool is_module, PyObject *module) {
@@ -0,0 +1,153 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+// This file is generated by "nuitka.tools.specialize" from the tables in
+// "nuitka/codegen/OperatorCodes.py", do not edit it manually.
+
+/* C helpers for type specialized "/" (Div) operations */
+
+#if PYTHON_VERSION < 300
+
+PyObject *BINARY_OPERATION_DIV_INT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand1));
+    assert(PyInt_CheckExact(operand2));
+
+    const long a = PyInt_AS_LONG(operand1);
+    const long b = PyInt_AS_LONG(operand2);
+
+    // Warnings for classic division are left to the slot.
+    if (likely(!Py_DivisionWarningFlag)) {
+        if (likely(b != 0 && !(b == -1 && a < 0 && (unsigned long)a == 0 - (unsigned long)a))) {
+            long x_div_y = a / b;
+            long x_mod_y = (long)(a - (unsigned long)x_div_y * b);
+
+            if (x_mod_y && ((b ^ x_mod_y) < 0)) {
+                x_div_y -= 1;
+            }
+
+            return PyInt_FromLong(x_div_y);
+        }
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyInt_Type.tp_as_number->nb_divide(operand1, operand2);
+    assert(result != Py_NotImplemented);
+
+    return result;
+}
+
+PyObject *BINARY_OPERATION_DIV_OBJECT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    if (PyInt_CheckExact(operand1)) {
+        return BINARY_OPERATION_DIV_INT_INT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_DIV(operand1, operand2);
+}
+
+PyObject *BINARY_OPERATION_DIV_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand1));
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_DIV_INT_INT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_DIV(operand1, operand2);
+}
+
+PyObject *BINARY_OPERATION_DIV_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+    assert(PyLong_CheckExact(operand2));
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyLong_Type.tp_as_number->nb_divide(operand1, operand2);
+    assert(result != Py_NotImplemented);
+
+    return result;
+}
+
+PyObject *BINARY_OPERATION_DIV_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return BINARY_OPERATION_DIV_LONG_LONG(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_DIV(operand1, operand2);
+}
+
+PyObject *BINARY_OPERATION_DIV_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_DIV_LONG_LONG(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_DIV(operand1, operand2);
+}
+
+PyObject *BINARY_OPERATION_DIV_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+    assert(PyFloat_CheckExact(operand2));
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyFloat_Type.tp_as_number->nb_divide(operand1, operand2);
+    assert(result != Py_NotImplemented);
+
+    return result;
+}
+
+PyObject *BINARY_OPERATION_DIV_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return BINARY_OPERATION_DIV_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_DIV(operand1, operand2);
+}
+
+PyObject *BINARY_OPERATION_DIV_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand1));
+
+    if (PyFloat_CheckExact(operand2)) {
+        return BINARY_OPERATION_DIV_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_DIV(operand1, operand2);
+}
+
+#endif
@@ -0,0 +1,172 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+// This file is generated by "nuitka.tools.specialize" from the tables in
+// "nuitka/codegen/OperatorCodes.py", do not edit it manually.
+
+/* C helpers for type specialized "/=" (Div) operations */
+
+#if PYTHON_VERSION < 300
+
+bool BINARY_OPERATION_DIV_INT_INT_INPLACE(PyObject **operand1, PyObject *operand2) {
+    assert(operand1);
+    CHECK_OBJECT(*operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(*operand1));
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = BINARY_OPERATION_DIV_INT_INT(*operand1, operand2);
+
+    if (unlikely(result == NULL)) {
+        return false;
+    }
+
+    // We got an object handed, that we have to release.
+    Py_DECREF(*operand1);
+
+    // That's our return value then. As we use a dedicated variable, it's
+    // OK that way.
+    *operand1 = result;
+
+    return true;
+}
+
+bool BINARY_OPERATION_DIV_OBJECT_INT_INPLACE(PyObject **operand1, PyObject *operand2) {
+    assert(operand1);
+    CHECK_OBJECT(*operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    if (PyInt_CheckExact(*operand1)) {
+        return BINARY_OPERATION_DIV_INT_INT_INPLACE(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_INPLACE(PyNumber_InPlaceDivide, operand1, operand2);
+}
+
+bool BINARY_OPERATION_DIV_INT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2) {
+    assert(operand1);
+    CHECK_OBJECT(*operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(*operand1));
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_DIV_INT_INT_INPLACE(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_INPLACE(PyNumber_InPlaceDivide, operand1, operand2);
+}
+
+bool BINARY_OPERATION_DIV_LONG_LONG_INPLACE(PyObject **operand1, PyObject *operand2) {
+    assert(operand1);
+    CHECK_OBJECT(*operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(*operand1));
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = BINARY_OPERATION_DIV_LONG_LONG(*operand1, operand2);
+
+    if (unlikely(result == NULL)) {
+        return false;
+    }
+
+    // We got an object handed, that we have to release.
+    Py_DECREF(*operand1);
+
+    // That's our return value then. As we use a dedicated variable, it's
+    // OK that way.
+    *operand1 = result;
+
+    return true;
+}
+
+bool BINARY_OPERATION_DIV_OBJECT_LONG_INPLACE(PyObject **operand1, PyObject *operand2) {
+    assert(operand1);
+    CHECK_OBJECT(*operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(*operand1)) {
+        return BINARY_OPERATION_DIV_LONG_LONG_INPLACE(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_INPLACE(PyNumber_InPlaceDivide, operand1, operand2);
+}
+
+bool BINARY_OPERATION_DIV_LONG_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2) {
+    assert(operand1);
+    CHECK_OBJECT(*operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(*operand1));
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_DIV_LONG_LONG_INPLACE(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_INPLACE(PyNumber_InPlaceDivide, operand1, operand2);
+}
+
+bool BINARY_OPERATION_DIV_FLOAT_FLOAT_INPLACE(PyObject **operand1, PyObject *operand2) {
+    assert(operand1);
+    CHECK_OBJECT(*operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(*operand1));
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = BINARY_OPERATION_DIV_FLOAT_FLOAT(*operand1, operand2);
+
+    if (unlikely(result == NULL)) {
+        return false;
+    }
+
+    // We got an object handed, that we have to release.
+    Py_DECREF(*operand1);
+
+    // That's our return value then. As we use a dedicated variable, it's
+    // OK that way.
+    *operand1 = result;
+
+    return true;
+}
+
+bool BINARY_OPERATION_DIV_OBJECT_FLOAT_INPLACE(PyObject **operand1, PyObject *operand2) {
+    assert(operand1);
+    CHECK_OBJECT(*operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(*operand1)) {
+        return BINARY_OPERATION_DIV_FLOAT_FLOAT_INPLACE(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_INPLACE(PyNumber_InPlaceDivide, operand1, operand2);
+}
+
+bool BINARY_OPERATION_DIV_FLOAT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2) {
+    assert(operand1);
+    CHECK_OBJECT(*operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(*operand1));
+
+    if (PyFloat_CheckExact(operand2)) {
+        return BINARY_OPERATION_DIV_FLOAT_FLOAT_INPLACE(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_INPLACE(PyNumber_InPlaceDivide, operand1, operand2);
+}
+
+#endif
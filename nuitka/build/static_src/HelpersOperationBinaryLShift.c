@@ -0,0 +1,111 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+// This file is generated by "nuitka.tools.specialize" from the tables in
+// "nuitka/codegen/OperatorCodes.py", do not edit it manually.
+
+/* C helpers for type specialized "<<" (LShift) operations */
+
+#if PYTHON_VERSION < 300
+
+PyObject *BINARY_OPERATION_LSHIFT_INT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand1));
+    assert(PyInt_CheckExact(operand2));
+
+    const long a = PyInt_AS_LONG(operand1);
+    const long b = PyInt_AS_LONG(operand2);
+
+    // Negative and large shifts, and overflows are left to the slot.
+    if (likely(b >= 0 && b < LONG_BIT)) {
+        const long x = (long)((unsigned long)a << b);
+
+        if (likely(Py_ARITHMETIC_RIGHT_SHIFT(long, x, b) == a)) {
+            return PyInt_FromLong(x);
+        }
+    }
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyInt_Type.tp_as_number->nb_lshift(operand1, operand2);
+    assert(result != Py_NotImplemented);
+
+    return result;
+}
+
+PyObject *BINARY_OPERATION_LSHIFT_OBJECT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    if (PyInt_CheckExact(operand1)) {
+        return BINARY_OPERATION_LSHIFT_INT_INT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION(PyNumber_Lshift, operand1, operand2);
+}
+
+PyObject *BINARY_OPERATION_LSHIFT_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand1));
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_LSHIFT_INT_INT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION(PyNumber_Lshift, operand1, operand2);
+}
+
+#endif
+
+PyObject *BINARY_OPERATION_LSHIFT_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+    assert(PyLong_CheckExact(operand2));
+
+    // Cannot be "NotImplemented" for the exact same types.
+    PyObject *result = PyLong_Type.tp_as_number->nb_lshift(operand1, operand2);
+    assert(result != Py_NotImplemented);
+
+    return result;
+}
+
+PyObject *BINARY_OPERATION_LSHIFT_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return BINARY_OPERATION_LSHIFT_LONG_LONG(operand1, operand2);
+    }
+
+    return BINARY_OPERATION(PyNumber_Lshift, operand1, operand2);
+}
+
+PyObject *BINARY_OPERATION_LSHIFT_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand1));
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_LSHIFT_LONG_LONG(operand1, operand2);
+    }
+
+    return BINARY_OPERATION(PyNumber_Lshift, operand1, operand2);
+}
@@ -316,9 +316,8 @@ void patchTypeComparison() {
 
 #include "nuitka/freelists.h"
 
-#define MAX_TRACEBACK_FREE_LIST_COUNT 1000
 static PyTracebackObject *free_list_tracebacks = NULL;
-static int free_list_tracebacks_count = 0;
+struct Nuitka_FreeListStats free_list_tracebacks_stats = {"tracebacks", MAX_TRACEBACK_FREE_LIST_COUNT};
 
 // Create a traceback for a given frame, using a freelist hacked into the
 // existing type.
@@ -184,6 +184,77 @@ extern void _initCompiledAsyncgenTypes();
 unsigned char const *constant_bin = NULL;
 #endif
 
+#if defined(_NUITKA_CONSTANTS_FROM_FILE)
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+unsigned char const *constant_bin = NULL;
+
+/* Map the constants blob file next to the binary into memory. It's read-only
+ * so the pages can be shared between all processes running the binary. The
+ * file starts with an identification of the blob, which together with the
+ * size, must match what the binary was built with.
+ */
+static unsigned char const *mapConstantsFile(void) {
+    char filename[MAXPATHLEN + 1];
+
+    char const *binary_directory = getBinaryDirectoryHostEncoded();
+
+    if (unlikely(strlen(binary_directory) + 1 + strlen(_NUITKA_CONSTANTS_FILENAME) > MAXPATHLEN)) {
+        abort();
+    }
+
+    strcpy(filename, binary_directory);
+
+    char *d = filename + strlen(filename);
+    *d++ = SEP;
+    strcpy(d, _NUITKA_CONSTANTS_FILENAME);
+
+    int fd = open(filename, O_RDONLY);
+
+    if (unlikely(fd == -1)) {
+        fprintf(stderr, "Error, cannot open constants file '%s'.\n", filename);
+        abort();
+    }
+
+    struct stat file_stat;
+
+    if (unlikely(fstat(fd, &file_stat) == -1)) {
+        fprintf(stderr, "Error, cannot access constants file '%s'.\n", filename);
+        abort();
+    }
+
+    size_t const header_size = sizeof(_NUITKA_CONSTANTS_BUILD_ID) - 1;
+
+    if (unlikely((size_t)file_stat.st_size != header_size + _NUITKA_CONSTANTS_SIZE)) {
+        fprintf(stderr,
+                "Error, constants file '%s' has size %lu rather than %lu, it is truncated or not from this build.\n",
+                filename, (unsigned long)file_stat.st_size, (unsigned long)(header_size + _NUITKA_CONSTANTS_SIZE));
+        abort();
+    }
+
+    // Private, as nothing is written back, the unmodified pages are still shared.
+    void *result = mmap(NULL, file_stat.st_size, PROT_READ, MAP_PRIVATE, fd, 0);
+
+    if (unlikely(result == MAP_FAILED)) {
+        fprintf(stderr, "Error, cannot map constants file '%s'.\n", filename);
+        abort();
+    }
+
+    if (unlikely(memcmp(result, _NUITKA_CONSTANTS_BUILD_ID, header_size) != 0)) {
+        fprintf(stderr, "Error, constants file '%s' is not from this build of the program.\n", filename);
+        abort();
+    }
+
+    // The mapping remains valid after closing the file.
+    close(fd);
+
+    return (unsigned char const *)result + header_size;
+}
+#endif
+
 #ifdef _NUITKA_WINMAIN_ENTRY_POINT
 int __stdcall WinMain(HINSTANCE hInstance, HINSTANCE hPrevInstance, char *lpCmdLine, int nCmdShow) {
 #if defined(__MINGW32__) && !defined(_W64)
@@ -219,7 +290,7 @@ int main(int argc, char **argv) {
 
     /* On Windows we support loading the constants blob from an embedded
      * resource. On Linux, where possible this is done automatically by
-     * the linker already.
+     * the linker already, unless it is to be mapped from a file.
      */
 #if defined(_NUITKA_CONSTANTS_FROM_RESOURCE)
     NUITKA_PRINT_TRACE("main(): Loading constants blob from Windows resource.");
@@ -230,6 +301,12 @@ int main(int argc, char **argv) {
     assert(constant_bin);
 #endif
 
+#if defined(_NUITKA_CONSTANTS_FROM_FILE)
+    NUITKA_PRINT_TRACE("main(): Mapping constants blob from file.");
+
+    constant_bin = mapConstantsFile();
+#endif
+
 #ifdef _NUITKA_STANDALONE
     NUITKA_PRINT_TRACE("main(): Prepare standalone environment.");
     prepareStandaloneEnvironment();
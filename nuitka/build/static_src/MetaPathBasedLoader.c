@@ -34,6 +34,7 @@
 #endif
 
 #include "nuitka/prelude.h"
+#include "nuitka/freelists.h"
 #include "nuitka/unfreezing.h"
 
 #ifdef _WIN32
@@ -53,19 +54,66 @@ static inline bool isVerbose(void) { return false; }
 #endif
 
 static struct Nuitka_MetaPathBasedLoaderEntry *loader_entries = NULL;
+static Py_ssize_t loader_entries_count = 0;
+
+// Sorted index of the frozen modules table, for binary search. The table is
+// merged with the pre-existing CPython frozen modules at startup, so it is
+// not sorted itself, and it is created lazily and again if it was replaced.
+static struct _frozen const *frozen_modules_indexed = NULL;
+static struct _frozen const **frozen_modules_index = NULL;
+static Py_ssize_t frozen_modules_index_count = 0;
+
+static int compareFrozenModules(void const *a, void const *b) {
+    return strcmp((*(struct _frozen const **)a)->name, (*(struct _frozen const **)b)->name);
+}
+
+static void indexFrozenModules(void) {
+    Py_ssize_t count = 0;
+
+    for (struct _frozen const *p = PyImport_FrozenModules; p->name != NULL; p++) {
+        count += 1;
+    }
+
+    if (frozen_modules_index != NULL) {
+        free((void *)frozen_modules_index);
+    }
+
+    frozen_modules_index = (struct _frozen const **)malloc((count + 1) * sizeof(struct _frozen const *));
+    assert(frozen_modules_index);
+
+    for (Py_ssize_t i = 0; i < count; i++) {
+        frozen_modules_index[i] = &PyImport_FrozenModules[i];
+    }
+
+    qsort((void *)frozen_modules_index, count, sizeof(struct _frozen const *), compareFrozenModules);
+
+    frozen_modules_index_count = count;
+    frozen_modules_indexed = PyImport_FrozenModules;
+}
 
 static bool hasFrozenModule(char const *name) {
-    for (struct _frozen const *p = PyImport_FrozenModules;; p++) {
-        if (p->name == NULL) {
-            return false;
-        }
+    if (unlikely(frozen_modules_indexed != PyImport_FrozenModules)) {
+        indexFrozenModules();
+    }
+
+    Py_ssize_t low = 0;
+    Py_ssize_t high = frozen_modules_index_count;
+
+    while (low < high) {
+        Py_ssize_t middle = low + (high - low) / 2;
 
-        if (strcmp(p->name, name) == 0) {
-            break;
+        int res = strcmp(name, frozen_modules_index[middle]->name);
+
+        if (res == 0) {
+            return true;
+        } else if (res < 0) {
+            high = middle;
+        } else {
+            low = middle + 1;
         }
     }
 
-    return true;
+    return false;
 }
 
 static char *copyModulenameAsPath(char *buffer, char const *module_name) {
@@ -207,16 +255,26 @@ static PyObject *loadModuleFromCodeObject(PyCodeObject *code_object, char const
     return module;
 }
 
+// The loader entries are sorted by name during code generation, so we can do
+// a binary search.
 static struct Nuitka_MetaPathBasedLoaderEntry *findEntry(char const *name) {
-    struct Nuitka_MetaPathBasedLoaderEntry *current = loader_entries;
-    assert(current);
+    assert(loader_entries);
 
-    while (current->name != NULL) {
-        if (strcmp(name, current->name) == 0) {
-            return current;
-        }
+    Py_ssize_t low = 0;
+    Py_ssize_t high = loader_entries_count;
 
-        current++;
+    while (low < high) {
+        Py_ssize_t middle = low + (high - low) / 2;
+
+        int res = strcmp(name, loader_entries[middle].name);
+
+        if (res == 0) {
+            return &loader_entries[middle];
+        } else if (res < 0) {
+            high = middle;
+        } else {
+            low = middle + 1;
+        }
     }
 
     return NULL;
@@ -944,6 +1002,12 @@ static PyObject *_path_unfreezer_dunder_init(PyObject *self, PyObject *args, PyO
     return result;
 }
 
+// Usage statistics of the free lists of compiled objects, for tuning their
+// sizes with "--free-list-size".
+static PyObject *_path_unfreezer_get_free_list_stats(PyObject *self, PyObject *args) {
+    return Nuitka_GetFreeListStats();
+}
+
 struct Nuitka_LoaderObject {
     PyObject_HEAD PyObject *module_name; /* Module we are responsible for */
 };
@@ -956,6 +1020,7 @@ static PyMethodDef Nuitka_Loader_methods[] = {
     {"find_module", (PyCFunction)_path_unfreezer_find_module, METH_STATIC | METH_VARARGS | METH_KEYWORDS, NULL},
     {"load_module", (PyCFunction)_path_unfreezer_load_module, METH_STATIC | METH_VARARGS | METH_KEYWORDS, NULL},
     {"is_package", (PyCFunction)_path_unfreezer_is_package, METH_STATIC | METH_VARARGS | METH_KEYWORDS, NULL},
+    {"get_free_list_stats", (PyCFunction)_path_unfreezer_get_free_list_stats, METH_STATIC | METH_NOARGS, NULL},
 #if PYTHON_VERSION >= 340
     {"module_repr", (PyCFunction)_path_unfreezer_repr_module, METH_STATIC | METH_VARARGS | METH_KEYWORDS, NULL},
     {"find_spec", (PyCFunction)_path_unfreezer_find_spec, METH_STATIC | METH_VARARGS | METH_KEYWORDS, NULL},
@@ -1023,6 +1088,16 @@ void registerMetaPathBasedUnfreezer(struct Nuitka_MetaPathBasedLoaderEntry *_loa
 
     loader_entries = _loader_entries;
 
+    while (loader_entries[loader_entries_count].name != NULL) {
+#ifndef __NUITKA_NO_ASSERT__
+        if (loader_entries_count > 0) {
+            assert(strcmp(loader_entries[loader_entries_count - 1].name, loader_entries[loader_entries_count].name) < 0);
+        }
+#endif
+
+        loader_entries_count += 1;
+    }
+
     PyType_Ready(&Nuitka_Loader_Type);
 
     // Register it as a meta path loader.
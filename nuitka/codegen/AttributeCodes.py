@@ -119,7 +119,11 @@ def generateAttributeLookupCode(to_name, expression, emit, context):
             emit("%s = LOOKUP_ATTRIBUTE_CLASS_SLOT( %s );" % (value_name, source_name))
         else:
             emit(
-                "%s = LOOKUP_ATTRIBUTE( %s, %s );"
+                """\
+{
+    static Nuitka_AttributeCache cache;
+    %s = LOOKUP_ATTRIBUTE_CACHED( %s, %s, &cache );
+}"""
                 % (value_name, source_name, context.getConstantCode(attribute_name))
             )
 
@@ -22,10 +22,55 @@ efficiently. The "StreamData" class is used in two places, for constants
 and for freezing of bytecode.
 """
 
+from array import array
+
 
 class StreamData(object):
+    """ Appendable binary stream with de-duplication of values.
+
+        Values are appended to a growing buffer, and an index from the value
+        content to its offset makes repeated values share their storage. A
+        value that is part of the stream already, e.g. a substring of an
+        earlier value, is found with an index of all positions of 4 byte
+        grams, and for shorter values of the first position of all of them.
+        This keeps lookups and appends linear in the size of the value,
+        rather than searching the whole stream every time.
+    """
+
+    __slots__ = (
+        "stream_data",
+        "offsets",
+        "gram_positions",
+        "short_offsets",
+        "request_count",
+        "hit_count",
+        "recorded",
+    )
+
+    # Size of the grams indexed for finding values inside the stream.
+    gram_size = 4
+
+    # Limit of positions to check for a gram, so there is a bound for values
+    # made only of very common grams.
+    max_candidates = 1024
+
     def __init__(self):
-        self.stream_data = bytes()
+        self.stream_data = bytearray()
+
+        # Content of values to their offset in the stream.
+        self.offsets = {}
+
+        # Grams to all their positions, and values shorter than a gram to
+        # their first position in the stream.
+        self.gram_positions = {}
+        self.short_offsets = {}
+
+        # Statistics, for reporting the effectiveness of de-duplication.
+        self.request_count = 0
+        self.hit_count = 0
+
+        # Values requested while recording, see "startRecording".
+        self.recorded = None
 
     def getStreamDataCode(self, value, fixed_size=False):
         offset = self.getStreamDataOffset(value)
@@ -36,12 +81,117 @@ class StreamData(object):
             return "&constant_bin[ %d ], %d" % (offset, len(value))
 
     def getStreamDataOffset(self, value):
-        offset = self.stream_data.find(value)
-        if offset == -1:
-            offset = len(self.stream_data)
-            self.stream_data += value
+        value = bytes(value)
+
+        self.request_count += 1
+
+        offset = self.offsets.get(value)
+
+        if offset is None:
+            offset = self._findValue(value)
+
+            if offset is None:
+                offset = len(self.stream_data)
+                self.stream_data += value
+
+                self._indexData(offset)
+            else:
+                self.hit_count += 1
+
+            self.offsets[value] = offset
+        else:
+            self.hit_count += 1
+
+        if self.recorded is not None:
+            self.recorded.append((value, offset))
 
         return offset
 
+    def _findValue(self, value):
+        """ Find the value inside the stream, or None if it's not there. """
+
+        gram_size = self.gram_size
+
+        if len(value) < gram_size:
+            return self.short_offsets.get(value)
+
+        # Every occurrence of the value has all its grams, use the one with
+        # the fewest positions for candidates.
+        best_index = None
+        best_positions = None
+
+        for index in range(len(value) - gram_size + 1):
+            positions = self.gram_positions.get(value[index : index + gram_size])
+
+            if positions is None:
+                return None
+
+            if best_positions is None or len(positions) < len(best_positions):
+                best_index = index
+                best_positions = positions
+
+        for position in best_positions[: self.max_candidates]:
+            offset = position - best_index
+
+            if offset >= 0 and self.stream_data.startswith(value, offset):
+                return offset
+
+        return None
+
+    def _indexData(self, start):
+        """ Add the grams of data appended at "start" to the indexes.
+
+            Grams that start before and reach into the new data are new too.
+        """
+
+        gram_size = self.gram_size
+
+        first = max(0, start - gram_size + 1)
+        chunk = bytes(self.stream_data[first:])
+
+        short_offsets = self.short_offsets
+
+        for size in range(1, gram_size):
+            for index in range(max(0, start - first - size + 1), len(chunk) - size + 1):
+                key = chunk[index : index + size]
+
+                if key not in short_offsets:
+                    short_offsets[key] = first + index
+
+        gram_positions = self.gram_positions
+
+        for index in range(len(chunk) - gram_size + 1):
+            gram = chunk[index : index + gram_size]
+            positions = gram_positions.get(gram)
+
+            if positions is None:
+                gram_positions[gram] = array("l", (first + index,))
+            else:
+                positions.append(first + index)
+
+    def startRecording(self):
+        """ Start recording the values requested with their offsets.
+
+            Code generated for a module embeds offsets into the stream, and
+            to use it in another compilation, the values must be requested
+            again, and the offsets be translated.
+        """
+        self.recorded = []
+
+    def stopRecording(self):
+        result = self.recorded
+        self.recorded = None
+
+        return result
+
     def getBytes(self):
-        return self.stream_data
+        return bytes(self.stream_data)
+
+    def getSize(self):
+        return len(self.stream_data)
+
+    def getHitRate(self):
+        if self.request_count == 0:
+            return 0.0
+
+        return float(self.hit_count) / self.request_count
@@ -23,6 +23,9 @@ able to execute them without creating the argument dictionary at all.
 
 """
 
+from nuitka.__past__ import iterItems
+from nuitka.Constants import isMutable
+
 from .CodeHelpers import (
     generateChildExpressionCode,
     generateExpressionCode,
@@ -32,6 +35,7 @@ from .ConstantCodes import getConstantAccess
 from .ErrorCodes import getErrorExitCode
 from .LineNumberCodes import emitLineNumberUpdateCode
 from .templates.CodeTemplatesCalls import (
+    template_call_function_direct,
     template_call_function_with_args_decl,
     template_call_function_with_args_impl,
     template_call_method_with_args_decl,
@@ -80,11 +84,11 @@ def _generateCallCodePosOnly(
                 call_arg_names.append(call_arg_name)
 
             if called_attribute_name is None:
-                getCallCodePosArgsQuick(
+                _getCallCodePosArgsQuickOrDirect(
                     to_name=to_name,
                     called_name=called_name,
                     arg_names=call_arg_names,
-                    needs_check=expression.mayRaiseException(BaseException),
+                    expression=expression,
                     emit=emit,
                     context=context,
                 )
@@ -99,7 +103,27 @@ def _generateCallCodePosOnly(
                     context=context,
                 )
         elif call_args_value:
-            if called_attribute_name is None:
+            direct_function_body = _getDirectCalledFunctionBody(
+                expression=expression, arg_count=len(call_args_value)
+            )
+
+            if called_attribute_name is None and direct_function_body is not None:
+                arg_tuple = context.getConstantCode(constant=call_args_value)
+
+                _getDirectCallCode(
+                    to_name=to_name,
+                    called_name=called_name,
+                    function_identifier=direct_function_body.getCodeName(),
+                    arg_codes=[
+                        "PyTuple_GET_ITEM( %s, %d )" % (arg_tuple, count)
+                        for count in range(len(call_args_value))
+                    ],
+                    release_names=(called_name,),
+                    needs_check=expression.mayRaiseException(BaseException),
+                    emit=emit,
+                    context=context,
+                )
+            elif called_attribute_name is None:
                 _getCallCodeFromTuple(
                     to_name=to_name,
                     called_name=called_name,
@@ -122,10 +146,11 @@ def _generateCallCodePosOnly(
                 )
         else:
             if called_attribute_name is None:
-                getCallCodeNoArgs(
+                _getCallCodePosArgsQuickOrDirect(
                     to_name=to_name,
                     called_name=called_name,
-                    needs_check=expression.mayRaiseException(BaseException),
+                    arg_names=(),
+                    expression=expression,
                     emit=emit,
                     context=context,
                 )
@@ -154,11 +179,11 @@ def _generateCallCodePosOnly(
         context.setCurrentSourceCodeReference(expression.getCompatibleSourceReference())
 
         if called_attribute_name is None:
-            getCallCodePosArgsQuick(
+            _getCallCodePosArgsQuickOrDirect(
                 to_name=to_name,
                 called_name=called_name,
                 arg_names=call_arg_names,
-                needs_check=expression.mayRaiseException(BaseException),
+                expression=expression,
                 emit=emit,
                 context=context,
             )
@@ -200,6 +225,100 @@ def _generateCallCodePosOnly(
             )
 
 
+def _getDirectCalledFunctionBody(expression, arg_count, keyword_names=()):
+    """ Get the function body a call is known to go to, if it can be direct.
+
+        This is for module level functions, which are called with all their
+        arguments given, positionally or by keywords with names known at
+        compile time. The module variable can still be changed from the
+        outside, so the code checks the called object at run time.
+    """
+
+    called = expression.getCalled()
+
+    if not called.isExpressionVariableRef():
+        return None
+
+    variable = called.getVariable()
+
+    if not variable.isModuleVariable():
+        return None
+
+    assign_source = variable.getSingleAssignSource()
+
+    if assign_source is None or not assign_source.isExpressionFunctionCreation():
+        return None
+
+    function_body = assign_source.getFunctionRef().getFunctionBody()
+
+    # Only created functions have the implementation we can check for.
+    if not function_body.isExpressionFunctionBody() or (
+        function_body.needsDirectCall()
+    ):
+        return None
+
+    parameters = function_body.getParameters()
+
+    # TODO: Defaults would have to be taken from the function object, and
+    # star arguments be created, keep it simple for now.
+    if (
+        parameters.getStarListArgumentName()
+        or parameters.getStarDictArgumentName()
+        or parameters.getKwOnlyParameterCount()
+        or parameters.getArgumentCount() != arg_count + len(keyword_names)
+    ):
+        return None
+
+    # The keyword arguments must give exactly the parameters not given
+    # positionally, then they can be passed in the order of the parameters.
+    if keyword_names and (
+        parameters.getPositionalOnlyCount() > arg_count
+        or set(keyword_names) != set(parameters.getArgumentNames()[arg_count:])
+    ):
+        return None
+
+    return function_body
+
+
+def _getCallCodePosArgsQuickOrDirect(
+    to_name, called_name, arg_names, expression, emit, context
+):
+    needs_check = expression.mayRaiseException(BaseException)
+
+    direct_function_body = _getDirectCalledFunctionBody(
+        expression=expression, arg_count=len(arg_names)
+    )
+
+    if direct_function_body is not None:
+        _getDirectCallCode(
+            to_name=to_name,
+            called_name=called_name,
+            function_identifier=direct_function_body.getCodeName(),
+            arg_codes=arg_names,
+            release_names=[called_name] + list(arg_names),
+            needs_check=needs_check,
+            emit=emit,
+            context=context,
+        )
+    elif arg_names:
+        getCallCodePosArgsQuick(
+            to_name=to_name,
+            called_name=called_name,
+            arg_names=arg_names,
+            needs_check=needs_check,
+            emit=emit,
+            context=context,
+        )
+    else:
+        getCallCodeNoArgs(
+            to_name=to_name,
+            called_name=called_name,
+            needs_check=needs_check,
+            emit=emit,
+            context=context,
+        )
+
+
 def _generateCallCodeKwOnly(
     to_name, expression, call_kw, called_name, called_attribute_name, emit, context
 ):
@@ -222,6 +341,120 @@ def _generateCallCodeKwOnly(
     )
 
 
+def _getDirectCallValueCode(value, is_constant, child_name, value_names, emit, context):
+    if not is_constant:
+        value_name = generateChildExpressionCode(
+            expression=value, child_name=child_name, emit=emit, context=context
+        )
+    elif isMutable(value):
+        value_name = context.allocateTempName(child_name)
+
+        getConstantAccess(
+            to_name=value_name, constant=value, emit=emit, context=context
+        )
+    else:
+        return context.getConstantCode(constant=value)
+
+    value_names.append(value_name)
+
+    return value_name
+
+
+def _generateDirectCallCodeKeywords(to_name, called_name, expression, emit, context):
+    """ Call a known function directly, also with keyword arguments.
+
+        The keyword names are matched to the parameters at compile time, so
+        no dictionary is created for the call, unless the called object turns
+        out to be another one at run time. Returns False, if the call cannot
+        be done like this.
+    """
+
+    call_args = expression.getCallArgs()
+    call_kw = expression.getCallKw()
+
+    if call_args is None:
+        arg_values = ()
+    elif call_args.isExpressionConstantRef():
+        arg_values = call_args.getConstant()
+    elif call_args.isExpressionMakeTuple():
+        arg_values = call_args.getElements()
+    else:
+        return False
+
+    if call_kw.isExpressionConstantRef():
+        if not call_kw.isMappingWithConstantStringKeys():
+            return False
+
+        kw_pairs = tuple(iterItems(call_kw.getConstant()))
+    elif call_kw.isExpressionMakeDict():
+        if not call_kw.isMappingWithConstantStringKeys():
+            return False
+
+        kw_pairs = call_kw.getMappingStringKeyPairs()
+    else:
+        return False
+
+    kw_names = [kw_name for kw_name, _kw_value in kw_pairs]
+
+    direct_function_body = _getDirectCalledFunctionBody(
+        expression=expression, arg_count=len(arg_values), keyword_names=kw_names
+    )
+
+    if direct_function_body is None:
+        return False
+
+    # The values are computed in the order given, and then passed in the order
+    # of the parameters.
+    value_names = []
+
+    arg_codes = [
+        _getDirectCallValueCode(
+            value=arg_value,
+            is_constant=call_args.isExpressionConstantRef(),
+            child_name=call_args.getChildName() + "_element",
+            value_names=value_names,
+            emit=emit,
+            context=context,
+        )
+        for arg_value in arg_values
+    ]
+
+    kw_codes = [
+        _getDirectCallValueCode(
+            value=kw_value,
+            is_constant=call_kw.isExpressionConstantRef(),
+            child_name=call_kw.getChildName() + "_value",
+            value_names=value_names,
+            emit=emit,
+            context=context,
+        )
+        for _kw_name, kw_value in kw_pairs
+    ]
+
+    context.setCurrentSourceCodeReference(expression.getCompatibleSourceReference())
+
+    parameter_names = direct_function_body.getParameters().getArgumentNames()
+
+    _getDirectCallCode(
+        to_name=to_name,
+        called_name=called_name,
+        function_identifier=direct_function_body.getCodeName(),
+        arg_codes=arg_codes
+        + [
+            kw_codes[kw_names.index(parameter_name)]
+            for parameter_name in parameter_names[len(arg_codes) :]
+        ],
+        release_names=[called_name] + value_names,
+        needs_check=expression.mayRaiseException(BaseException),
+        emit=emit,
+        context=context,
+        kw_names=kw_names,
+        kw_codes=kw_codes,
+    )
+
+    return True
+
+
 def generateCallCode(to_name, expression, emit, context):
     # There is a whole lot of different cases, for each of which, we create
     # optimized code, constant, with and without positional or keyword arguments
@@ -278,6 +511,15 @@ def generateCallCode(to_name, expression, emit, context):
                 emit=emit,
                 context=context,
             )
+        elif _generateDirectCallCodeKeywords(
+            to_name=result_name,
+            called_name=called_name,
+            expression=expression,
+            emit=emit,
+            context=context,
+        ):
+            # Done, the keyword names were resolved at compile time.
+            pass
         else:
             call_args = expression.getCallArgs()
 
@@ -332,13 +574,92 @@ def getCallCodeNoArgs(to_name, called_name, needs_check, emit, context):
     context.addCleanupTempName(to_name)
 
 
+def _getDirectCallCode(
+    to_name,
+    called_name,
+    function_identifier,
+    arg_codes,
+    release_names,
+    needs_check,
+    emit,
+    context,
+    kw_names=(),
+    kw_codes=(),
+):
+    arg_size = len(arg_codes)
+
+    if kw_names:
+        # The positional values come first in the order of the parameters too,
+        # only the keyword values are needed again, in the order given.
+        call_args_decl = """\
+    PyObject *call_args[] = { %s };
+    PyObject *call_kw_values[] = { %s };
+""" % (
+            ", ".join(str(arg_code) for arg_code in arg_codes),
+            ", ".join(str(kw_code) for kw_code in kw_codes),
+        )
+        call_args_name = "call_args"
+        fallback_code = (
+            "CALL_FUNCTION_WITH_ARGS_KW_NAMES( %s, call_args, %d, call_kw_values, %s )"
+            % (
+                called_name,
+                arg_size - len(kw_names),
+                context.getConstantCode(constant=tuple(kw_names)),
+            )
+        )
+    elif arg_size:
+        quick_calls_used.add(arg_size)
+
+        call_args_decl = "    PyObject *call_args[] = { %s };\n" % ", ".join(
+            str(arg_code) for arg_code in arg_codes
+        )
+        call_args_name = "call_args"
+        fallback_code = "CALL_FUNCTION_WITH_ARGS%d( %s, call_args )" % (
+            arg_size,
+            called_name,
+        )
+    else:
+        call_args_decl = ""
+        call_args_name = "NULL"
+        fallback_code = "CALL_FUNCTION_NO_ARGS( %s )" % called_name
+
+    emitLineNumberUpdateCode(emit, context)
+
+    emit(
+        template_call_function_direct
+        % {
+            "to_name": to_name,
+            "called_name": called_name,
+            "function_impl_identifier": "impl_" + function_identifier,
+            "call_args_decl": call_args_decl,
+            "call_args_name": call_args_name,
+            "args_count": arg_size,
+            "fallback_code": fallback_code,
+        }
+    )
+
+    getErrorExitCode(
+        check_name=to_name,
+        release_names=release_names,
+        needs_check=needs_check,
+        emit=emit,
+        context=context,
+    )
+
+    context.addCleanupTempName(to_name)
+
+
 def _getInstanceCallCodeNoArgs(
     to_name, called_name, called_attribute_name, needs_check, emit, context
 ):
     emitLineNumberUpdateCode(emit, context)
 
     emit(
-        "%s = CALL_METHOD_NO_ARGS( %s, %s );"
+        """\
+{
+    static Nuitka_AttributeCache cache;
+    %s = CALL_METHOD_NO_ARGS_CACHED( %s, %s, &cache );
+}"""
         % (to_name, called_name, called_attribute_name)
     )
 
@@ -358,6 +679,18 @@ quick_calls_used = set([1, 2, 3, 4, 5])
 quick_instance_calls_used = set()
 
 
+def getQuickCallsUsed():
+    return quick_calls_used, quick_instance_calls_used
+
+
+def setQuickCallsUsed(calls_used, instance_calls_used):
+    # Singleton, pylint: disable=global-statement
+    global quick_calls_used, quick_instance_calls_used
+
+    quick_calls_used = calls_used
+    quick_instance_calls_used = instance_calls_used
+
+
 def _getInstanceCallCodePosArgsQuick(
     to_name, called_name, called_attribute_name, arg_names, needs_check, emit, context
 ):
@@ -372,8 +705,9 @@ def _getInstanceCallCodePosArgsQuick(
     emit(
         """\
 {
+    static Nuitka_AttributeCache cache;
     PyObject *call_args[] = { %s };
-    %s = CALL_METHOD_WITH_ARGS%d( %s, %s, call_args );
+    %s = CALL_METHOD_WITH_ARGS%d( %s, %s, call_args, &cache );
 }
 """
         % (
@@ -453,7 +787,10 @@ def _getInstanceCallCodeFromTuple(
 
     emit(
         """\
-%s = CALL_METHOD_WITH_ARGS%d( %s, %s, &PyTuple_GET_ITEM( %s, 0 ) );
+{
+    static Nuitka_AttributeCache cache;
+    %s = CALL_METHOD_WITH_ARGS%d( %s, %s, &PyTuple_GET_ITEM( %s, 0 ), &cache );
+}
 """
         % (to_name, arg_size, called_name, called_attribute_name, arg_tuple)
     )
@@ -26,7 +26,9 @@ branches and make a code block out of it. But it doesn't contain any target
 language syntax.
 """
 
-from . import Contexts
+from nuitka import Options
+
+from . import Contexts, ModuleCodeCache
 from .AsyncgenCodes import (
     generateMakeAsyncgenObjectCode,
     getAsyncgenObjectCode,
@@ -389,13 +391,10 @@ def _generateFunctionDeclCode(function_body, context):
         return None
 
 
-def prepareModuleCode(global_context, module, module_name):
-    # As this not only creates all modules, but also functions, it deals
-    # also with its functions.
-
+def _makeModuleContext(global_context, module, module_name):
     assert module.isCompiledPythonModule(), module
 
-    context = Contexts.PythonModuleContext(
+    return Contexts.PythonModuleContext(
         module=module,
         module_name=module_name,
         code_name=module.getCodeName(),
@@ -403,6 +402,79 @@ def prepareModuleCode(global_context, module, module_name):
         global_context=global_context,
     )
 
+
+def prepareModuleCode(global_context, module, module_name, module_code_data=None):
+    # As this not only creates all modules, but also functions, it deals
+    # also with its functions.
+
+    # The "module_code_data" is code prepared in a worker process, which is
+    # used if possible.
+
+    context = _makeModuleContext(global_context, module, module_name)
+
+    if module_code_data is not None:
+        template_values = ModuleCodeCache.replayModuleCode(module_code_data, context)
+
+        if template_values is not None:
+            return template_values, context
+
+    if not Options.shallCacheModuleCode():
+        return _prepareModuleCode(module, module_name, context), context
+
+    cache_key = ModuleCodeCache.getModuleCodeCacheKey(module)
+
+    template_values = ModuleCodeCache.restoreModuleCode(cache_key, context)
+
+    if template_values is None:
+        recording = ModuleCodeCache.ModuleCodeRecording()
+
+        try:
+            template_values = _prepareModuleCode(module, module_name, context)
+        finally:
+            recording.finish()
+
+        ModuleCodeCache.storeModuleCode(cache_key, template_values, context, recording)
+
+    return template_values, context
+
+
+def prepareModuleCodeData(global_context, module, module_name):
+    """ Prepare the code of a module for use in another process.
+
+        Returns the module code data, see "ModuleCodeCache", and if it was
+        taken from the cache.
+    """
+
+    cache_key = None
+
+    if Options.shallCacheModuleCode():
+        cache_key = ModuleCodeCache.getModuleCodeCacheKey(module)
+
+        module_code_data = ModuleCodeCache.loadModuleCodeData(cache_key)
+
+        if module_code_data is not None:
+            return module_code_data, True
+
+    context = _makeModuleContext(global_context, module, module_name)
+
+    recording = ModuleCodeCache.ModuleCodeRecording()
+
+    try:
+        template_values = _prepareModuleCode(module, module_name, context)
+    finally:
+        recording.finish()
+
+    module_code_data = ModuleCodeCache.getModuleCodeData(
+        template_values, context, recording
+    )
+
+    if cache_key is not None:
+        ModuleCodeCache.storeModuleCodeData(cache_key, module_code_data)
+
+    return module_code_data, False
+
+
+def _prepareModuleCode(module, module_name, context):
     context.setExceptionEscape("module_exception_exit")
 
     function_decl_codes = []
@@ -456,7 +528,7 @@ def prepareModuleCode(global_context, module, module_name):
         context=context,
     )
 
-    return template_values, context
+    return template_values
 
 
 def generateModuleCode(module_context, template_values):
@@ -489,6 +561,7 @@ setExpressionDispatchDict(
         "EXPRESSION_BUILTIN_EXECFILE": generateExecfileCode,
         "EXPRESSION_BUILTIN_EVAL": generateEvalCode,
         "EXPRESSION_BUILTIN_EXEC": generateEvalCode,
+        "EXPRESSION_BUILTIN_ITER_FOR_LOOP": generateBuiltinIter1Code,
         "EXPRESSION_BUILTIN_ITER_FOR_UNPACK": generateBuiltinIterForUnpackCode,
         "EXPRESSION_BUILTIN_ITER1": generateBuiltinIter1Code,
         "EXPRESSION_BUILTIN_ITER2": generateBuiltinIter2Code,
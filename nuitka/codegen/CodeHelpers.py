@@ -210,7 +210,12 @@ def _generateStatementSequenceCode(statement_sequence, emit, context):
         else:
             context.pushCleanupScope()
 
-            with context.variable_storage.withLocalStorage():
+            variable_storage = context.variable_storage
+
+            with variable_storage.withLocalStorage(
+                preserved=variable_storage.hasHeapStorage()
+                and context.mayYield(statement)
+            ):
                 statement_codes = SourceCodeCollector()
 
                 generateStatementCode(
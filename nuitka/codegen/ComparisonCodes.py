@@ -22,38 +22,25 @@ Rich comparisons, "in", and "not in", also "is", and "is not", and the
 """
 
 from nuitka.nodes.shapes.BuiltinTypeShapes import ShapeTypeBool
+from nuitka.PythonVersions import python_version
 
 from . import OperatorCodes
 from .CodeHelpers import generateExpressionCode, pickCodeHelper
 from .ErrorCodes import getErrorExitBoolCode, getErrorExitCode, getReleaseCodes
+from .VariableCodes import getVariableReferenceCType
 
 _cmp_obj_result_helpers_set = set(
     (
         "RICH_COMPARE_xx_OBJECT_OBJECT",
         #        "RICH_COMPARE_xx_OBJECT_INT",
-        #        "RICH_COMPARE_xx_OBJECT_LONG",
         #        "RICH_COMPARE_xx_OBJECT_STR",
-        #        "RICH_COMPARE_xx_FLOAT_OBJECT",
-        #        "RICH_COMPARE_xx_OBJECT_UNICODE",
-        #        "RICH_COMPARE_xx_OBJECT_TUPLE",
         #        "RICH_COMPARE_xx_OBJECT_LIST",
-        #        "RICH_COMPARE_xx_OBJECT_BYTES",
         #        "RICH_COMPARE_xx_INT_OBJECT",
-        #        "RICH_COMPARE_xx_LONG_OBJECT",
         #        "RICH_COMPARE_xx_STR_OBJECT",
-        #        "RICH_COMPARE_xx_OBJECT_FLOAT",
-        #        "RICH_COMPARE_xx_UNICODE_OBJECT",
-        #        "RICH_COMPARE_xx_TUPLE_OBJECT",
         #        "RICH_COMPARE_xx_LIST_OBJECT",
-        #        "RICH_COMPARE_xx_BYTES_OBJECT",
         #        "RICH_COMPARE_xx_INT_INT",
-        #        "RICH_COMPARE_xx_LONG_LONG",
         #        "RICH_COMPARE_xx_STR_STR",
-        #        "RICH_COMPARE_xx_FLOAT_FLOAT",
-        #        "RICH_COMPARE_xx_UNICODE_UNICODE",
-        #        "RICH_COMPARE_xx_TUPLE_TUPLE",
         #        "RICH_COMPARE_xx_LIST_LIST",
-        #        "RICH_COMPARE_xx_BYTES_BYTES",
     )
 )
 
@@ -61,33 +48,38 @@ _cmp_bool_result_helpers_set = set(
     (
         "RICH_COMPARE_BOOL_xx_OBJECT_OBJECT",
         "RICH_COMPARE_BOOL_xx_OBJECT_INT",
-        #        "RICH_COMPARE_BOOL_xx_OBJECT_LONG",
         #        "RICH_COMPARE_BOOL_xx_OBJECT_STR",
-        #        "RICH_COMPARE_BOOL_xx_FLOAT_OBJECT",
-        #        "RICH_COMPARE_BOOL_xx_OBJECT_UNICODE",
-        #        "RICH_COMPARE_BOOL_xx_OBJECT_TUPLE",
         #        "RICH_COMPARE_BOOL_xx_OBJECT_LIST",
-        #        "RICH_COMPARE_BOOL_xx_OBJECT_BYTES",
         "RICH_COMPARE_BOOL_xx_INT_OBJECT",
-        #        "RICH_COMPARE_BOOL_xx_LONG_OBJECT",
         #        "RICH_COMPARE_BOOL_xx_STR_OBJECT",
-        #        "RICH_COMPARE_BOOL_xx_OBJECT_FLOAT",
-        #        "RICH_COMPARE_BOOL_xx_UNICODE_OBJECT",
-        #        "RICH_COMPARE_BOOL_xx_TUPLE_OBJECT",
         #        "RICH_COMPARE_BOOL_xx_LIST_OBJECT",
-        #        "RICH_COMPARE_BOOL_xx_BYTES_OBJECT",
         "RICH_COMPARE_BOOL_xx_INT_INT",
-        #        "RICH_COMPARE_BOOL_xx_LONG_LONG",
         #        "RICH_COMPARE_BOOL_xx_STR_STR",
-        #        "RICH_COMPARE_BOOL_xx_FLOAT_FLOAT",
-        #        "RICH_COMPARE_BOOL_xx_UNICODE_UNICODE",
-        #        "RICH_COMPARE_BOOL_xx_TUPLE_TUPLE",
         #        "RICH_COMPARE_BOOL_xx_LIST_LIST",
-        #        "RICH_COMPARE_BOOL_xx_BYTES_BYTES",
     )
 )
 
 
+def _addSpecializedHelpers(helpers, prefix):
+    # The type specialized helpers for Python3 are generated, see the table in
+    # "OperatorCodes".
+    if python_version < 300:
+        return
+
+    for type_name in OperatorCodes.specialized_comparison_types:
+        for left_type, right_type in (
+            (type_name, type_name),
+            ("OBJECT", type_name),
+            (type_name, "OBJECT"),
+        ):
+            helpers.add("%s_%s_%s" % (prefix, left_type, right_type))
+            helpers.add("%s_%s_%s_NORECURSE" % (prefix, left_type, right_type))
+
+
+_addSpecializedHelpers(_cmp_obj_result_helpers_set, "RICH_COMPARE_xx")
+_addSpecializedHelpers(_cmp_bool_result_helpers_set, "RICH_COMPARE_BOOL_xx")
+
+
 def generateComparisonExpressionCode(to_name, expression, emit, context):
     # Currently high complexity, due to manual C typing and doing all
     # in one place, pylint: disable=too-many-branches,too-many-statements
@@ -105,7 +97,15 @@ def generateComparisonExpressionCode(to_name, expression, emit, context):
         ):
             type_name = "nuitka_bool"
 
-    left_name = context.allocateTempName("compexpr_left", type_name=type_name)
+    # Variables with C values, these are compared without making an object.
+    left_type_name = type_name
+    if comparator in OperatorCodes.rich_comparison_codes and (
+        left.isExpressionVariableRef() or left.isExpressionTempVariableRef()
+    ):
+        if getVariableReferenceCType(left, context).c_type == "nuitka_ilong":
+            left_type_name = "nuitka_ilong"
+
+    left_name = context.allocateTempName("compexpr_left", type_name=left_type_name)
     right_name = context.allocateTempName("compexpr_right", type_name=type_name)
 
     generateExpressionCode(
@@ -163,6 +163,33 @@ def generateComparisonExpressionCode(to_name, expression, emit, context):
     elif comparator in OperatorCodes.rich_comparison_codes:
         needs_check = expression.mayRaiseExceptionComparison()
 
+        if left_name.c_type == "nuitka_ilong":
+            res_name = context.getIntResName()
+
+            emit(
+                "%s = RICH_COMPARE_BOOL_ILONG_OBJECT( &%s, %s, Py_%s );"
+                % (
+                    res_name,
+                    left_name,
+                    right_name,
+                    OperatorCodes.rich_comparison_codes[comparator],
+                )
+            )
+
+            getErrorExitBoolCode(
+                condition="%s == -1" % res_name,
+                release_name=right_name,
+                needs_check=needs_check,
+                emit=emit,
+                context=context,
+            )
+
+            to_name.getCType().emitAssignmentCodeFromBoolCondition(
+                to_name=to_name, condition="%s != 0" % res_name, emit=emit
+            )
+
+            return
+
         if comparator == "Eq" and not context.mayRecurse():
             suffix = "_NORECURSE"
         else:
@@ -123,6 +123,9 @@ min_signed_long = -(2 ** (sizeof_long * 8 - 1) - 1)
 
 done = set()
 
+# Shared constants created lazily by the current module.
+lazy_done = set()
+
 
 def _getConstantInitValueCode(constant_value, constant_type):
     """ Return code, if possible, to create a constant.
@@ -250,6 +253,13 @@ def isMarshalConstant(constant_value):
     return r
 
 
+def _getCanonicalMarshalValue(restored):
+    # The "marshal" output flags values that have references elsewhere, which
+    # depends on what the compilation did with the value, so instead use the
+    # restored value, where it only depends on the value itself.
+    return marshal.dumps(restored)
+
+
 def getMarshalCode(constant_identifier, constant_value, emit):
     """ Force the marshal of a value.
 
@@ -259,6 +269,8 @@ def getMarshalCode(constant_identifier, constant_value, emit):
 
     assert compareConstants(constant_value, restored)
 
+    marshal_value = _getCanonicalMarshalValue(restored)
+
     emit(
         "%s = PyMarshal_ReadObjectFromString( (char *)%s );"
         % (constant_identifier, stream_data.getStreamDataCode(marshal_value))
@@ -284,6 +296,8 @@ def attemptToMarshal(constant_identifier, constant_value, emit):
 
         return False
 
+    marshal_value = _getCanonicalMarshalValue(restored)
+
     emit(
         "%s = PyMarshal_ReadObjectFromString( (char *)%s );"
         % (constant_identifier, stream_data.getStreamDataCode(marshal_value))
@@ -319,6 +333,17 @@ def _addConstantInitCode(
     elif constant_value is NotImplemented:
         return
     elif type(constant_value) is type:
+        return
+    elif module_level and context.global_context.isLazyConstant(constant_identifier):
+        _addLazyConstantInitCode(
+            context=context,
+            emit=emit,
+            check=check,
+            constant_type=constant_type,
+            constant_value=constant_value,
+            constant_identifier=constant_identifier,
+        )
+
         return
     elif constant_identifier in done:
         # Do not repeat ourselves.
@@ -355,6 +380,62 @@ assert( hash_%(constant_identifier)s == DEEP_HASH( %(constant_identifier)s ) );"
         )
 
 
+def _addLazyConstantInitCode(
+    context, emit, check, constant_type, constant_value, constant_identifier
+):
+    """ Emit code for a shared constant to be prepared during module init.
+
+        Every module using it has the code, and the first one imported will
+        create it.
+    """
+
+    if constant_identifier in lazy_done:
+        return
+
+    lazy_done.add(constant_identifier)
+
+    lazy_emit = SourceCodeCollector()
+
+    if Options.shallTraceExecution():
+        lazy_emit(
+            """NUITKA_PRINT_TRACE("Creating constant: %s");""" % constant_identifier
+        )
+
+    __addConstantInitCode(
+        context=context,
+        emit=lazy_emit,
+        check=check,
+        constant_type=constant_type,
+        constant_value=constant_value,
+        constant_identifier=constant_identifier,
+        module_level=True,
+        lazy=True,
+    )
+
+    if Options.isDebug():
+        lazy_emit(
+            """\
+hash_%(constant_identifier)s = DEEP_HASH( %(constant_identifier)s );"""
+            % {"constant_identifier": constant_identifier}
+        )
+
+        check(
+            """\
+CHECK_OBJECT( %(constant_identifier)s );
+assert( hash_%(constant_identifier)s == DEEP_HASH( %(constant_identifier)s ) );"""
+            % {"constant_identifier": constant_identifier}
+        )
+
+    emit(
+        """\
+if ( %s == NULL )
+{
+%s
+}"""
+        % (constant_identifier, indented(lazy_emit.codes))
+    )
+
+
 def __addConstantInitCode(
     context,
     emit,
@@ -363,6 +444,7 @@ def __addConstantInitCode(
     constant_value,
     constant_identifier,
     module_level,
+    lazy=False,
 ):
     """ Emit code for a specific constant to be prepared during init.
 
@@ -373,17 +455,22 @@ def __addConstantInitCode(
     # pylint: disable=too-many-branches,too-many-locals,too-many-return-statements,too-many-statements
 
     # For the module level, we only mean to create constants that are used only
-    # inside of it. For the global level, it must must be single use.
+    # inside of it, unless lazily creating shared ones. For the global level, it
+    # must must be single use.
     if module_level:
-        if context.global_context.getConstantUseCount(constant_identifier) != 1:
+        if (
+            not lazy
+            and context.global_context.getConstantUseCount(constant_identifier) != 1
+        ):
             return
     else:
         if context.getConstantUseCount(constant_identifier) == 1:
             return
 
     # Adding it to "done". We cannot have recursive constants, so this is OK
-    # to be done now.
-    done.add(constant_identifier)
+    # to be done now. Lazy constants are created by every module using them.
+    if not lazy:
+        done.add(constant_identifier)
 
     # Use shortest code for ints and longs.
     if constant_type is long:
@@ -846,6 +933,11 @@ def getConstantsInitCode(context):
     )
 
     for constant_identifier, constant_value in sorted_constants:
+        # Lazy constants are created by the modules, unless they are part
+        # of one created here.
+        if context.isLazyConstant(constant_identifier):
+            continue
+
         _addConstantInitCode(
             emit=emit,
             check=check,
@@ -1005,19 +1097,28 @@ def getConstantInitCodes(module_context):
     inits = SourceCodeCollector()
     checks = SourceCodeCollector()
 
+    # Longer identifiers first, these are mostly for longer values, and then
+    # shorter values can often be found inside them in the constants stream.
     sorted_constants = sorted(
-        module_context.getConstants(), key=lambda k: (len(k[0]), k[0])
+        module_context.getConstants(), key=lambda k: (-len(k), k)
     )
 
     global_context = module_context.global_context
 
+    lazy_done.clear()
+
     for constant_identifier in sorted_constants:
         if not constant_identifier.startswith("const_"):
             continue
 
         if global_context.getConstantUseCount(constant_identifier) == 1:
             qualifier = "static"
+        else:
+            qualifier = "extern"
 
+        if qualifier == "static" or global_context.isLazyConstant(
+            constant_identifier
+        ):
             constant_value = global_context.constants[constant_identifier]
 
             _addConstantInitCode(
@@ -1029,8 +1130,6 @@ def getConstantInitCodes(module_context):
                 module_level=True,
                 context=module_context,
             )
-        else:
-            qualifier = "extern"
 
         decls.append("%s PyObject *%s;" % (qualifier, constant_identifier))
 
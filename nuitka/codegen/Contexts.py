@@ -703,6 +703,10 @@ class PythonGlobalContext(object):
         self.constants = {}
         self.constant_use_count = {}
 
+        # Constants that must exist before any module is imported, because the
+        # C code outside of modules uses them.
+        self.startup_constants = set()
+
         for constant in _getConstantDefaultPopulation():
             code = self.getConstantCode(constant)
 
@@ -710,7 +714,18 @@ class PythonGlobalContext(object):
             self.countConstantUse(code)
             self.countConstantUse(code)
 
+            self.markStartupConstant(code)
+
     def getConstantCode(self, constant):
+        key = self.getConstantKey(constant)
+
+        if key not in self.constants:
+            self.constants[key] = constant
+
+        return key
+
+    @staticmethod
+    def getConstantKey(constant):
         # Use in user code, or for constants building code itself, many
         # constant types get special code immediately.
         # pylint: disable=too-many-branches
@@ -769,9 +784,6 @@ class PythonGlobalContext(object):
         else:
             key = "const_" + namifyConstant(constant)
 
-        if key not in self.constants:
-            self.constants[key] = constant
-
         return key
 
     def countConstantUse(self, constant):
@@ -783,6 +795,23 @@ class PythonGlobalContext(object):
     def getConstantUseCount(self, constant):
         return self.constant_use_count[constant]
 
+    def markStartupConstant(self, constant):
+        self.startup_constants.add(constant)
+
+    def isLazyConstant(self, constant):
+        """ Shared constants may be created by the modules using them.
+
+            This is optional, and not done for constants, that are needed
+            before modules are imported.
+        """
+        if not Options.shallCreateConstantsLazily():
+            return False
+
+        if constant in self.startup_constants:
+            return False
+
+        return self.constant_use_count.get(constant, 0) > 1
+
     def getConstants(self):
         return self.constants
 
@@ -894,6 +923,8 @@ class FrameDeclarationsMixin(object):
 
             if variable_code_type in ("b",):
                 result.append("(int)" + variable_code_name)
+            elif variable_code_type in ("L",):
+                result.append("&" + variable_code_name)
             else:
                 result.append(variable_code_name)
 
@@ -1128,7 +1159,38 @@ class PythonFunctionDirectContext(PythonFunctionContext):
         return False
 
 
+def _addYieldingNodes(node, yielding_nodes):
+    result = False
+
+    for child in node.getVisitableNodes():
+        if _addYieldingNodes(child, yielding_nodes) or (
+            child.isExpressionYield()
+            or child.isExpressionYieldFrom()
+            or child.isExpressionYieldFromWaitable()
+        ):
+            result = True
+
+    if result:
+        yielding_nodes.add(node)
+
+    return result
+
+
 class PythonGeneratorObjectContext(PythonFunctionContext):
+    def __init__(self, parent, function):
+        PythonFunctionContext.__init__(self, parent=parent, function=function)
+
+        # Nodes that contain a yield, found in one pass over the body.
+        self.yielding_nodes = None
+
+    def mayYield(self, node):
+        if self.yielding_nodes is None:
+            self.yielding_nodes = set()
+
+            _addYieldingNodes(self.function, self.yielding_nodes)
+
+        return node in self.yielding_nodes
+
     def _makeVariableStorage(self):
         return VariableStorage(heap_name="%s_heap" % self.getContextObjectName())
 
@@ -1185,6 +1247,9 @@ class PythonFunctionOutlineContext(
     def getOwner(self):
         return self.outline
 
+    def mayYield(self, node):
+        return self.parent.mayYield(node)
+
     def getEntryPoint(self):
         return self.outline.getEntryPoint()
 
@@ -206,12 +206,11 @@ def generateStatementsFrameCode(statement_sequence, emit, context):
 
 
 def getTypeSizeOf(type_indicator):
-    if type_indicator in ("O", "o", "N", "c"):
+    # For "L", only the object is stored.
+    if type_indicator in ("O", "o", "N", "c", "L"):
         return "sizeof(void *)"
     elif type_indicator == "b":
         return "sizeof(nuitka_bool)"
-    elif type_indicator == "L":
-        return "sizeof(nuitka_ilong)"
     else:
         assert False, type_indicator
 
@@ -39,21 +39,118 @@ def generateBuiltinImportCode(to_name, expression, emit, context):
         expression=expression, emit=emit, context=context
     )
 
+    full_name = _getImportCacheModuleName(expression)
+
     with withObjectCodeTemporaryAssignment(
         to_name, "imported_value", expression, emit, context
     ) as value_name:
 
-        _getBuiltinImportCode(
-            to_name=value_name,
-            module_name=module_name,
-            globals_name=globals_name,
-            locals_name=locals_name,
-            import_list_name=import_list_name,
-            level_name=level_name,
-            needs_check=expression.mayRaiseException(BaseException),
-            emit=emit,
-            context=context,
-        )
+        if full_name is not None:
+            _getCachedBuiltinImportCode(
+                to_name=value_name,
+                full_name=full_name,
+                module_name=module_name,
+                globals_name=globals_name,
+                locals_name=locals_name,
+                import_list_name=import_list_name,
+                level_name=level_name,
+                needs_check=expression.mayRaiseException(BaseException),
+                emit=emit,
+                context=context,
+            )
+        else:
+            _getBuiltinImportCode(
+                to_name=value_name,
+                module_name=module_name,
+                globals_name=globals_name,
+                locals_name=locals_name,
+                import_list_name=import_list_name,
+                level_name=level_name,
+                needs_check=expression.mayRaiseException(BaseException),
+                emit=emit,
+                context=context,
+            )
+
+
+def _getImportCacheModuleName(expression):
+    """ Absolute name of the imported module, if the import can be cached.
+
+        Imports in functions may be executed many times, and then are done
+        with a cache for the import site. For that, the imported module name
+        must be known, also for relative imports.
+    """
+    # Many cases to consider, pylint: disable=too-many-return-statements
+
+    parent_module = expression.getParentModule()
+
+    # Module level code runs only once.
+    if expression.getParentVariableProvider() is parent_module:
+        return None
+
+    # Relative imports are resolved against the globals given.
+    globals_arg = expression.getGlobals()
+
+    if globals_arg is None or not globals_arg.isExpressionBuiltinGlobals():
+        return None
+
+    module_name = expression.getImportName()
+
+    if not module_name.isCompileTimeConstant():
+        return None
+
+    module_name = module_name.getCompileTimeConstant()
+
+    if type(module_name) is not str:
+        return None
+
+    import_list = expression.getFromList()
+
+    if import_list is not None:
+        if not import_list.isCompileTimeConstant():
+            return None
+
+        import_list = import_list.getCompileTimeConstant()
+
+        if import_list is not None:
+            if type(import_list) is not tuple or "*" in import_list:
+                return None
+
+            if any(type(import_item) is not str for import_item in import_list):
+                return None
+
+    level = expression.getLevel()
+
+    if level is None:
+        level = 0 if python_version >= 300 else -1
+    elif level.isCompileTimeConstant():
+        level = level.getCompileTimeConstant()
+    else:
+        return None
+
+    if parent_module.isCompiledPythonPackage():
+        parent_package = parent_module.getFullName()
+    elif parent_module.isMainModule():
+        parent_package = None
+    else:
+        parent_package = parent_module.getPackage()
+
+    if level == 0 or (level == -1 and parent_package is None):
+        return module_name if module_name else None
+    elif type(level) is int and level > 0 and parent_package is not None:
+        package_parts = parent_package.split(".")
+
+        if level > len(package_parts):
+            return None
+
+        package_parts = package_parts[: len(package_parts) - level + 1]
+
+        if module_name:
+            package_parts.append(module_name)
+
+        return ".".join(package_parts)
+    else:
+        # Python2 implicit relative imports have the name decided at run time.
+        return None
 
 
 # TODO: Maybe use this for other cases too, not just import.
@@ -119,6 +216,54 @@ def _getBuiltinImportCode(
     )
 
 
+def _getCachedBuiltinImportCode(
+    to_name,
+    full_name,
+    module_name,
+    globals_name,
+    locals_name,
+    import_list_name,
+    level_name,
+    needs_check,
+    emit,
+    context,
+):
+    emitLineNumberUpdateCode(emit, context)
+
+    emit(
+        """\
+{
+    static Nuitka_ImportCache cache;
+    %s = IMPORT_MODULE_CACHED( %s, %s, %s, %s, %s, %s, &cache );
+}"""
+        % (
+            to_name,
+            context.getConstantCode(full_name),
+            module_name,
+            globals_name,
+            "Py_None" if locals_name is None else locals_name,
+            "Py_None" if import_list_name is None else import_list_name,
+            "NULL" if level_name is None else level_name,
+        )
+    )
+
+    getErrorExitCode(
+        check_name=to_name,
+        release_names=(
+            module_name,
+            globals_name,
+            locals_name,
+            import_list_name,
+            level_name,
+        ),
+        needs_check=needs_check,
+        emit=emit,
+        context=context,
+    )
+
+    context.addCleanupTempName(to_name)
+
+
 def generateImportModuleHardCode(to_name, expression, emit, context):
     module_name = expression.getModuleName()
     needs_check = expression.mayRaiseException(BaseException)
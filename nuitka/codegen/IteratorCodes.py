@@ -41,18 +41,49 @@ from .templates.CodeTemplatesIterators import (
     template_iterator_check,
     template_loop_break_next,
 )
+from .VariableCodes import getLocalVariableDeclaration
 
 
-def generateBuiltinNext1Code(to_name, expression, emit, context):
-    value_name, = generateChildExpressionsCode(
-        expression=expression, emit=emit, context=context
+def getLoopIteratorDeclaration(iterator, context):
+    """ Declaration of the "for" loop iterator variable used, if any.
+
+        These have no iterator object, "LOOP_ITER_NEXT" is used with them
+        instead of "ITERATOR_NEXT".
+    """
+
+    if not iterator.isExpressionTempVariableRef():
+        return None
+
+    variable_declaration = getLocalVariableDeclaration(
+        context, iterator.getVariable(), iterator.getVariableTrace()
     )
 
+    if variable_declaration.c_type != "nuitka_loop_iter":
+        return None
+
+    return variable_declaration
+
+
+def _getIteratorNextCode(value_name):
+    if value_name.c_type == "nuitka_loop_iter":
+        return "LOOP_ITER_NEXT( &%s )" % value_name
+    else:
+        return "ITERATOR_NEXT( %s )" % value_name
+
+
+def generateBuiltinNext1Code(to_name, expression, emit, context):
+    value_name = getLoopIteratorDeclaration(expression.getValue(), context)
+
+    if value_name is None:
+        value_name, = generateChildExpressionsCode(
+            expression=expression, emit=emit, context=context
+        )
+
     with withObjectCodeTemporaryAssignment(
         to_name, "next_value", expression, emit, context
     ) as result_name:
 
-        emit("%s = %s;" % (result_name, "ITERATOR_NEXT( %s )" % value_name))
+        emit("%s = %s;" % (result_name, _getIteratorNextCode(value_name)))
 
         getErrorExitCode(
             check_name=result_name,
@@ -66,7 +97,7 @@ def generateBuiltinNext1Code(to_name, expression, emit, context):
 
 
 def getBuiltinLoopBreakNextCode(to_name, value, emit, context):
-    emit("%s = %s;" % (to_name, "ITERATOR_NEXT( %s )" % value))
+    emit("%s = %s;" % (to_name, _getIteratorNextCode(value)))
 
     getReleaseCode(release_name=value, emit=emit, context=context)
 
@@ -60,35 +60,44 @@ def getModuleMetapathLoaderEntryCode(
 stream_data = ConstantCodes.stream_data
 
 
+def _getMetapathLoaderBytecodeEntryCode(module):
+    code_data = module.getByteCode()
+    is_package = module.isUncompiledPythonPackage()
+
+    flags = ["NUITKA_BYTECODE_FLAG"]
+    if is_package:
+        flags.append("NUITKA_PACKAGE_FLAG")
+
+    return template_metapath_loader_bytecode_module_entry % {
+        "module_name": module.getFullName(),
+        "bytecode": stream_data.getStreamDataOffset(code_data),
+        "size": len(code_data),
+        "flags": " | ".join(flags),
+    }
+
+
 def getMetapathLoaderBodyCode(other_modules):
     metapath_loader_inittab = []
     metapath_module_decls = []
 
     for other_module in other_modules:
         if other_module.isUncompiledPythonModule():
-            code_data = other_module.getByteCode()
-            is_package = other_module.isUncompiledPythonPackage()
-
-            flags = ["NUITKA_BYTECODE_FLAG"]
-            if is_package:
-                flags.append("NUITKA_PACKAGE_FLAG")
-
             metapath_loader_inittab.append(
-                template_metapath_loader_bytecode_module_entry
-                % {
-                    "module_name": other_module.getFullName(),
-                    "bytecode": stream_data.getStreamDataOffset(code_data),
-                    "size": len(code_data),
-                    "flags": " | ".join(flags),
-                }
+                (
+                    other_module.getFullName(),
+                    _getMetapathLoaderBytecodeEntryCode(other_module),
+                )
             )
         else:
             metapath_loader_inittab.append(
-                getModuleMetapathLoaderEntryCode(
-                    module_name=other_module.getFullName(),
-                    module_identifier=other_module.getCodeName(),
-                    is_shlib=other_module.isPythonShlibModule(),
-                    is_package=other_module.isCompiledPythonPackage(),
+                (
+                    other_module.getFullName(),
+                    getModuleMetapathLoaderEntryCode(
+                        module_name=other_module.getFullName(),
+                        module_identifier=other_module.getCodeName(),
+                        is_shlib=other_module.isPythonShlibModule(),
+                        is_package=other_module.isCompiledPythonPackage(),
+                    ),
                 )
             )
 
@@ -98,24 +107,27 @@ def getMetapathLoaderBodyCode(other_modules):
             )
 
     for uncompiled_module in getUncompiledNonTechnicalModules():
-        code_data = uncompiled_module.getByteCode()
-        is_package = uncompiled_module.isUncompiledPythonPackage()
-
-        flags = ["NUITKA_BYTECODE_FLAG"]
-        if is_package:
-            flags.append("NUITKA_PACKAGE_FLAG")
-
         metapath_loader_inittab.append(
-            template_metapath_loader_bytecode_module_entry
-            % {
-                "module_name": uncompiled_module.getFullName(),
-                "bytecode": stream_data.getStreamDataOffset(code_data),
-                "size": len(code_data),
-                "flags": " | ".join(flags),
-            }
+            (
+                uncompiled_module.getFullName(),
+                _getMetapathLoaderBytecodeEntryCode(uncompiled_module),
+            )
         )
 
+    # The loader does a binary search for module names, so the table must be
+    # sorted in the byte order that "strcmp" uses, which for the UTF-8 encoded
+    # names is the same as the code point order. The sort is stable, so for
+    # duplicate names, the first entry is kept.
+    metapath_loader_inittab.sort(key=lambda entry: entry[0])
+
+    metapath_loader_entries = []
+    for count, (module_name, entry_code) in enumerate(metapath_loader_inittab):
+        if count > 0 and metapath_loader_inittab[count - 1][0] == module_name:
+            continue
+
+        metapath_loader_entries.append(entry_code)
+
     return template_metapath_loader_body % {
         "metapath_module_decls": indented(metapath_module_decls, 0),
-        "metapath_loader_inittab": indented(metapath_loader_inittab),
+        "metapath_loader_inittab": indented(metapath_loader_entries),
     }
@@ -0,0 +1,415 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Persistent cache of generated module code.
+
+Generating the C code of a module only depends on the optimized module tree,
+the variable traces found for it, and some options. This hashes all of these,
+and stores the prepared module code under that key in the cache directory, so
+that later compilations can reuse it for unchanged modules.
+
+Besides the code, the module has effects on global code generation state. It
+uses constants, quick call helpers, and values in the constants stream. These
+are recorded, and replayed when the code is reused. The same is done for code
+generated in worker processes, see "ModuleCodeWorkers".
+"""
+
+import hashlib
+import marshal
+import os
+import pickle
+import re
+import sys
+from io import BytesIO
+
+from nuitka import Options
+from nuitka.__past__ import intern  # pylint: disable=I0021,redefined-builtin
+from nuitka.Builtins import (
+    builtin_anon_names,
+    builtin_anon_value_list,
+    builtin_anon_values,
+)
+from nuitka.utils.AppDirs import getCacheDir
+from nuitka.utils.FileOperations import makePath
+from nuitka.Version import getNuitkaVersion
+
+from . import CallCodes
+from .ConstantCodes import stream_data
+
+# Statistics, for reporting the effectiveness of the cache.
+cache_hits = 0
+cache_misses = 0
+
+
+def _getCacheDirectory():
+    result = os.path.join(getCacheDir(), "module_codes")
+
+    makePath(result)
+
+    return result
+
+
+def _getOptionsDescription():
+    return repr(
+        (
+            Options.isDebug(),
+            Options.isPythonDebug(),
+            Options.isFullCompat(),
+            Options.isStandaloneMode(),
+            Options.shallMakeModule(),
+            Options.shallTraceExecution(),
+            Options.getFileReferenceMode(),
+            sorted(Options.getExperimentalIndications()),
+            sorted(Options.getPythonFlags()),
+        )
+    )
+
+
+def _getTracesDescription(owner):
+    result = []
+
+    for (variable, version), variable_trace in sorted(
+        owner.trace_collection.getVariableTracesAll().items(),
+        key=lambda item: (repr(item[0][0]), item[0][1]),
+    ):
+        result.append(
+            (
+                repr(variable),
+                version,
+                variable_trace.__class__.__name__,
+                variable_trace.mustHaveValue(),
+                variable_trace.mustNotHaveValue(),
+                not variable.isLocalsDictVariable()
+                and variable.isSharedTechnically(),
+                sorted(shape.__name__ for shape in variable.getTypeShapes()),
+            )
+        )
+
+    return repr(result)
+
+
+def getModuleCodeCacheKey(module):
+    """ Hash everything that the generated code of a module depends on.
+
+    """
+
+    hash_value = hashlib.md5()
+
+    def _update(value):
+        if type(value) is not bytes:
+            value = value.encode("utf8")
+
+        hash_value.update(value)
+
+    _update(getNuitkaVersion())
+    _update(sys.version + sys.executable)
+    _update(_getOptionsDescription())
+
+    _update(
+        repr(
+            (
+                module.getFullName(),
+                module.getCodeName(),
+                module.getCompileTimeFilename(),
+                module.isMainModule(),
+                module.isTopModule(),
+                module.isInternalModule(),
+                module.isCompiledPythonPackage(),
+            )
+        )
+    )
+
+    source_filename = module.getCompileTimeFilename()
+    if os.path.isfile(source_filename):
+        with open(source_filename, "rb") as source_file:
+            hash_value.update(source_file.read())
+
+    _update(module.asXmlText())
+    _update(_getTracesDescription(module))
+
+    for function_body in sorted(
+        module.getUsedFunctions(), key=lambda function: function.getCodeName()
+    ):
+        _update(function_body.asXmlText())
+        _update(_getTracesDescription(function_body))
+
+    _update(
+        repr(
+            sorted(
+                function_body.getCodeName()
+                for function_body in module.getCrossUsedFunctions()
+            )
+        )
+    )
+
+    return hash_value.hexdigest()
+
+
+class ModuleCodeRecording(object):
+    """ Record the effects on global state of generating code for a module.
+
+    """
+
+    __slots__ = ("quick_calls_used", "stream_values")
+
+    def __init__(self):
+        self.quick_calls_used = CallCodes.getQuickCallsUsed()
+        CallCodes.setQuickCallsUsed(set(), set())
+
+        self.stream_values = None
+        stream_data.startRecording()
+
+    def finish(self):
+        old_calls_used, old_instance_calls_used = self.quick_calls_used
+
+        calls_used, instance_calls_used = CallCodes.getQuickCallsUsed()
+        self.quick_calls_used = calls_used, instance_calls_used
+
+        CallCodes.setQuickCallsUsed(
+            old_calls_used | calls_used, old_instance_calls_used | instance_calls_used
+        )
+
+        self.stream_values = stream_data.stopRecording()
+
+
+# Type codes of "marshal" for interned strings.
+_marshal_interned_types = frozenset(bytearray(b"tAZ"))
+
+
+def _isInternedString(value):
+    # Interning a string to check it would change it, but "marshal" tells.
+    return bytearray(marshal.dumps(value))[0] & 0x7F in _marshal_interned_types
+
+
+class _PersistentIds(object):
+    """ Persistent IDs for values that cannot be pickled as they are.
+
+    """
+
+    __slots__ = ("interned_value",)
+
+    def __init__(self):
+        # The interned string just given an ID, as that is pickled next.
+        self.interned_value = None
+
+    def __call__(self, value):
+        # Anonymous built-in values like the function type cannot be pickled,
+        # so we store them by name.
+        for anon_value in builtin_anon_value_list:
+            if value is anon_value:
+                return builtin_anon_values[anon_value]
+
+        if type(value) is str:
+            if value is self.interned_value:
+                self.interned_value = None
+                return None
+
+            # Interned strings need to be interned again, as "marshal" of
+            # constants tells them apart.
+            if _isInternedString(value):
+                self.interned_value = value
+                return (value,)
+
+        return None
+
+
+def _loadPersistentId(persistent_id):
+    if type(persistent_id) is tuple:
+        return intern(persistent_id[0])
+
+    return builtin_anon_names[persistent_id]
+
+
+def getModuleCodeData(template_values, context, recording):
+    """ Get the prepared code of a module with its effects on global state.
+
+        The result can be replayed with "replayModuleCode" into another
+        module context, also in another process.
+    """
+    global_constants = context.global_context.getConstants()
+
+    return {
+        "template_values": template_values,
+        # Only named constants matter, others are built-in values, that have
+        # no declarations or init code.
+        "constants": sorted(
+            (constant_identifier, global_constants[constant_identifier])
+            for constant_identifier in context.getConstants()
+            if constant_identifier.startswith("const_")
+        ),
+        "needs_module_filename_object": context.needsModuleFilenameObject(),
+        "quick_calls_used": recording.quick_calls_used,
+        "stream_values": recording.stream_values,
+    }
+
+
+def _dumpModuleCodeData(module_code_data, output_file):
+    pickler = pickle.Pickler(output_file, pickle.HIGHEST_PROTOCOL)
+    pickler.persistent_id = _PersistentIds()
+    pickler.dump(module_code_data)
+
+
+def _loadModuleCodeData(input_file):
+    unpickler = pickle.Unpickler(input_file)
+    unpickler.persistent_load = _loadPersistentId
+    return unpickler.load()
+
+
+def pickleModuleCodeData(module_code_data):
+    """ Pickle module code data to bytes, "None" if that is not possible. """
+
+    output_file = BytesIO()
+
+    try:
+        _dumpModuleCodeData(module_code_data, output_file)
+    except Exception:  # Not all constant values can be pickled, pylint: disable=broad-except
+        return None
+
+    return output_file.getvalue()
+
+
+def unpickleModuleCodeData(data):
+    return _loadModuleCodeData(BytesIO(data))
+
+
+def storeModuleCode(cache_key, template_values, context, recording):
+    storeModuleCodeData(
+        cache_key, getModuleCodeData(template_values, context, recording)
+    )
+
+
+def storeModuleCodeData(cache_key, module_code_data):
+    cache_filename = os.path.join(_getCacheDirectory(), cache_key)
+
+    # Write to a temporary file first, so concurrent compilations do not see
+    # partial results.
+    tmp_filename = "%s.%d.tmp" % (cache_filename, os.getpid())
+
+    try:
+        with open(tmp_filename, "wb") as cache_file:
+            _dumpModuleCodeData(module_code_data, cache_file)
+    except Exception:  # Not all constant values can be pickled, pylint: disable=broad-except
+        os.unlink(tmp_filename)
+        return
+
+    try:
+        os.rename(tmp_filename, cache_filename)
+    except OSError:
+        # On Windows, renaming over an existing file fails, but then another
+        # compilation stored the same code already.
+        os.unlink(tmp_filename)
+
+
+def loadModuleCodeData(cache_key):
+    """ Load cached module code data, "None" if nothing is cached. """
+
+    cache_filename = os.path.join(_getCacheDirectory(), cache_key)
+
+    try:
+        with open(cache_filename, "rb") as cache_file:
+            return _loadModuleCodeData(cache_file)
+    except Exception:  # Missing or unusable, pylint: disable=broad-except
+        return None
+
+
+_stream_code_re = re.compile(r"&constant_bin\[ (\d+) \]")
+
+
+def restoreModuleCode(cache_key, context):
+    """ Restore cached module code into a fresh module context.
+
+        Returns the template values, or "None" if nothing usable was
+        cached.
+    """
+    # pylint: disable=global-statement
+    global cache_hits, cache_misses
+
+    module_code_data = loadModuleCodeData(cache_key)
+
+    if module_code_data is None:
+        cache_misses += 1
+        return None
+
+    template_values = replayModuleCode(module_code_data, context)
+
+    if template_values is None:
+        cache_misses += 1
+    else:
+        cache_hits += 1
+
+    return template_values
+
+
+def isReplayableModuleCode(module_code_data, global_context):
+    # The constant names must come out the same in this process, or else the
+    # code is not usable.
+    for constant_identifier, constant_value in module_code_data["constants"]:
+        if global_context.getConstantKey(constant_value) != constant_identifier:
+            return False
+
+    return True
+
+
+def replayModuleCode(module_code_data, context):
+    """ Replay module code data into a fresh module context.
+
+        Returns the template values, or "None" if the data is not usable
+        in this process, then the context is unchanged.
+    """
+
+    global_context = context.global_context
+
+    if not isReplayableModuleCode(module_code_data, global_context):
+        return None
+
+    for _constant_identifier, constant_value in module_code_data["constants"]:
+        context.getConstantCode(constant_value)
+
+    # Force internal module to not need constants init, like done when
+    # creating the code.
+    if context.getOwner().isInternalModule():
+        for constant_identifier in context.getConstants():
+            global_context.countConstantUse(constant_identifier)
+            global_context.markStartupConstant(constant_identifier)
+
+    if module_code_data["needs_module_filename_object"]:
+        context.markAsNeedsModuleFilenameObject()
+
+    calls_used, instance_calls_used = module_code_data["quick_calls_used"]
+    old_calls_used, old_instance_calls_used = CallCodes.getQuickCallsUsed()
+    CallCodes.setQuickCallsUsed(
+        old_calls_used | calls_used, old_instance_calls_used | instance_calls_used
+    )
+
+    # Translate offsets into the constants stream of this compilation.
+    stream_offsets = {}
+    for value, offset in module_code_data["stream_values"]:
+        stream_offsets[offset] = stream_data.getStreamDataOffset(value)
+
+    def _replaceStreamOffset(match):
+        return "&constant_bin[ %d ]" % stream_offsets[int(match.group(1))]
+
+    template_values = module_code_data["template_values"]
+
+    if stream_offsets:
+        for key, value in template_values.items():
+            if type(value) is str:
+                template_values[key] = _stream_code_re.sub(
+                    _replaceStreamOffset, value
+                )
+
+    return template_values
@@ -0,0 +1,134 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Generate the code of modules in parallel worker processes.
+
+The workers are forked after optimization, so they have the module trees and
+the global code generation state already. Each one prepares the code of a
+share of the modules, recording the effects of every module on global state
+like the module code cache does, and passes them back. These are replayed in
+module order, so the result is the same as preparing the modules one after
+another.
+
+Modules that cannot be done in a worker, e.g. because constant values cannot
+be pickled, are left to be done normally.
+"""
+
+import multiprocessing
+
+from nuitka import Options
+
+from . import CodeGeneration, ModuleCodeCache, Reports
+
+# Set in the parent before forking, the workers inherit it.
+_global_context = None
+_worker_modules = None
+
+
+def _prepareModuleCodeDataInWorker(module_index):
+    module = _worker_modules[module_index]
+
+    try:
+        module_code_data, from_cache = CodeGeneration.prepareModuleCodeData(
+            global_context=_global_context,
+            module=module,
+            module_name=module.getFullName(),
+        )
+    except Exception:  # Redone in the parent, to report it there, pylint: disable=broad-except
+        return None
+
+    pickled_data = ModuleCodeCache.pickleModuleCodeData(module_code_data)
+
+    if pickled_data is None:
+        return None
+
+    # Constants that do not come out the same after pickling are left to the
+    # parent too, this one has the same state.
+    if not ModuleCodeCache.isReplayableModuleCode(
+        ModuleCodeCache.unpickleModuleCodeData(pickled_data), _global_context
+    ):
+        return None
+
+    return pickled_data, from_cache, Reports.getMissingHelpers()
+
+
+def _getForkContext():
+    # The workers must be forked, to inherit the module trees.
+    if hasattr(multiprocessing, "get_context"):
+        return multiprocessing.get_context("fork")
+    else:
+        # Python2 has only this, and always forks where "fork" exists.
+        return multiprocessing
+
+
+def prepareModuleCodesInWorkers(global_context, modules):
+    """ Prepare the code of modules in worker processes.
+
+        Returns a dictionary of module code data, to be given to
+        "prepareModuleCode" for each module.
+    """
+    # Singleton, pylint: disable=global-statement
+    global _global_context, _worker_modules
+
+    modules = tuple(modules)
+
+    if not modules:
+        return {}
+
+    _global_context = global_context
+    _worker_modules = modules
+
+    job_limit = min(Options.getCodeGenerationJobLimit(), len(modules))
+
+    # Workers do several modules each, as forking for every module costs more
+    # than generating the code of most. The recorded effects of a module do not
+    # depend on the modules done before in the same worker, just like the ones
+    # from the module code cache do not. Small chunks keep the workers busy
+    # until the end, even if module sizes differ a lot.
+    chunk_size = max(1, len(modules) // (job_limit * 4))
+
+    pool = _getForkContext().Pool(processes=job_limit)
+
+    try:
+        results = pool.map(
+            _prepareModuleCodeDataInWorker, range(len(modules)), chunk_size
+        )
+    finally:
+        pool.terminate()
+        pool.join()
+
+        _global_context = None
+        _worker_modules = None
+
+    result = {}
+
+    for module, module_result in zip(modules, results):
+        if module_result is None:
+            continue
+
+        module_code_data, from_cache, missing_helpers = module_result
+
+        result[module] = ModuleCodeCache.unpickleModuleCodeData(module_code_data)
+
+        if from_cache:
+            ModuleCodeCache.cache_hits += 1
+        elif Options.shallCacheModuleCode():
+            ModuleCodeCache.cache_misses += 1
+
+        Reports.addMissingHelpers(missing_helpers)
+
+    return result
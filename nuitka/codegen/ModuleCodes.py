@@ -126,10 +126,12 @@ def getModuleValues(
     allocateNestedConstants(context)
 
     # Force internal module to not need constants init, by making all its
-    # constants be shared.
+    # constants be shared, and created at startup, as its functions are used
+    # by other modules.
     if is_internal_module:
         for constant in context.getConstants():
             context.global_context.countConstantUse(constant)
+            context.global_context.markStartupConstant(constant)
 
     return module_body_template_values
 
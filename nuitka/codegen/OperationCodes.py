@@ -154,6 +154,35 @@ _iadd_helpers_set = set(
 )
 
 
+def _makeSpecializedHelperSets(suffix):
+    result = {}
+
+    for operator, (
+        helper_name,
+        type_names,
+    ) in OperatorCodes.specialized_binary_operators.items():
+        helpers = set()
+
+        for type_name in type_names:
+            for left_type, right_type in (
+                (type_name, type_name),
+                ("OBJECT", type_name),
+                (type_name, "OBJECT"),
+            ):
+                helpers.add(
+                    "BINARY_OPERATION_%s_%s_%s%s"
+                    % (helper_name, left_type, right_type, suffix)
+                )
+
+        result[operator] = helpers
+
+    return result
+
+
+_specialized_helpers_sets = _makeSpecializedHelperSets("")
+_specialized_inplace_helpers_sets = _makeSpecializedHelperSets("_INPLACE")
+
+
 def _getBinaryOperationCode(
     to_name, expression, operator, arg_names, in_place, emit, context
 ):
@@ -210,6 +239,35 @@ def _getBinaryOperationCode(
     else:
         assert False, operator
 
+    # Use type specialized helpers where the shapes allow it, otherwise the
+    # generic ones picked above.
+    if in_place:
+        specialized_operator = operator[1:]
+        specialized_helpers = _specialized_inplace_helpers_sets.get(
+            specialized_operator
+        )
+        suffix = "_INPLACE"
+    else:
+        specialized_operator = operator
+        specialized_helpers = _specialized_helpers_sets.get(specialized_operator)
+        suffix = ""
+
+    if specialized_helpers is not None:
+        specialized_helper = pickCodeHelper(
+            prefix="BINARY_OPERATION_%s"
+            % OperatorCodes.specialized_binary_operators[specialized_operator][0],
+            suffix=suffix,
+            left_shape=left.getTypeShape(),
+            right_shape=expression.getRight().getTypeShape(),
+            helpers=specialized_helpers,
+            # TODO: Too many for now, so disable it
+            warn_missing=False,
+        )
+
+        if specialized_helper in specialized_helpers:
+            helper = specialized_helper
+            prefix_args = ()
+
     # We must assume to write to a variable is "in_place" is active, not e.g.
     # a constant reference. That was asserted before calling us.
     if in_place:
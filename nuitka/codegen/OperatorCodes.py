@@ -37,7 +37,8 @@ binary_operator_codes = {
     # but the CPython code is not in-lined.
     #    "Pow"       : "PyNumber_Power",
     #    "IPow"      : "PyNumber_InPlacePower",
-    # The others are generic code and would be faster if they had a specialized variant too.
+    # The others are generic code, but for known types, there are specialized
+    # variants of many, see below.
     "LShift": "PyNumber_Lshift",
     "RShift": "PyNumber_Rshift",
     "BitAnd": "PyNumber_And",
@@ -57,6 +58,33 @@ binary_operator_codes = {
     "IBitXor": "PyNumber_InPlaceXor",
 }
 
+# Operators that have type specialized helpers, named e.g.
+# "BINARY_OPERATION_SUB_INT_OBJECT" after the "helper_code" of the type shapes,
+# with the types these exist for. In-place operators use the same ones, with
+# an "_INPLACE" suffix. The C code of these is generated by the tool
+# "nuitka.tools.specialize", run it after changing this.
+specialized_binary_operators = {
+    "Sub": ("SUB", ("INT", "LONG", "FLOAT")),
+    "Mult": ("MUL", ("INT", "LONG", "FLOAT")),
+    "Div": ("DIV", ("INT", "LONG", "FLOAT")),
+    "FloorDiv": ("FLOORDIV", ("INT", "LONG", "FLOAT")),
+    "TrueDiv": ("TRUEDIV", ("INT", "LONG", "FLOAT")),
+    "Mod": ("REMAINDER", ("INT", "LONG", "FLOAT")),
+    "Pow": ("POW", ("INT", "LONG", "FLOAT")),
+    "LShift": ("LSHIFT", ("INT", "LONG")),
+    "RShift": ("RSHIFT", ("INT", "LONG")),
+    "BitAnd": ("BITAND", ("INT", "LONG")),
+    "BitOr": ("BITOR", ("INT", "LONG")),
+    "BitXor": ("BITXOR", ("INT", "LONG")),
+}
+
+# Types that have type specialized rich comparison helpers, named e.g.
+# "RICH_COMPARE_LT_LONG_OBJECT", and "RICH_COMPARE_BOOL_LT_LONG_OBJECT" for a
+# C bool result. These exist for Python3 only, where these types have no
+# "__cmp__" to consider. The C code of these is generated by the tool
+# "nuitka.tools.specialize" too.
+specialized_comparison_types = ("LONG", "FLOAT", "UNICODE", "BYTES", "TUPLE")
+
 # Python 3.5 only operator
 if python_version >= 350:
     binary_operator_codes["MatMult"] = "PyNumber_MatrixMultiply"
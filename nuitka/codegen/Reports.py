@@ -49,3 +49,14 @@ def onMissingHelper(helper_name):
 
 def onMissingOperation(*args):
     _missing_operations.add(args)
+
+
+def getMissingHelpers():
+    return tuple(_missing_helpers)
+
+
+def addMissingHelpers(missing_helpers):
+    """ Add missing helpers, e.g. from code generation in another process. """
+
+    for helper in missing_helpers:
+        _missing_helpers.add(helper)
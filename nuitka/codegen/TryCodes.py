@@ -27,7 +27,10 @@ from nuitka import Options
 from .CodeHelpers import generateExpressionCode, generateStatementSequenceCode
 from .ErrorCodes import getMustNotGetHereCode
 from .ExceptionCodes import getExceptionUnpublishedReleaseCode
-from .IteratorCodes import getBuiltinLoopBreakNextCode
+from .IteratorCodes import (
+    getBuiltinLoopBreakNextCode,
+    getLoopIteratorDeclaration,
+)
 from .LabelCodes import getGotoCode, getLabelCode
 from .VariableCodes import getVariableAssignmentCode
 
@@ -297,14 +300,17 @@ def generateTryNextExceptStopIterationCode(statement, emit, context):
     if not no_statements[0].isStatementReraiseException():
         return False
 
-    tmp_name = context.allocateTempName("next_source")
+    tmp_name = getLoopIteratorDeclaration(assign_source.getValue(), context)
 
-    generateExpressionCode(
-        expression=assign_source.getValue(),
-        to_name=tmp_name,
-        emit=emit,
-        context=context,
-    )
+    if tmp_name is None:
+        tmp_name = context.allocateTempName("next_source")
+
+        generateExpressionCode(
+            expression=assign_source.getValue(),
+            to_name=tmp_name,
+            emit=emit,
+            context=context,
+        )
 
     tmp_name2 = context.allocateTempName("assign_source")
 
@@ -21,20 +21,30 @@
 
 from nuitka.nodes.shapes.BuiltinTypeShapes import (
     ShapeTypeBool,
+    ShapeTypeDict,
     ShapeTypeInt,
     ShapeTypeIntOrLong,
+    ShapeTypeList,
     ShapeTypeLong,
+    ShapeTypeTuple,
+    ShapeTypeXrange,
 )
 from nuitka.PythonVersions import python_version
 
+from .c_types.CTypeNuitkaLoopIterators import CTypeNuitkaLoopIterator
 from .c_types.CTypePyObjectPtrs import (
     CTypeCellObject,
     CTypePyObjectPtr,
     CTypePyObjectPtrPtr,
 )
-from .CodeHelpers import decideConversionCheckNeeded, generateExpressionCode
+from .CodeHelpers import (
+    decideConversionCheckNeeded,
+    generateChildExpressionsCode,
+    generateExpressionCode,
+)
 from .ErrorCodes import (
     getAssertionCode,
+    getErrorExitBoolCode,
     getLocalVariableReferenceErrorCode,
     getNameReferenceErrorCode,
 )
@@ -62,12 +72,28 @@ def generateAssignmentVariableCode(statement, emit, context):
             and variable_declaration.c_type == "nuitka_bool"
         ):
             tmp_name = context.allocateTempName("assign_source", "nuitka_bool")
-        elif (
-            source_shape is ShapeTypeIntOrLong
-            and variable_declaration.c_type == "nuitka_ilong"
+        elif variable_declaration.c_type == "nuitka_ilong" and _isIntOrLongUpdate(
+            variable, assign_source
         ):
+            _getIntOrLongUpdateCode(
+                variable=variable,
+                variable_declaration=variable_declaration,
+                assign_source=assign_source,
+                emit=emit,
+                context=context,
+            )
 
-            tmp_name = context.allocateTempName("assign_source", "nuitka_ilong")
+            return
+        elif variable_declaration.c_type == "nuitka_loop_iter":
+            _getLoopIteratorAssignCode(
+                variable_declaration=variable_declaration,
+                assign_source=assign_source,
+                needs_release=statement.needsReleasePreviousValue(),
+                emit=emit,
+                context=context,
+            )
+
+            return
         else:
             tmp_name = context.allocateTempName("assign_source")
 
@@ -89,6 +115,135 @@ def generateAssignmentVariableCode(statement, emit, context):
     assert not context.needsCleanup(tmp_name)
 
 
+_ilong_update_helpers = {
+    "Add": "ILONG_ADD_OBJECT_INPLACE",
+    "IAdd": "ILONG_ADD_OBJECT_INPLACE",
+    "Sub": "ILONG_SUB_OBJECT_INPLACE",
+    "ISub": "ILONG_SUB_OBJECT_INPLACE",
+}
+
+
+def _isIntOrLongUpdate(variable, assign_source):
+    """ Decide if the assignment only adds to or subtracts from the variable.
+
+        These can be done on the C value of "nuitka_ilong" variables, if
+        the variable is known to be assigned.
+    """
+
+    if not assign_source.isExpressionOperationBinary():
+        return False
+
+    if assign_source.getOperator() not in _ilong_update_helpers:
+        return False
+
+    left = assign_source.getLeft()
+
+    return (
+        (left.isExpressionVariableRef() or left.isExpressionTempVariableRef())
+        and left.getVariable() is variable
+        and not left.mayRaiseException(BaseException)
+    )
+
+
+def _getIntOrLongUpdateCode(
+    variable, variable_declaration, assign_source, emit, context
+):
+    operand_name = context.allocateTempName("ilong_operand")
+
+    generateExpressionCode(
+        to_name=operand_name,
+        expression=assign_source.getRight(),
+        emit=emit,
+        context=context,
+    )
+
+    if variable.isLocalVariable():
+        context.setVariableType(variable, variable_declaration)
+
+    old_source_ref = context.setCurrentSourceCodeReference(
+        assign_source.getSourceReference()
+    )
+
+    res_name = context.getBoolResName()
+
+    emit(
+        "%s = %s( &%s, %s );"
+        % (
+            res_name,
+            _ilong_update_helpers[assign_source.getOperator()],
+            variable_declaration,
+            operand_name,
+        )
+    )
+
+    getErrorExitBoolCode(
+        condition="%s == false" % res_name,
+        release_name=operand_name,
+        needs_check=assign_source.mayRaiseExceptionOperation(),
+        emit=emit,
+        context=context,
+    )
+
+    context.setCurrentSourceCodeReference(old_source_ref)
+
+
+def _getLoopIteratorAssignCode(
+    variable_declaration, assign_source, needs_release, emit, context
+):
+    value = assign_source.getValue()
+
+    if (
+        value.isExpressionBuiltinXrange1()
+        or value.isExpressionBuiltinXrange2()
+        or value.isExpressionBuiltinXrange3()
+    ):
+        # The range object is not created, unless its values are not usable.
+        arg_names = generateChildExpressionsCode(
+            expression=value, emit=emit, context=context
+        )
+
+        init_code = "INIT_LOOP_ITER_XRANGE%d( &%s, %s )" % (
+            len(arg_names),
+            variable_declaration,
+            ", ".join(str(arg_name) for arg_name in arg_names),
+        )
+    else:
+        value_name = context.allocateTempName("loop_iterated")
+
+        generateExpressionCode(
+            to_name=value_name, expression=value, emit=emit, context=context
+        )
+
+        arg_names = (value_name,)
+
+        init_code = "INIT_LOOP_ITER( &%s, %s )" % (variable_declaration, value_name)
+
+    old_source_ref = context.setCurrentSourceCodeReference(
+        value.getCompatibleSourceReference()
+    )
+
+    if needs_release is False:
+        emit(
+            "assert( %s.kind == NUITKA_LOOP_ITER_UNASSIGNED );" % variable_declaration
+        )
+    else:
+        emit("RELEASE_LOOP_ITER( &%s );" % variable_declaration)
+
+    res_name = context.getBoolResName()
+
+    emit("%s = %s;" % (res_name, init_code))
+
+    getErrorExitBoolCode(
+        condition="%s == false" % res_name,
+        release_names=arg_names,
+        needs_check=assign_source.mayRaiseException(BaseException),
+        emit=emit,
+        context=context,
+    )
+
+    context.setCurrentSourceCodeReference(old_source_ref)
+
+
 def generateDelVariableCode(statement, emit, context):
     old_source_ref = context.setCurrentSourceCodeReference(
         statement.getSourceReference()
@@ -169,6 +324,19 @@ def generateVariableReferenceCode(to_name, expression, emit, context):
     )
 
 
+def getVariableReferenceCType(expression, context):
+    """ The C type of the variable read by a variable reference. """
+
+    variable = expression.getVariable()
+
+    if variable.isModuleVariable():
+        return CTypePyObjectPtr
+
+    return getLocalVariableDeclaration(
+        context, variable, expression.getVariableTrace()
+    ).getCType()
+
+
 def _getVariableCodeName(in_context, variable):
     if in_context:
         # Closure case:
@@ -181,6 +349,33 @@ def _getVariableCodeName(in_context, variable):
         return "var_" + variable.getCodeName()
 
 
+# Shapes of values, for which "for" loops do not need an iterator object.
+_loop_iterated_shapes = (ShapeTypeList, ShapeTypeTuple, ShapeTypeDict, ShapeTypeXrange)
+
+
+def _isLoopIteratorVariable(variable):
+    """ Decide if a variable holds only the iterator of a "for" loop.
+
+        These are assigned once, and only used by the loop, so for iterated
+        values of known shapes, the iteration can be done in C.
+    """
+
+    if not variable.isTempVariable():
+        return False
+
+    # Generator expressions take their iterator from outside.
+    if variable.hasAccessesOutsideOf(variable.getEntryPoint()):
+        return False
+
+    assign_source = variable.getSingleAssignSource()
+
+    return (
+        assign_source is not None
+        and assign_source.isExpressionBuiltinIterForLoop()
+        and assign_source.getValue().getTypeShape() in _loop_iterated_shapes
+    )
+
+
 def getPickedCType(variable, context):
     """ Return type to use for specific context. """
 
@@ -192,6 +387,8 @@ def getPickedCType(variable, context):
     if owner is user:
         if variable.isSharedTechnically():
             result = CTypeCellObject
+        elif _isLoopIteratorVariable(variable):
+            result = CTypeNuitkaLoopIterator
         else:
             shapes = variable.getTypeShapes()
 
@@ -24,6 +24,7 @@ from contextlib import contextmanager
 from .c_types.CTypeModuleDictVariables import CTypeModuleDictVariable
 from .c_types.CTypeNuitkaBools import CTypeNuitkaBoolEnum
 from .c_types.CTypeNuitkaInts import CTypeNuitkaIntOrLongStruct
+from .c_types.CTypeNuitkaLoopIterators import CTypeNuitkaLoopIterator
 from .c_types.CTypePyObjectPtrs import (
     CTypeCellObject,
     CTypePyObjectPtr,
@@ -100,6 +101,8 @@ class VariableDeclaration(object):
             return CTypeNuitkaBoolEnum
         elif c_type == "nuitka_ilong":
             return CTypeNuitkaIntOrLongStruct
+        elif c_type == "nuitka_loop_iter":
+            return CTypeNuitkaLoopIterator
         elif c_type == "module_var":
             return CTypeModuleDictVariable
         elif c_type == "void":
@@ -143,20 +146,29 @@ class VariableStorage(object):
         self.exception_variable_declarations = None
 
     @contextmanager
-    def withLocalStorage(self):
+    def withLocalStorage(self, preserved):
         """ Local storage for only just during context usage.
 
             This is for automatic removal of that scope. These are supposed
             to be nestable eventually.
 
+            For preserved storage, the values must survive a yield. With a
+            heap, these are put there, so they need not be copied back and
+            forth when yielding.
         """
 
-        self.variable_declarations_locals.append([])
+        if preserved and self.heap_name is not None:
+            self.variable_declarations_locals.append(None)
+        else:
+            self.variable_declarations_locals.append([])
 
         yield
 
         self.variable_declarations_locals.pop()
 
+    def hasHeapStorage(self):
+        return self.heap_name is not None
+
     def getVariableDeclarationTop(self, code_name):
         for variable_declaration in self.variable_declarations_main:
             if variable_declaration.code_name == code_name:
@@ -205,9 +217,14 @@ class VariableStorage(object):
         return self.exception_variable_declarations
 
     def addVariableDeclarationLocal(self, c_type, code_name):
-        result = VariableDeclaration(c_type, code_name, None, None)
+        if self.variable_declarations_locals[-1] is None:
+            result = VariableDeclaration(c_type, code_name, None, self.heap_name)
 
-        self.variable_declarations_locals[-1].append(result)
+            self.variable_declarations_heap.append(result)
+        else:
+            result = VariableDeclaration(c_type, code_name, None, None)
+
+            self.variable_declarations_locals[-1].append(result)
 
         return result
 
@@ -236,6 +253,9 @@ class VariableStorage(object):
         return result
 
     def makeCLocalDeclarations(self):
+        if self.variable_declarations_locals[-1] is None:
+            return []
+
         return [
             variable_declaration.makeCFunctionLevelDeclaration()
             for variable_declaration in self.variable_declarations_locals[-1]
@@ -252,6 +272,7 @@ class VariableStorage(object):
         result = []
 
         for variable_declarations_local in self.variable_declarations_locals:
-            result.extend(variable_declarations_local)
+            if variable_declarations_local is not None:
+                result.extend(variable_declarations_local)
 
         return result
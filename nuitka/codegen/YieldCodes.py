@@ -42,7 +42,7 @@ def _getYieldPreserveCode(
         value_names = (value_name,)
 
     for name in value_names:
-        if not context.needsCleanup(name):
+        if not context.needsCleanup(name) and name in locals_preserved:
             locals_preserved.remove(name)
 
     # Target name is not assigned, no need to preserve it.
@@ -27,7 +27,9 @@ from nuitka.codegen.templates.CodeTemplatesVariables import (
     template_del_global_known,
     template_del_global_unclear,
     template_read_mvar_unclear,
+    template_read_mvar_unclear_cached,
 )
+from nuitka.PythonVersions import python_version
 
 from .CTypeBases import CTypeBase
 
@@ -68,8 +70,13 @@ class CTypeModuleDictVariable(CTypeBase):
     def emitValueAccessCode(cls, value_name, emit, context):
         tmp_name = context.allocateTempName("mvar_value")
 
+        if python_version >= 360:
+            template = template_read_mvar_unclear_cached
+        else:
+            template = template_read_mvar_unclear
+
         emit(
-            template_read_mvar_unclear
+            template
             % {
                 "module_identifier": context.getModuleCodeName(),
                 "tmp_name": tmp_name,
@@ -20,11 +20,6 @@
 """
 
 
-from nuitka.codegen.templates.CodeTemplatesVariables import (
-    template_release_clear,
-    template_release_unclear,
-)
-
 from .CTypeBases import CTypeBase
 
 
@@ -35,41 +30,39 @@ class CTypeNuitkaIntOrLongStruct(CTypeBase):
     def emitVariableAssignCode(
         cls, value_name, needs_release, tmp_name, ref_count, in_place, emit, context
     ):
-        assert not in_place
-
-        if tmp_name.c_type == "nuitka_bool":
-            assert False
+        assert tmp_name.c_type == "PyObject *", tmp_name
 
-            emit("%s = %s;" % (value_name, tmp_name))
+        if in_place:
+            # Releasing is not an issue here, local variable reference never
+            # gave a reference, and the in-place code deals with possible
+            # replacement/release.
+            pass
         else:
-            if tmp_name.c_type == "PyObject *":
-                emit("%s.validity = NUITKA_ILONG_OBJECT_VALID;" % value_name)
+            if not ref_count:
+                emit("Py_INCREF( %s );" % tmp_name)
 
-                emit("%s.ilong_object = %s;" % (value_name, tmp_name))
-
-                if ref_count:
-                    emit("/* REFCOUNT ? */")
+            if needs_release is False:
+                emit("assert( %s.validity == NUITKA_ILONG_UNASSIGNED );" % value_name)
             else:
-                assert False, tmp_name
+                emit("RELEASE_ILONG_VALUE( &%s );" % value_name)
+
+        emit("SET_ILONG_FROM_OBJECT( &%s, %s );" % (value_name, tmp_name))
 
     @classmethod
     def getLocalVariableInitTestCode(cls, value_name, inverted):
-        assert False, "TODO"
-
-        return "%s %s NUITKA_BOOL_UNASSIGNED" % (value_name, "==" if inverted else "!=")
+        return "%s.validity %s NUITKA_ILONG_UNASSIGNED" % (
+            value_name,
+            "==" if inverted else "!=",
+        )
 
     @classmethod
     def getTruthCheckCode(cls, value_name):
-        assert False, "TODO"
-
-        return "%s == NUITKA_BOOL_TRUE" % value_name
+        return "CHECK_IF_ILONG_TRUE( &%s ) == 1" % value_name
 
     @classmethod
     def emitTruthCheckCode(cls, to_name, value_name, needs_check, emit, context):
-        # pylint: disable=unused-argument
-        assert False, "TODO"
-
-        emit("%s = %s ? 1 : 0;" % (to_name, cls.getTruthCheckCode(value_name)))
+        # Cannot fail for int values, pylint: disable=unused-argument
+        emit("%s = CHECK_IF_ILONG_TRUE( &%s );" % (to_name, value_name))
 
     @classmethod
     def emitValueAccessCode(cls, value_name, emit, context):
@@ -79,67 +72,55 @@ class CTypeNuitkaIntOrLongStruct(CTypeBase):
     @classmethod
     def emitValueAssertionCode(cls, value_name, emit, context):
         # Not using the context, pylint: disable=unused-argument
-        emit("assert(%s.validity != NUITKA_ILONG_UNASSIGNED);" % value_name)
+        emit("assert( %s.validity != NUITKA_ILONG_UNASSIGNED );" % value_name)
 
     @classmethod
     def emitAssignConversionCode(cls, to_name, value_name, needs_check, emit, context):
-        assert False, "TODO"
+        # Only copies of variable values are done, these do not own the
+        # object, pylint: disable=unused-argument
+        assert value_name.c_type == cls.c_type, value_name
 
-        if value_name.c_type == cls.c_type:
-            emit("%s = %s;" % (to_name, value_name))
-        else:
-            value_name.getCType().emitAssignmentCodeToNuitkaBool(
-                to_name=to_name,
-                value_name=value_name,
-                needs_check=needs_check,
-                emit=emit,
-                context=context,
-            )
+        emit("%s = %s;" % (to_name, value_name))
+
+    @classmethod
+    def emitAssignmentCodeToNuitkaBool(
+        cls, to_name, value_name, needs_check, emit, context
+    ):
+        # Cannot fail for int values, pylint: disable=unused-argument
+        emit(
+            "%s = %s ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;"
+            % (to_name, cls.getTruthCheckCode(value_name))
+        )
 
     @classmethod
     def getInitValue(cls, init_from):
         if init_from is None:
-            # TODO: In debug mode, use more crash prone maybe.
-            return "{NUITKA_ILONG_UNASSIGNED, NULL, 0}"
+            return "nuitka_ilong_unassigned_value"
         else:
             assert False, init_from
             return init_from
 
     @classmethod
     def getReleaseCode(cls, variable_code_name, needs_check, emit):
-        emit(
-            "if ((%s.validity & NUITKA_ILONG_OBJECT_VALID) == NUITKA_ILONG_OBJECT_VALID) {"
-            % variable_code_name
-        )
-
-        if needs_check:
-            template = template_release_unclear
-        else:
-            template = template_release_clear
-
-        emit(template % {"identifier": "%s.ilong_object" % variable_code_name})
+        if not needs_check:
+            cls.emitValueAssertionCode(
+                value_name=variable_code_name, emit=emit, context=None
+            )
 
-        emit("}")
+        emit("RELEASE_ILONG_VALUE( &%s );" % variable_code_name)
 
     @classmethod
     def getDeleteObjectCode(
         cls, to_name, value_name, needs_check, tolerant, emit, context
     ):
-        assert False, "TODO"
-
         if not needs_check:
-            emit("%s = NUITKA_BOOL_UNASSIGNED;" % value_name)
-        elif tolerant:
-            emit("%s = NUITKA_BOOL_UNASSIGNED;" % value_name)
-        else:
-            emit("%s = %s == NUITKA_BOOL_UNASSIGNED;" % (to_name, value_name))
-            emit("%s = NUITKA_BOOL_UNASSIGNED;" % value_name)
-
-    @classmethod
-    def emitAssignmentCodeFromBoolCondition(cls, to_name, condition, emit):
-        assert False, "TODO"
+            cls.emitValueAssertionCode(
+                value_name=value_name, emit=emit, context=context
+            )
+        elif not tolerant:
+            emit(
+                "%s = %s;"
+                % (to_name, cls.getLocalVariableInitTestCode(value_name, False))
+            )
 
-        emit(
-            "%(to_name)s = ( %(condition)s ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;"
-            % {"to_name": to_name, "condition": condition}
-        )
+        emit("RELEASE_ILONG_VALUE( &%s );" % value_name)
@@ -0,0 +1,72 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" CType classes for nuitka_loop_iter, a struct to represent "for" loop iteration.
+
+"""
+
+
+from .CTypeBases import CTypeBase
+
+
+class CTypeNuitkaLoopIterator(CTypeBase):
+    c_type = "nuitka_loop_iter"
+
+    @classmethod
+    def getLocalVariableInitTestCode(cls, value_name, inverted):
+        return "%s.kind %s NUITKA_LOOP_ITER_UNASSIGNED" % (
+            value_name,
+            "==" if inverted else "!=",
+        )
+
+    @classmethod
+    def emitValueAssertionCode(cls, value_name, emit, context):
+        # Not using the context, pylint: disable=unused-argument
+        emit("assert( %s.kind != NUITKA_LOOP_ITER_UNASSIGNED );" % value_name)
+
+    @classmethod
+    def getInitValue(cls, init_from):
+        if init_from is None:
+            return "nuitka_loop_iter_unassigned_value"
+        else:
+            assert False, init_from
+            return init_from
+
+    @classmethod
+    def getReleaseCode(cls, variable_code_name, needs_check, emit):
+        if not needs_check:
+            cls.emitValueAssertionCode(
+                value_name=variable_code_name, emit=emit, context=None
+            )
+
+        emit("RELEASE_LOOP_ITER( &%s );" % variable_code_name)
+
+    @classmethod
+    def getDeleteObjectCode(
+        cls, to_name, value_name, needs_check, tolerant, emit, context
+    ):
+        if not needs_check:
+            cls.emitValueAssertionCode(
+                value_name=value_name, emit=emit, context=context
+            )
+        elif not tolerant:
+            emit(
+                "%s = %s;"
+                % (to_name, cls.getLocalVariableInitTestCode(value_name, False))
+            )
+
+        emit("RELEASE_LOOP_ITER( &%s );" % value_name)
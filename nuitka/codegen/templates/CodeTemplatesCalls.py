@@ -381,11 +381,11 @@ PyObject *CALL_FUNCTION_WITH_ARGS%(args_count)d( PyObject *called, PyObject **ar
 
 
 template_call_method_with_args_decl = """\
-extern PyObject *CALL_METHOD_WITH_ARGS%(args_count)d( PyObject *source, PyObject *attr_name, PyObject **args );\
+extern PyObject *CALL_METHOD_WITH_ARGS%(args_count)d( PyObject *source, PyObject *attr_name, PyObject **args, Nuitka_AttributeCache *cache );\
 """
 
 template_call_method_with_args_impl = """\
-PyObject *CALL_METHOD_WITH_ARGS%(args_count)d( PyObject *source, PyObject *attr_name, PyObject **args )
+PyObject *CALL_METHOD_WITH_ARGS%(args_count)d( PyObject *source, PyObject *attr_name, PyObject **args, Nuitka_AttributeCache *cache )
 {
     CHECK_OBJECT( source );
     CHECK_OBJECT( attr_name );
@@ -411,7 +411,7 @@ PyObject *CALL_METHOD_WITH_ARGS%(args_count)d( PyObject *source, PyObject *attr_
             }
         }
 
-        PyObject *descr = _PyType_Lookup( type, attr_name );
+        PyObject *descr = LOOKUP_TYPE_ATTRIBUTE_CACHED( type, attr_name, cache );
         descrgetfunc func = NULL;
 
         if ( descr != NULL )
@@ -429,6 +429,11 @@ PyObject *CALL_METHOD_WITH_ARGS%(args_count)d( PyObject *source, PyObject *attr_
                     PyObject *called_object = func( descr, source, (PyObject *)type );
                     Py_DECREF( descr );
 
+                    if (unlikely( called_object == NULL ))
+                    {
+                        return NULL;
+                    }
+
                     PyObject *result = CALL_FUNCTION_WITH_ARGS%(args_count)d(
                         called_object,
                         args
@@ -504,13 +509,26 @@ PyObject *CALL_METHOD_WITH_ARGS%(args_count)d( PyObject *source, PyObject *attr_
 
                 return result;
             }
+#if %(args_count)d == 1
+            else if ( IS_METHOD_DESCRIPTOR_DIRECT_CALL( descr, source, METH_O ) )
+            {
+                PyObject *result = CALL_METHOD_DESCRIPTOR_DIRECT( descr, source, args[0] );
+
+                Py_DECREF( descr );
+
+                return result;
+            }
+#endif
             else
             {
                 PyObject *called_object = func( descr, source, (PyObject *)type );
-                CHECK_OBJECT( called_object );
-
                 Py_DECREF( descr );
 
+                if (unlikely( called_object == NULL ))
+                {
+                    return NULL;
+                }
+
                 PyObject *result = CALL_FUNCTION_WITH_ARGS%(args_count)d(
                     called_object,
                     args
@@ -710,6 +728,20 @@ PyObject *CALL_METHOD_WITH_ARGS%(args_count)d( PyObject *source, PyObject *attr_
 }
 """
 
+template_call_function_direct = """\
+{
+%(call_args_decl)s\
+    if ( Nuitka_Function_CheckCode( %(called_name)s, %(function_impl_identifier)s ) )
+    {
+        %(to_name)s = Nuitka_CallFunctionDirect( %(called_name)s, %(function_impl_identifier)s, %(call_args_name)s, %(args_count)d );
+    }
+    else
+    {
+        %(to_name)s = %(fallback_code)s;
+    }
+}
+"""
+
 from . import TemplateDebugWrapper  # isort:skip
 
 TemplateDebugWrapper.checkDebug(globals())
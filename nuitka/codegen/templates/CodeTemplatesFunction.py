@@ -21,6 +21,7 @@
 
 template_function_make_declaration = """\
 static PyObject *MAKE_FUNCTION_%(function_identifier)s( %(function_creation_arg_spec)s );
+static PyObject *impl_%(function_identifier)s( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
 """
 
 template_function_direct_declaration = """\
@@ -183,6 +183,15 @@ if (unlikely( %(tmp_name)s == NULL ))
 }
 """
 
+# For Python3.6 or higher, the dictionaries have version tags, which allows to
+# cache the lookup result per access site.
+template_read_mvar_unclear_cached = """\
+{
+    static Nuitka_ModuleVariableCache cache;
+    %(tmp_name)s = GET_MODULE_VARIABLE_VALUE_CACHED( moduledict_%(module_identifier)s, (Nuitka_StringObject *)%(var_name)s, &cache );
+}
+"""
+
 template_read_locals_dict_with_fallback = """\
 %(to_name)s = PyDict_GetItem( %(locals_dict)s, %(var_name)s );
 
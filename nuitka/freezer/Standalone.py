@@ -31,6 +31,8 @@ import os
 import shutil
 import subprocess
 import sys
+import threading
+import time
 from logging import debug, info, warning
 
 from nuitka import Options, SourceCodeReferences, Tracing
@@ -540,20 +542,8 @@ for imp in imports:
 
 _detected_python_rpath = None
 
-ldd_result_cache = {}
-
-
-def _detectBinaryPathDLLsLinuxBSD(dll_filename):
-    # This is complex, as it also includes the caching mechanism
-    # pylint: disable=too-many-branches
-
-    if ldd_result_cache.get(dll_filename):
-        return ldd_result_cache[dll_filename]
-
-    # Ask "ldd" about the libraries being used by the created binary, these
-    # are the ones that interest us.
-    result = set()
 
+def _getPythonRPath():
     # This is the rpath of the Python binary, which will be effective when
     # loading the other DLLs too. This happens at least for Python installs
     # on Travis. pylint: disable=global-statement
@@ -566,7 +556,236 @@ def _detectBinaryPathDLLsLinuxBSD(dll_filename):
                 b"$ORIGIN", os.path.dirname(sys.executable).encode("utf-8")
             )
 
-    with withEnvironmentPathAdded("LD_LIBRARY_PATH", _detected_python_rpath):
+    return _detected_python_rpath
+
+
+def _getFileFingerprint(filename):
+    """ Size, modification time, and inode of a file or directory.
+
+        This changes when the file is changed, replaced, or for directories,
+        when files are added or removed. Missing files give "-".
+    """
+
+    try:
+        stat_result = os.stat(filename)
+    except OSError:
+        return "-"
+
+    return "%d:%d:%d" % (
+        stat_result.st_size,
+        int(stat_result.st_mtime * 1000000),
+        stat_result.st_ino,
+    )
+
+
+def _getFileContentHash(filename):
+    """ Hash of the file contents, to detect files changed in place.
+
+        To avoid reading large files every time, the hash is remembered
+        together with the fingerprint of the file, and only computed again
+        if that changed.
+    """
+
+    fingerprint = _getFileFingerprint(filename)
+
+    cache_filename = _getCachePath(
+        "file_hashes", os.path.normcase(os.path.abspath(filename))
+    )
+
+    if os.path.exists(cache_filename):
+        with open(cache_filename) as cache_file:
+            cached_fingerprint, _, content_hash = cache_file.read().rpartition(" ")
+
+        if cached_fingerprint == fingerprint:
+            return content_hash
+
+    hash_value = hashlib.md5()
+
+    with open(filename, "rb") as input_file:
+        while True:
+            chunk = input_file.read(1024 * 1024)
+
+            if not chunk:
+                break
+
+            hash_value.update(chunk)
+
+    content_hash = hash_value.hexdigest()
+
+    _writeCacheFile(cache_filename, "%s %s" % (fingerprint, content_hash))
+
+    return content_hash
+
+
+def _getCachePath(cache_name, hashed_value):
+    if str is not bytes:
+        hashed_value = hashed_value.encode("utf8")
+
+    cache_dir = os.path.join(getCacheDir(), cache_name)
+
+    makePath(cache_dir)
+
+    return os.path.join(cache_dir, hashlib.md5(hashed_value).hexdigest())
+
+
+def _writeCacheFile(cache_filename, contents):
+    # Workers run in threads, and other compilations may run at the same
+    # time, so write to a unique temporary file first.
+    tmp_filename = "%s.%d.%d.tmp" % (
+        cache_filename,
+        os.getpid(),
+        threading.current_thread().ident,
+    )
+
+    with open(tmp_filename, "w") as cache_file:
+        cache_file.write(contents)
+
+    try:
+        os.rename(tmp_filename, cache_filename)
+    except OSError:
+        # On Windows, renaming over an existing file fails, the old contents
+        # are then checked and found outdated again next time.
+        os.unlink(tmp_filename)
+
+
+# Cache entries not used for this long are removed.
+_cache_max_age = 30 * 24 * 3600
+
+_pruned_cache_dirs = set()
+
+
+def _pruneCacheDirectory(cache_dir):
+    """ Remove cache entries that were not used for a long time.
+
+        Entries are touched when used, so these are the ones for binaries
+        that no longer exist, or that were not compiled in a while. This is
+        done once per compilation.
+    """
+
+    if cache_dir in _pruned_cache_dirs:
+        return
+
+    _pruned_cache_dirs.add(cache_dir)
+
+    max_mtime = time.time() - _cache_max_age
+
+    for filename in os.listdir(cache_dir):
+        cache_filename = os.path.join(cache_dir, filename)
+
+        try:
+            if os.path.getmtime(cache_filename) < max_mtime:
+                os.unlink(cache_filename)
+        except OSError:
+            # Another compilation might be doing the same.
+            pass
+
+
+def _getLddCacheFilename(dll_filename):
+    # The result of "ldd" depends on where the loader finds libraries, which
+    # is configured by these. Files it depends on are checked against the
+    # entry when it is used, so there is only one per binary, replaced when
+    # these change.
+    return _getCachePath(
+        "library_deps_ldd",
+        "%s %s %s %s %s"
+        % (
+            os.path.normcase(os.path.abspath(dll_filename)),
+            sys.version,
+            sys.executable,
+            os.environ.get("LD_LIBRARY_PATH", ""),
+            _getPythonRPath(),
+        ),
+    )
+
+
+def _getLddCheckedFilenames(dll_filename, dll_filenames):
+    """ Files and directories that when changed, can change the "ldd" result.
+
+        These are the binary and the libraries it uses, which can be changed
+        in place, the directories they are in, because libraries added there
+        can be found instead, e.g. through "$ORIGIN", and the loader cache.
+    """
+
+    result = set(dll_filenames)
+    result.add(dll_filename)
+    result.add("/etc/ld.so.cache")
+
+    for filename in [dll_filename] + list(dll_filenames):
+        result.add(os.path.dirname(os.path.abspath(filename)))
+
+    return sorted(result)
+
+
+def _readLddCacheFile(cache_filename):
+    """ Read the cached "ldd" result, "None" if any checked file changed. """
+
+    result = set()
+
+    with open(cache_filename) as cache_file:
+        for line in cache_file.read().split("\n"):
+            if not line:
+                continue
+
+            kind, fingerprint, filename = line.split(" ", 2)
+
+            if _getFileFingerprint(filename) != fingerprint:
+                return None
+
+            if kind == "dll":
+                result.add(filename)
+
+    # Keep it from being pruned.
+    os.utime(cache_filename, None)
+
+    return result
+
+
+def _writeLddCacheFile(cache_filename, dll_filename, dll_filenames):
+    lines = []
+
+    for filename in _getLddCheckedFilenames(dll_filename, dll_filenames):
+        lines.append(
+            "%s %s %s"
+            % (
+                "dll" if filename in dll_filenames else "check",
+                _getFileFingerprint(filename),
+                filename,
+            )
+        )
+
+    _writeCacheFile(cache_filename, "\n".join(lines))
+
+
+def _getLddDLLs(dll_filename):
+    """ Get the DLLs used by a binary, including the indirect ones.
+
+        The "ldd" output gives all of these at once. It is cached, and only
+        needs to be run again for new binaries, or when the binary, one of
+        the libraries, or where the loader would find them changed.
+    """
+
+    if os.path.isfile(dll_filename):
+        cache_filename = _getLddCacheFilename(dll_filename)
+
+        _pruneCacheDirectory(os.path.dirname(cache_filename))
+    else:
+        cache_filename = None
+
+    if (
+        cache_filename is not None
+        and os.path.exists(cache_filename)
+        and not Options.shallNotUseDependsExeCachedResults()
+    ):
+        result = _readLddCacheFile(cache_filename)
+
+        if result is not None:
+            return result
+
+    # Ask "ldd" about the libraries being used by the created binary, these
+    # are the ones that interest us.
+    result = set()
+
+    with withEnvironmentPathAdded("LD_LIBRARY_PATH", _getPythonRPath()):
         process = subprocess.Popen(
             args=["ldd", dll_filename], stdout=subprocess.PIPE, stderr=subprocess.PIPE
         )
@@ -645,6 +864,24 @@ def _detectBinaryPathDLLsLinuxBSD(dll_filename):
 
             result.add(filename)
 
+    if (
+        cache_filename is not None
+        and not Options.shallNotStoreDependsExeCachedResults()
+    ):
+        _writeLddCacheFile(cache_filename, dll_filename, result)
+
+    return result
+
+
+ldd_result_cache = {}
+
+
+def _detectBinaryPathDLLsLinuxBSD(dll_filename):
+    if ldd_result_cache.get(dll_filename):
+        return ldd_result_cache[dll_filename]
+
+    result = _getLddDLLs(dll_filename)
+
     # Allow plugins to prevent inclusion.
     blocked = Plugins.removeDllDependencies(
         dll_filename=dll_filename, dll_filenames=result
@@ -713,23 +950,20 @@ def _getCacheFilename(is_main_executable, source_dir, original_dir, binary_filen
     else:
         hashed_value = original_filename
 
+        # Libraries can be changed in place, e.g. by package upgrades.
+        if os.path.isfile(original_filename):
+            hashed_value += _getFileContentHash(original_filename)
+
     # Have different values for different Python major versions.
     hashed_value += sys.version + sys.executable
 
-    if str is not bytes:
-        hashed_value = hashed_value.encode("utf8")
-
-    cache_dir = os.path.join(
-        getCacheDir(),
+    return _getCachePath(
         "library_deps_pefile"
         if Options.isExperimental("use_pefile")
         else "library_deps",
+        hashed_value,
     )
 
-    makePath(cache_dir)
-
-    return os.path.join(cache_dir, hashlib.md5(hashed_value).hexdigest())
-
 
 # Locking seems to be only required for Windows currently, expressed that in the
 # lock name.
@@ -40,6 +40,7 @@ from __future__ import print_function
 import hashlib
 import imp
 import os
+import stat
 import sys
 import zipfile
 from logging import warning
@@ -74,6 +75,97 @@ def setMainScriptDirectory(main_dir):
     main_path = main_dir
 
 
+# Contents of directories looked at for module finding, so the many candidate
+# names are checked without a file system call each. An entry is only valid
+# while the modification time of the directory is unchanged.
+_directory_contents = {}
+
+
+def _getDirectoryContents(dirname):
+    """ Get the cached contents of a directory, or None if it's not one.
+
+        Returns a pair of dictionaries, both keyed by the case normalized
+        names. The first one gives the actual names, the second one the
+        kinds "dir" and "file" of entries as they get determined.
+    """
+    try:
+        stat_result = os.stat(dirname)
+    except OSError:
+        return None
+
+    if not stat.S_ISDIR(stat_result.st_mode):
+        return None
+
+    cached = _directory_contents.get(dirname)
+
+    if cached is None or cached[0] != stat_result.st_mtime:
+        try:
+            filenames = os.listdir(dirname)
+        except OSError:
+            return None
+
+        names = dict((os.path.normcase(filename), filename) for filename in filenames)
+
+        cached = _directory_contents[dirname] = stat_result.st_mtime, names, {}
+
+    return cached[1:]
+
+
+def _getDirectoryEntryKind(dirname, filename, contents):
+    """ Get the kind of a directory entry, "dir", "file", or None.
+
+        The "contents" must come from "_getDirectoryContents" for "dirname",
+        so multiple names can be checked with only one validation.
+    """
+
+    if contents is None:
+        return None
+
+    names, kinds = contents
+
+    key = os.path.normcase(filename)
+
+    if key not in names:
+        return None
+
+    if key not in kinds:
+        path = os.path.join(dirname, filename)
+
+        if os.path.isdir(path):
+            kinds[key] = "dir"
+        elif os.path.isfile(path):
+            kinds[key] = "file"
+        else:
+            kinds[key] = None
+
+    return kinds[key]
+
+
+def _hasExactCaseDirectoryEntry(dirname, filename):
+    contents = _getDirectoryContents(dirname)
+
+    return (
+        contents is not None
+        and contents[0].get(os.path.normcase(filename)) == filename
+    )
+
+
+def listDirCached(path):
+    """ Give a sorted path, base filename pairs of a directory.
+
+        Like "listDir", but uses the contents cached for module finding.
+    """
+
+    contents = _getDirectoryContents(path)
+
+    if contents is None:
+        return listDir(path)
+
+    return sorted(
+        (os.path.join(path, filename), filename) for filename in contents[0].values()
+    )
+
+
 def isPackageDir(dirname):
     """ Decide if a directory is a package.
 
@@ -82,14 +174,15 @@ def isPackageDir(dirname):
         extra packages provided via "*.pth" file tricks by "site.py" loading.
     """
 
-    return (
-        "." not in os.path.basename(dirname)
-        and os.path.isdir(dirname)
-        and (
-            python_version >= 300
-            or os.path.isfile(os.path.join(dirname, "__init__.py"))
-            or isPreloadedPackagePath(dirname)
-        )
+    if "." in os.path.basename(dirname):
+        return False
+
+    contents = _getDirectoryContents(dirname)
+
+    return contents is not None and (
+        python_version >= 300
+        or _getDirectoryEntryKind(dirname, "__init__.py", contents) == "file"
+        or isPreloadedPackagePath(dirname)
     )
 
 
@@ -329,20 +422,32 @@ def _findModuleInPath2(module_name, search_path):
             continue
         considered.add(os.path.normcase(entry))
 
+        entry_contents = _getDirectoryContents(entry)
+
+        # Entries that are not directories, e.g. zip files, cannot provide
+        # anything here.
+        if entry_contents is None:
+            continue
+
         package_directory = os.path.join(entry, module_name)
 
         # First, check for a package with an init file, that would be the
         # first choice.
-        if os.path.isdir(package_directory):
+        if _getDirectoryEntryKind(entry, module_name, entry_contents) == "dir":
+            package_contents = _getDirectoryContents(package_directory)
+
             for suffix, _mode, mtype in imp.get_suffixes():
                 if mtype == imp.C_EXTENSION:
                     continue
 
                 package_file_name = "__init__" + suffix
 
-                file_path = os.path.join(package_directory, package_file_name)
-
-                if os.path.isfile(file_path):
+                if (
+                    _getDirectoryEntryKind(
+                        package_directory, package_file_name, package_contents
+                    )
+                    == "file"
+                ):
                     candidates.add((entry, 1, package_directory))
                     break
             else:
@@ -351,8 +456,11 @@ def _findModuleInPath2(module_name, search_path):
 
         # Then, check out suffixes of all kinds.
         for suffix, _mode, _type in imp.get_suffixes():
-            file_path = os.path.join(entry, module_name + suffix)
-            if os.path.isfile(file_path):
+            if (
+                _getDirectoryEntryKind(entry, module_name + suffix, entry_contents)
+                == "file"
+            ):
+                file_path = os.path.join(entry, module_name + suffix)
                 candidates.add((entry, 1, file_path))
                 break
 
@@ -370,9 +478,10 @@ def _findModuleInPath2(module_name, search_path):
             return candidates[0][2]
         else:
             for candidate in candidates:
-                for fullname, _filename in listDir(candidate[0]):
-                    if fullname == candidate[2]:
-                        return candidate[2]
+                if _hasExactCaseDirectoryEntry(
+                    candidate[0], os.path.basename(candidate[2])
+                ):
+                    return candidate[2]
 
             # Only exact case matches matter, all candidates were ignored,
             # lets just fall through to raising the import error.
@@ -388,7 +497,7 @@ def _unpackPathElement(path_entry):
     if not path_entry:
         return "."  # empty means current directory
 
-    if os.path.isfile(path_entry) and path_entry.lower().endswith(".egg"):
+    if path_entry.lower().endswith(".egg") and os.path.isfile(path_entry):
         if path_entry not in _egg_files:
             checksum = hashlib.md5(open(path_entry, "rb").read()).hexdigest()
 
@@ -31,7 +31,7 @@ from nuitka.importing import ImportCache, Importing, StandardLibrary
 from nuitka.plugins.Plugins import Plugins
 from nuitka.PythonVersions import python_version
 from nuitka.tree.SourceReading import readSourceCodeFromFilename
-from nuitka.utils.FileOperations import listDir, relpath
+from nuitka.utils.FileOperations import relpath
 
 
 def logRecursion(*args):
@@ -325,7 +325,7 @@ def checkPluginSinglePath(plugin_filename, module_package):
 
                     debug("Package directory %s", package_dir)
 
-                    for sub_path, sub_filename in listDir(package_dir):
+                    for sub_path, sub_filename in Importing.listDirCached(package_dir):
                         if sub_filename in ("__init__.py", "__pycache__"):
                             continue
 
@@ -353,7 +353,7 @@ def checkPluginPath(plugin_filename, module_package):
         if os.path.isfile(plugin_info[0]) or Importing.isPackageDir(plugin_info[0]):
             checkPluginSinglePath(plugin_filename, module_package)
         elif os.path.isdir(plugin_info[0]):
-            for sub_path, sub_filename in listDir(plugin_info[0]):
+            for sub_path, sub_filename in Importing.listDirCached(plugin_info[0]):
                 assert sub_filename != "__init__.py"
 
                 if Importing.isPackageDir(sub_path) or sub_path.endswith(".py"):
@@ -154,6 +154,16 @@ class ExpressionBuiltinIterForUnpack(ExpressionBuiltinIter1):
             )
 
 
+class ExpressionBuiltinIterForLoop(ExpressionBuiltinIter1):
+    """ Iterator creation of a "for" loop.
+
+    The iterator is only used by the loop itself, so code generation can do
+    the iteration without an iterator object for values of some shapes.
+    """
+
+    kind = "EXPRESSION_BUILTIN_ITER_FOR_LOOP"
+
+
 class StatementSpecialUnpackCheck(StatementChildHavingBase):
     kind = "STATEMENT_SPECIAL_UNPACK_CHECK"
 
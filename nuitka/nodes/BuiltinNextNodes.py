@@ -21,10 +21,13 @@
     text, explaining things about its context.
 """
 
+from nuitka.Options import isExperimental
+
 from .ExpressionBases import (
     ExpressionBuiltinSingleArgBase,
     ExpressionChildrenHavingBase,
 )
+from .shapes.StandardShapes import ShapeUnknown
 
 
 class ExpressionBuiltinNext1(ExpressionBuiltinSingleArgBase):
@@ -40,6 +43,14 @@ class ExpressionBuiltinNext1(ExpressionBuiltinSingleArgBase):
             next_node=self, trace_collection=trace_collection
         )
 
+    def getTypeShape(self):
+        # Only the C int type needs these so far, to find loop counters, e.g.
+        # the "int" values of "range" iterators.
+        if isExperimental("nuitka_ilong"):
+            return self.getValue().getTypeShape().getShapeNext()
+        else:
+            return ShapeUnknown
+
 
 class ExpressionSpecialUnpack(ExpressionBuiltinNext1):
     kind = "EXPRESSION_SPECIAL_UNPACK"
@@ -253,7 +253,7 @@ class ExpressionComparisonNeq(ExpressionComparisonRichBase):
 
     @staticmethod
     def getComparisonShape(left_shape, right_shape):
-        return left_shape.getComparisonLteShape(right_shape)
+        return left_shape.getComparisonNeqShape(right_shape)
 
 
 class ExpressionComparisonIsIsNotBase(ExpressionComparisonBase):
@@ -37,6 +37,7 @@ from .NodeMakingHelpers import (
     makeStatementOnlyNodesFromExpressions,
     wrapExpressionWithSideEffects,
 )
+from .shapes.BuiltinTypeShapes import ShapeTypeDict
 from .TypeNodes import ExpressionBuiltinType1
 
 
@@ -112,6 +113,9 @@ class ExpressionMakeDict(SideEffectsFromChildrenMixin, ExpressionChildrenHavingB
 
     getPairs = ExpressionChildrenHavingBase.childGetter("pairs")
 
+    def getTypeShape(self):
+        return ShapeTypeDict
+
     def computeExpression(self, trace_collection):
         pairs = self.getPairs()
 
@@ -662,16 +662,14 @@ class ExpressionFunctionCreation(
 
         trace_collection.onExceptionRaiseExit(BaseException)
 
-        # TODO: Until we have something to re-order the keyword arguments, we
-        # need to skip this. For the immediate need, we avoid this complexity,
-        # as a re-ordering will be needed.
-        if call_kw is not None and (
-            not call_kw.isExpressionConstantRef() or call_kw.getConstant() != {}
-        ):
-            return call_node, None, None
-
-        if call_kw is not None:
+        # Keyword arguments are resolved to parameters here, but only with
+        # names known at compile time.
+        if call_kw is None:
+            pairs = ()
+        elif not call_kw.isMappingWithConstantStringKeys():
             return call_node, None, None
+        else:
+            pairs = call_kw.getMappingStringKeyPairs()
 
         if call_args is None:
             args_tuple = ()
@@ -684,12 +682,18 @@ class ExpressionFunctionCreation(
 
         function_body = self.getFunctionRef().getFunctionBody()
 
-        # TODO: Actually the above disables it entirely, as it is at least
-        # the empty dictionary node in any case. We will need some enhanced
-        # interfaces for "matchCall" to work on.
-
         call_spec = function_body.getParameters()
 
+        # TODO: The direct call cannot yet pass star arguments, keyword only
+        # arguments or default values, these would have to be created from
+        # the values given.
+        if (
+            call_spec.getStarListArgumentName()
+            or call_spec.getStarDictArgumentName()
+            or call_spec.getKwOnlyParameterCount()
+        ):
+            return call_node, None, None
+
         try:
             args_dict = matchCall(
                 func_name=self.getName(),
@@ -699,11 +703,28 @@ class ExpressionFunctionCreation(
                 num_defaults=call_spec.getDefaultCount(),
                 num_posonly=call_spec.getPositionalOnlyCount(),
                 positional=args_tuple,
-                pairs=(),
+                pairs=pairs,
             )
 
             values = [args_dict[name] for name in call_spec.getParameterNames()]
 
+            if None in values:
+                return call_node, None, None
+
+            # The direct call evaluates the values in the order of the
+            # parameters, which may only differ from the order of the keyword
+            # arguments, if that cannot be observed.
+            keyword_values = [value for _name, value in pairs]
+            keyword_value_ids = set(id(value) for value in keyword_values)
+
+            if [value for value in values if id(value) in keyword_value_ids] != (
+                keyword_values
+            ) and any(
+                value.mayHaveSideEffects() or value.mayRaiseException(BaseException)
+                for value in keyword_values
+            ):
+                return call_node, None, None
+
             result = ExpressionFunctionCall(
                 function=self, values=values, source_ref=call_node.getSourceReference()
             )
@@ -718,6 +739,11 @@ function call."""
             )
 
         except TooManyArguments as e:
+            # The error messages for keyword arguments differ too much between
+            # versions, leave these to run time.
+            if pairs:
+                return call_node, None, None
+
             result = wrapExpressionWithSideEffects(
                 new_node=makeRaiseExceptionReplacementExpressionFromInstance(
                     expression=call_node, exception=e.getRealException()
@@ -824,6 +850,10 @@ class ExpressionFunctionRef(ExpressionBase):
 
         addUsedModule(owning_module)
 
+        # Recorded, so the module can be skipped in later passes, without
+        # losing the functions it uses.
+        trace_collection.onUsedFunction(function_body)
+
         needs_visit = owning_module.addUsedFunction(function_body)
 
         if needs_visit:
@@ -22,7 +22,9 @@ statements for it. These re-formulations require that optimization of loops has
 to be very general, yet the node type for loop, becomes very simple.
 """
 
+from nuitka import Variables
 from nuitka.optimizations.TraceCollections import TraceCollectionBranch
+from nuitka.Options import isExperimental
 from nuitka.tree.Extractions import getVariablesWritten
 
 from .Checkers import checkStatementsSequenceOrNone
@@ -36,7 +38,7 @@ class StatementLoop(StatementChildHavingBase):
 
     checker = checkStatementsSequenceOrNone
 
-    __slots__ = ("loop_variables", "loop_memory")
+    __slots__ = ("loop_variables", "loop_memory", "loop_variables_complete")
 
     def __init__(self, body, source_ref):
         StatementChildHavingBase.__init__(self, value=body, source_ref=source_ref)
@@ -44,6 +46,10 @@ class StatementLoop(StatementChildHavingBase):
         self.loop_variables = None
         self.loop_memory = None
 
+        # Shapes collected before variable usages were complete, may contain
+        # unknown ones, that are not really there.
+        self.loop_variables_complete = False
+
     getLoopBody = StatementChildHavingBase.childGetter("body")
     setLoopBody = StatementChildHavingBase.childSetter("body")
 
@@ -96,10 +102,19 @@ class StatementLoop(StatementChildHavingBase):
             if loop_body is not None:
                 # Look ahead. what will be written and degrade to initial loop
                 # traces about that if we are in the first iteration, later we
-                # will have more precise knowledge.
-                if self.loop_variables is None:
+                # will have more precise knowledge. Once variable usages are
+                # complete, do it once more, as shapes from before can contain
+                # unknown ones that are not there. Only the C int type needs
+                # that so far, to find loop counters.
+                if self.loop_variables is None or (
+                    Variables.complete
+                    and not self.loop_variables_complete
+                    and isExperimental("nuitka_ilong")
+                ):
                     early = True
 
+                    self.loop_variables_complete = Variables.complete
+
                     loop_variables = getVariablesWritten(loop_body)
 
                     self.loop_variables = {}
@@ -24,6 +24,7 @@ no real difference.
 import math
 
 from nuitka import PythonOperators
+from nuitka.Options import isExperimental
 
 from .ExpressionBases import ExpressionChildHavingBase, ExpressionChildrenHavingBase
 from .shapes.BuiltinTypeShapes import ShapeTypeBool, ShapeTypeTuple
@@ -100,6 +101,15 @@ class ExpressionOperationBinaryBase(ExpressionChildrenHavingBase):
                 description="Operator '%s' with constant arguments." % operator,
             )
 
+        # Only the C int type needs these so far, to find loop counters.
+        if operator == "Sub" and isExperimental("nuitka_ilong"):
+            left_shape = left.getTypeShape()
+            right_shape = right.getTypeShape()
+
+            self.type_shape, _escape_desc = left_shape.getOperationBinarySubShape(
+                right_shape
+            )
+
         # TODO: May go down to MemoryError for compile time constant overflow
         # ones.
         trace_collection.onExceptionRaiseExit(BaseException)
@@ -141,6 +151,11 @@ class ExpressionOperationBinary(ExpressionOperationBinaryBase):
             self, operator=operator, left=left, right=right, source_ref=source_ref
         )
 
+        self.type_shape = ShapeUnknown
+
+    def getTypeShape(self):
+        return self.type_shape
+
 
 class ExpressionOperationBinaryAdd(ExpressionOperationBinaryBase):
     kind = "EXPRESSION_OPERATION_BINARY_ADD"
@@ -561,6 +576,24 @@ Lowered in-place binary operation of compile time constant to binary operation."
 
             return result.computeExpression(trace_collection)
 
+        # The built-in types that have in-place operations, keep their type
+        # for them, so the shape is the one of the binary operation. Only the
+        # C int type needs these so far, to find loop counters.
+        if isExperimental("nuitka_ilong"):
+            operator = self.getOperator()
+
+            left_shape = left.getTypeShape()
+            right_shape = right.getTypeShape()
+
+            if operator == "IAdd":
+                self.type_shape, _escape_desc = left_shape.getOperationBinaryAddShape(
+                    right_shape
+                )
+            elif operator == "ISub":
+                self.type_shape, _escape_desc = left_shape.getOperationBinarySubShape(
+                    right_shape
+                )
+
         # Any exception may be raised.
         trace_collection.onExceptionRaiseExit(BaseException)
 
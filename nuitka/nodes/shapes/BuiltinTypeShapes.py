@@ -49,12 +49,27 @@ def _getOperationBinaryAddShapeGeneric(cls, right_shape):
         return right_shape.getOperationBinaryAddLShape(cls)
 
     if type(right_shape) is ShapeLoopInitialAlternative:
+        # Only the C int type needs these so far, to find loop counters.
+        if isExperimental("nuitka_ilong"):
+            return right_shape.getOperationBinaryAddLShape(cls)
+
         return operation_result_unknown
 
     onMissingOperation("Add", cls, right_shape)
     return operation_result_unknown
 
 
+def _getOperationBinarySubShapeGeneric(cls, right_shape):
+    if type(right_shape) in (
+        ShapeLoopCompleteAlternative,
+        ShapeLoopInitialAlternative,
+    ):
+        return right_shape.getOperationBinarySubLShape(cls)
+
+    onMissingOperation("Sub", cls, right_shape)
+    return operation_result_unknown
+
+
 def _getComparisonLtShapeGeneric(cls, right_shape):
     if type(right_shape) is ShapeLoopCompleteAlternative:
         return right_shape.getComparisonLtLShape(cls)
@@ -202,6 +217,24 @@ class ShapeTypeBool(ShapeBase):
 
         return _getOperationBinaryAddShapeGeneric(cls, right_shape)
 
+    @classmethod
+    def getOperationBinarySubShape(cls, right_shape):
+        if right_shape is ShapeUnknown:
+            return operation_result_unknown
+
+        # Int might turn into long when subtracting anything due to possible
+        # overflow.
+        if right_shape in (ShapeTypeInt, ShapeTypeIntOrLong, ShapeTypeBool):
+            return operation_result_intorlong_noescape
+
+        if right_shape is ShapeTypeLong:
+            return operation_result_long_noescape
+
+        if right_shape is ShapeTypeIntOrLongDerived:
+            return operation_result_unknown
+
+        return _getOperationBinarySubShapeGeneric(cls, right_shape)
+
     @classmethod
     def getComparisonLtShape(cls, right_shape):
         if right_shape is ShapeUnknown:
@@ -229,6 +262,12 @@ class ShapeTypeInt(ShapeBase):
 
     helper_code = "INT" if python_version < 300 else "LONG"
 
+    if isExperimental("nuitka_ilong"):
+
+        @staticmethod
+        def getCType():
+            return CTypeNuitkaIntOrLongStruct
+
     @staticmethod
     def hasShapeSlotLen():
         return False
@@ -286,6 +325,27 @@ class ShapeTypeInt(ShapeBase):
 
         return _getOperationBinaryAddShapeGeneric(cls, right_shape)
 
+    @classmethod
+    def getOperationBinarySubShape(cls, right_shape):
+        if right_shape is ShapeUnknown:
+            return operation_result_unknown
+
+        # Int might turn into long when subtracting anything due to possible
+        # overflow.
+        if right_shape in (ShapeTypeInt, ShapeTypeIntOrLong, ShapeTypeBool):
+            return operation_result_intorlong_noescape
+
+        if right_shape is ShapeTypeLong:
+            return operation_result_long_noescape
+
+        if right_shape in (ShapeTypeLongDerived, ShapeTypeIntOrLongDerived):
+            return operation_result_unknown
+
+        if right_shape is ShapeTypeFloat:
+            return operation_result_float_noescape
+
+        return _getOperationBinarySubShapeGeneric(cls, right_shape)
+
     @classmethod
     def getComparisonLtShape(cls, right_shape):
         if right_shape is ShapeUnknown:
@@ -364,6 +424,25 @@ class ShapeTypeLong(ShapeBase):
 
         return _getOperationBinaryAddShapeGeneric(cls, right_shape)
 
+    @classmethod
+    def getOperationBinarySubShape(cls, right_shape):
+        if right_shape is ShapeUnknown:
+            return operation_result_unknown
+
+        # Long remains long when subtracting anything from it.
+        if right_shape in (
+            ShapeTypeLong,
+            ShapeTypeInt,
+            ShapeTypeIntOrLong,
+            ShapeTypeBool,
+        ):
+            return operation_result_long_noescape
+
+        if right_shape in (ShapeTypeLongDerived, ShapeTypeIntOrLongDerived):
+            return operation_result_unknown
+
+        return _getOperationBinarySubShapeGeneric(cls, right_shape)
+
     @classmethod
     def getComparisonLtShape(cls, right_shape):
         if right_shape is ShapeUnknown:
@@ -447,6 +526,22 @@ if python_version < 300:
 
             return _getOperationBinaryAddShapeGeneric(cls, right_shape)
 
+        @classmethod
+        def getOperationBinarySubShape(cls, right_shape):
+            if right_shape is ShapeUnknown:
+                return operation_result_unknown
+
+            if right_shape in (ShapeTypeInt, ShapeTypeIntOrLong, ShapeTypeBool):
+                return operation_result_intorlong_noescape
+
+            if right_shape is ShapeTypeLong:
+                return operation_result_long_noescape
+
+            if right_shape in (ShapeTypeIntOrLongDerived, ShapeTypeLongDerived):
+                return operation_result_unknown
+
+            return _getOperationBinarySubShapeGeneric(cls, right_shape)
+
         @classmethod
         def getComparisonLtShape(cls, right_shape):
             if right_shape is ShapeUnknown:
@@ -1500,6 +1595,10 @@ class ShapeTypeXrangeIterator(ShapeIterator):
     def hasShapeSlotLen():
         return False
 
+    @staticmethod
+    def getShapeNext():
+        return ShapeTypeInt
+
 
 class ShapeTypeType(ShapeBase):
     @staticmethod
@@ -38,6 +38,10 @@ class ShapeBase(object):
     def getShapeIter():
         return ShapeUnknown
 
+    @staticmethod
+    def getShapeNext():
+        return ShapeUnknown
+
     @staticmethod
     def hasShapeModule():
         return None
@@ -84,6 +88,12 @@ class ShapeBase(object):
 
         return ShapeUnknown, ControlFlowDescriptionFullEscape
 
+    @classmethod
+    def getOperationBinarySubShape(cls, right_shape):
+        onMissingOperation("Sub", cls, right_shape)
+
+        return ShapeUnknown, ControlFlowDescriptionFullEscape
+
     @classmethod
     def getComparisonLtShape(cls, right_shape):
         onMissingOperation("Lt", cls, right_shape)
@@ -120,6 +130,10 @@ class ShapeUnknown(ShapeBase):
     def getOperationBinaryAddShape(cls, right_shape):
         return ShapeUnknown, ControlFlowDescriptionFullEscape
 
+    @classmethod
+    def getOperationBinarySubShape(cls, right_shape):
+        return ShapeUnknown, ControlFlowDescriptionFullEscape
+
     @classmethod
     def getComparisonLtShape(cls, right_shape):
         return ShapeUnknown, ControlFlowDescriptionFullEscape
@@ -256,6 +270,39 @@ class ShapeLoopInitialAlternative(ShapeBase):
                 ControlFlowDescriptionFullEscape,
             )
 
+    # Special method to be called by other shapes encountering this type on
+    # the right side.
+    def getOperationBinaryAddLShape(self, left_shape):
+        assert left_shape is not ShapeUnknown
+
+        return (
+            self._collectInitialShape(operation=left_shape.getOperationBinaryAddShape),
+            ControlFlowDescriptionFullEscape,
+        )
+
+    def getOperationBinarySubShape(self, right_shape):
+        if right_shape is ShapeUnknown:
+            return ShapeUnknown, ControlFlowDescriptionFullEscape
+        else:
+            return (
+                self._collectInitialShape(
+                    operation=lambda left_shape: left_shape.getOperationBinarySubShape(
+                        right_shape
+                    )
+                ),
+                ControlFlowDescriptionFullEscape,
+            )
+
+    # Special method to be called by other shapes encountering this type on
+    # the right side.
+    def getOperationBinarySubLShape(self, left_shape):
+        assert left_shape is not ShapeUnknown
+
+        return (
+            self._collectInitialShape(operation=left_shape.getOperationBinarySubShape),
+            ControlFlowDescriptionFullEscape,
+        )
+
     def getComparisonLtShape(self, right_shape):
         if right_shape is ShapeUnknown:
             return ShapeUnknown, ControlFlowDescriptionFullEscape
@@ -367,6 +414,25 @@ class ShapeLoopCompleteAlternative(ShapeBase):
             operation=left_shape.getOperationBinaryAddShape
         )
 
+    def getOperationBinarySubShape(self, right_shape):
+        if right_shape is ShapeUnknown:
+            return ShapeUnknown, ControlFlowDescriptionFullEscape
+
+        return self._collectShapeOperation(
+            operation=lambda left_shape: left_shape.getOperationBinarySubShape(
+                right_shape
+            )
+        )
+
+    # Special method to be called by other shapes encountering this type on
+    # the right side.
+    def getOperationBinarySubLShape(self, left_shape):
+        assert left_shape is not ShapeUnknown
+
+        return self._collectShapeOperation(
+            operation=left_shape.getOperationBinarySubShape
+        )
+
     def getComparisonLtShape(self, right_shape):
         if right_shape is ShapeUnknown:
             return ShapeUnknown, ControlFlowDescriptionFullEscape
@@ -32,6 +32,11 @@ from nuitka.nodes.LocalsScopes import LocalsDictHandle, getLocalsDictHandles
 from nuitka.plugins.Plugins import Plugins
 from nuitka.Tracing import printLine
 from nuitka.utils import MemoryUsage
+from nuitka.utils.BuildProfile import (
+    countModuleBuildStep,
+    withBuildPhase,
+    withModuleBuildPhase,
+)
 
 from . import Graphs, TraceCollections
 from .BytecodeDemotion import demoteCompiledModuleToBytecode
@@ -56,6 +61,11 @@ def _attemptRecursion(module):
 
 tag_set = None
 
+# Compiled modules that had no changes in the last pass. Nothing outside of them
+# influences their optimization, so they need not be computed again, unless a
+# global step changes them.
+unchanged_modules = set()
+
 
 def signalChange(tags, source_ref, message):
     """ Indicate a change to the optimization framework.
@@ -96,6 +106,8 @@ def optimizeCompiledPythonModule(module):
     while True:
         tag_set.clear()
 
+        countModuleBuildStep(module.getFullName(), "optimization", "local_steps")
+
         try:
             module.computeModule()
         except BaseException:
@@ -129,6 +141,40 @@ def optimizeCompiledPythonModule(module):
     return touched
 
 
+def optimizeUnchangedCompiledPythonModule(module):
+    """ Take over a compiled module unchanged from the last pass.
+
+        Computing it again would give the same result, but what it uses must
+        still be known to this pass, or it would be considered unused.
+    """
+    if _progress:
+        info(
+            "Skipping unchanged module '{module_name}'.".format(
+                module_name=module.getFullName()
+            )
+        )
+
+    countModuleBuildStep(module.getFullName(), "optimization", "skipped_passes")
+
+    _attemptRecursion(module)
+
+    trace_collection = module.getTraceCollection()
+
+    for used_module_name, used_module_path in trace_collection.getUsedModules():
+        used_module = ImportCache.getImportedModuleByNameAndPath(
+            used_module_name, used_module_path
+        )
+        ModuleRegistry.addUsedModule(used_module)
+
+    for function_body in trace_collection.getUsedFunctions():
+        owning_module = function_body.getParentModule()
+
+        ModuleRegistry.addUsedModule(owning_module)
+        owning_module.addUsedFunction(function_body)
+
+    Plugins.considerImplicitImports(module=module, signal_change=signalChange)
+
+
 def optimizeUncompiledPythonModule(module):
     if _progress:
         info(
@@ -164,7 +210,11 @@ def optimizeModule(module):
         optimizeShlibModule(module)
         changed = False
     elif module.isCompiledPythonModule():
-        changed = optimizeCompiledPythonModule(module)
+        if module in unchanged_modules:
+            optimizeUnchangedCompiledPythonModule(module)
+            changed = False
+        else:
+            changed = optimizeCompiledPythonModule(module)
     else:
         optimizeUncompiledPythonModule(module)
         changed = False
@@ -453,11 +503,24 @@ def makeOptimizationPass(initial_pass):
         global tag_set
         tag_set = TagSet()
 
-        changed = optimizeModule(current_module)
+        with withModuleBuildPhase(current_module.getFullName(), "optimization"):
+            changed = optimizeModule(current_module)
 
         if changed:
             finished = False
 
+        # Until variables are complete, passes do not reach a stable state. The
+        # internal module functions are used by others, not computed by it.
+        if (
+            Variables.complete
+            and not changed
+            and current_module.isCompiledPythonModule()
+            and not current_module.isInternalModule()
+        ):
+            unchanged_modules.add(current_module)
+        else:
+            unchanged_modules.discard(current_module)
+
     # Unregister collection traces from now unused code, dropping the trace
     # collections of functions no longer used.
     for current_module in ModuleRegistry.getDoneModules():
@@ -474,6 +537,8 @@ def makeOptimizationPass(initial_pass):
             if optimizeVariables(current_module):
                 finished = False
 
+                unchanged_modules.discard(current_module)
+
             used_functions = current_module.getUsedFunctions()
 
             for unused_function in current_module.getUnusedFunctions():
@@ -491,6 +556,8 @@ def makeOptimizationPass(initial_pass):
         if optimizeLocalsDictsHandles():
             finished = False
 
+            unchanged_modules.clear()
+
     return finished
 
 
@@ -537,10 +604,13 @@ def optimize(output_filename):
     if _progress:
         info("PASS 1:")
 
-    makeOptimizationPass(initial_pass=True)
+    with withBuildPhase("optimization_pass_1"):
+        makeOptimizationPass(initial_pass=True)
     Variables.complete = True
 
-    finished = makeOptimizationPass(initial_pass=False)
+    with withBuildPhase("optimization_pass_2"):
+        finished = makeOptimizationPass(initial_pass=False)
+    pass_count = 2
 
     if Options.isExperimental("check_xml_persistence"):
         _checkXMLPersistence()
@@ -556,6 +626,9 @@ def optimize(output_filename):
 
     # Second, "endless" pass.
     while not finished:
-        finished = makeOptimizationPass(initial_pass=False)
+        pass_count += 1
+
+        with withBuildPhase("optimization_pass_%d" % pass_count):
+            finished = makeOptimizationPass(initial_pass=False)
 
     Graphs.endGraph(output_filename)
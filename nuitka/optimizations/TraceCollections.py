@@ -38,6 +38,7 @@ from nuitka.nodes.shapes.BuiltinTypeShapes import (
     ShapeTypeIntOrLong,
     ShapeTypeLong,
 )
+from nuitka.Options import isExperimental
 from nuitka.PythonVersions import python_version
 from nuitka.tree.SourceReading import readSourceLine
 from nuitka.utils.FileOperations import relpath
@@ -56,6 +57,221 @@ from .ValueTraces import (
 signalChange = None
 
 
+class VariableActivesLayer(object):
+    """ Frozen part of the active variable versions.
+
+        These are shared by all collections branched off while it was the
+        current state, and must never be modified, except for remembering
+        lookups.
+    """
+
+    __slots__ = ("actives", "base", "depth", "versions", "complete")
+
+    def __init__(self, actives, base, versions, complete):
+        # Changes made relative to the base layer.
+        self.actives = actives
+        self.base = base
+
+        self.depth = 1 if base is None else base.depth + 1
+
+        # The changes plus versions looked up from base layers, and if complete
+        # all of them, so lookups do not have to walk all the way up.
+        self.versions = versions
+        self.complete = complete
+
+
+class VariableActives(object):
+    """ Currently active versions of variables in a collection.
+
+        Branching must not copy all variables, that is quadratic for large
+        functions with many nested branches. Instead the current changes are
+        frozen into a layer shared with the branch, and both continue with
+        their own changes only, which is also what merging needs to look at.
+    """
+
+    __slots__ = ("actives", "base")
+
+    # Distance of layers that have all versions, limits the lookup effort.
+    complete_distance = 8
+
+    def __init__(self, base=None):
+        # Changes made since branching off.
+        self.actives = {}
+
+        # Shared state, a "VariableActivesLayer" or None.
+        self.base = base
+
+    def __getitem__(self, variable):
+        # Versions are never None, so "get" can be used to do only one lookup.
+        version = self.actives.get(variable)
+
+        if version is not None:
+            return version
+
+        layer = self.base
+
+        while layer is not None:
+            version = layer.versions.get(variable)
+
+            if version is not None:
+                break
+
+            if layer.complete:
+                raise KeyError(variable)
+
+            layer = layer.base
+        else:
+            raise KeyError(variable)
+
+        if layer is not self.base:
+            self.base.versions[variable] = version
+
+        return version
+
+    def __setitem__(self, variable, version):
+        self.actives[variable] = version
+
+    def __contains__(self, variable):
+        try:
+            self[variable]
+        except KeyError:
+            return False
+        else:
+            return True
+
+    def get(self, variable, default=None):
+        try:
+            return self[variable]
+        except KeyError:
+            return default
+
+    def _getLookupDicts(self):
+        result = [self.actives]
+
+        layer = self.base
+
+        while layer is not None:
+            result.append(layer.versions)
+
+            if layer.complete:
+                break
+
+            layer = layer.base
+
+        return result
+
+    def _getAll(self):
+        result = {}
+
+        for versions in reversed(self._getLookupDicts()):
+            result.update(versions)
+
+        return result
+
+    def items(self):
+        return self._getAll().items()
+
+    iteritems = items
+
+    def keys(self):
+        return self._getAll().keys()
+
+    def clear(self):
+        self.actives = {}
+        self.base = None
+
+    def _isMostlyChanged(self):
+        layer = self.base
+
+        while not layer.complete:
+            layer = layer.base
+
+        # The complete layer knows nearly all variables, new ones are rare.
+        return len(self.actives) * 10 >= len(layer.versions) * 9
+
+    def branch(self):
+        """ Get a copy to use for a branch, sharing the current state. """
+
+        if self.actives:
+            # When nearly all variables were changed, e.g. by marking them all
+            # unknown, the layers below are no longer worth sharing, and a
+            # plain dictionary of all versions is used again.
+            if self.base is not None and self._isMostlyChanged():
+                self.actives = self._getAll()
+                self.base = None
+
+            if self.base is None:
+                complete = True
+                versions = self.actives
+            else:
+                complete = (self.base.depth + 1) % self.complete_distance == 0
+                versions = dict(self.items() if complete else self.actives)
+
+            self.base = VariableActivesLayer(
+                actives=self.actives,
+                base=self.base,
+                versions=versions,
+                complete=complete,
+            )
+            self.actives = {}
+
+        return VariableActives(base=self.base)
+
+    @staticmethod
+    def getCommonBase(variable_actives):
+        """ Get the layer shared by all of the given variable actives.
+
+            Below it, nothing can be different, this is None if they share
+            nothing at all.
+        """
+
+        bases = [actives.base for actives in variable_actives]
+
+        while None not in bases:
+            first = bases[0]
+
+            if all(base is first for base in bases):
+                return first
+
+            # Walk up the deepest ones, until they all arrive at the same.
+            depth = max(base.depth for base in bases)
+            bases = [base.base if base.depth == depth else base for base in bases]
+
+        return None
+
+    def getChanges(self, base):
+        """ Versions of variables that may differ from the base layer state. """
+
+        if base is None:
+            return dict(self.items())
+
+        layers = []
+
+        layer = self.base
+
+        while layer is not base:
+            layers.append(layer)
+            layer = layer.base
+
+        result = {}
+
+        for layer in reversed(layers):
+            result.update(layer.actives)
+
+        result.update(self.actives)
+
+        return result
+
+    def update(self, other):
+        base = self.getCommonBase((self, other))
+
+        for variable in self.getChanges(base):
+            if variable in other:
+                self.actives[variable] = other[variable]
+
+        self.actives.update(other.getChanges(base))
+
+
 class CollectionTracingMixin(object):
     """ This contains for logic for maintaining active traces.
 
@@ -64,7 +280,7 @@ class CollectionTracingMixin(object):
 
     def __init__(self):
         # Currently active values in the tracing.
-        self.variable_actives = {}
+        self.variable_actives = VariableActives()
 
     def getVariableCurrentTrace(self, variable):
         """ Get the current value trace associated to this variable
@@ -116,7 +332,11 @@ class CollectionTracingMixin(object):
 
         current_shape = current.getTypeShape()
 
-        if current_shape not in shapes:
+        # Not being assigned before the loop gives no shape, the C int type
+        # can be unassigned as well, which makes loop counters work.
+        if current_shape not in shapes and not (
+            shapes and current.isUninitTrace() and isExperimental("nuitka_ilong")
+        ):
             shapes = set(shapes)
             shapes.add(current_shape)
 
@@ -388,6 +608,9 @@ class TraceCollectionBase(CollectionTracingMixin):
     def onUsedModule(self, module_name, module_relpath):
         return self.parent.onUsedModule(module_name, module_relpath)
 
+    def onUsedFunction(self, function_body):
+        return self.parent.onUsedFunction(function_body)
+
     @staticmethod
     def mustAlias(a, b):
         if a.isExpressionVariableRef() and b.isExpressionVariableRef():
@@ -577,21 +800,31 @@ class TraceCollectionBase(CollectionTracingMixin):
             self.replaceBranch(collections[0])
             return None
 
+        variable_actives = [collection.variable_actives for collection in collections]
+
+        # Only variables changed since the branches were split off can differ,
+        # the shared state is kept as it is.
+        base = VariableActives.getCommonBase(variable_actives)
+
+        self.variable_actives = VariableActives(base=base)
+
         variable_versions = {}
+        change_counts = {}
 
-        for collection in collections:
-            for variable, version in iterItems(collection.variable_actives):
+        for actives in variable_actives:
+            for variable, version in iterItems(actives.getChanges(base)):
                 if variable not in variable_versions:
                     variable_versions[variable] = set([version])
+                    change_counts[variable] = 1
                 else:
                     variable_versions[variable].add(version)
+                    change_counts[variable] += 1
 
-        for collection in collections:
-            for variable, versions in iterItems(variable_versions):
-                if variable not in collection.variable_actives:
-                    versions.add(0)
-
-        self.variable_actives = {}
+        # Where branches did not change a variable, it has the version of the
+        # shared state, and not being present at all means version 0.
+        for variable, change_count in iterItems(change_counts):
+            if change_count < len(variable_actives):
+                variable_versions[variable].add(self.variable_actives.get(variable, 0))
 
         #         merge_traces = None
 
@@ -703,7 +936,7 @@ class TraceCollectionBranch(TraceCollectionBase):
     def __init__(self, name, parent):
         TraceCollectionBase.__init__(self, owner=parent.owner, name=name, parent=parent)
 
-        self.variable_actives = dict(parent.variable_actives)
+        self.variable_actives = parent.variable_actives.branch()
 
     def computeBranch(self, branch):
         if branch.isStatementsSequence():
@@ -787,6 +1020,7 @@ class TraceCollectionModule(CollectionStartpointMixin, TraceCollectionBase):
         )
 
         self.used_modules = OrderedSet()
+        self.used_functions = OrderedSet()
 
     def onUsedModule(self, module_name, module_relpath):
         assert type(module_name) is str, module_name
@@ -802,3 +1036,9 @@ class TraceCollectionModule(CollectionStartpointMixin, TraceCollectionBase):
 
     def getUsedModules(self):
         return self.used_modules
+
+    def onUsedFunction(self, function_body):
+        self.used_functions.add(function_body)
+
+    def getUsedFunctions(self):
+        return self.used_functions
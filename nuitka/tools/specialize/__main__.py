@@ -0,0 +1,886 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Generate the type specialized C helpers of binary operations and comparisons.
+
+The operators and types to generate them for are taken from the tables in
+"nuitka.codegen.OperatorCodes", so the code generation and the C code agree
+on what exists. For each operator, there is a file with the binary helpers,
+one with the in-place helpers, and the declarations of all of them go into
+one header file. For rich comparisons, there is a file per type, and again
+one header file.
+"""
+
+import os
+import sys
+
+# Unchanged, running from checkout, use the parent directory, the nuitka
+# package ought be there.
+sys.path.insert(
+    0, os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+)
+
+from nuitka.codegen.OperatorCodes import (  # isort:skip
+    specialized_binary_operators,
+    specialized_comparison_types,
+)
+from nuitka.tools.Basics import goHome  # isort:skip
+from nuitka.Tracing import my_print  # isort:skip
+
+_license_header = """\
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+// This file is generated by "nuitka.tools.specialize" from the tables in
+// "nuitka/codegen/OperatorCodes.py", do not edit it manually.
+
+"""
+
+# Per type, the exact type check, the type object, and if it's Python2 only.
+_type_infos = {
+    "INT": ("PyInt_CheckExact", "PyInt_Type", True),
+    "LONG": ("PyLong_CheckExact", "PyLong_Type", False),
+    "FLOAT": ("PyFloat_CheckExact", "PyFloat_Type", False),
+}
+
+# Per operation, the operator, the number slot, the generic helper, the
+# generic in-place helper, and if it's Python2 only.
+_operation_infos = {
+    "SUB": (
+        "-",
+        "nb_subtract",
+        "BINARY_OPERATION_SUB(%s, %s)",
+        "BINARY_OPERATION_INPLACE(PyNumber_InPlaceSubtract, %s, %s)",
+        False,
+    ),
+    "MUL": (
+        "*",
+        "nb_multiply",
+        "BINARY_OPERATION_MUL(%s, %s)",
+        "BINARY_OPERATION_MUL_INPLACE(%s, %s)",
+        False,
+    ),
+    "DIV": (
+        "/",
+        "nb_divide",
+        "BINARY_OPERATION_DIV(%s, %s)",
+        "BINARY_OPERATION_INPLACE(PyNumber_InPlaceDivide, %s, %s)",
+        True,
+    ),
+    "FLOORDIV": (
+        "//",
+        "nb_floor_divide",
+        "BINARY_OPERATION_FLOORDIV(%s, %s)",
+        "BINARY_OPERATION_INPLACE(PyNumber_InPlaceFloorDivide, %s, %s)",
+        False,
+    ),
+    "TRUEDIV": (
+        "/",
+        "nb_true_divide",
+        "BINARY_OPERATION_TRUEDIV(%s, %s)",
+        "BINARY_OPERATION_INPLACE(PyNumber_InPlaceTrueDivide, %s, %s)",
+        False,
+    ),
+    "REMAINDER": (
+        "%",
+        "nb_remainder",
+        "BINARY_OPERATION_REMAINDER(%s, %s)",
+        "BINARY_OPERATION_INPLACE(PyNumber_InPlaceRemainder, %s, %s)",
+        False,
+    ),
+    "POW": (
+        "**",
+        "nb_power",
+        "POWER_OPERATION(%s, %s)",
+        "POWER_OPERATION_INPLACE(%s, %s)",
+        False,
+    ),
+    "LSHIFT": (
+        "<<",
+        "nb_lshift",
+        "BINARY_OPERATION(PyNumber_Lshift, %s, %s)",
+        "BINARY_OPERATION_INPLACE(PyNumber_InPlaceLshift, %s, %s)",
+        False,
+    ),
+    "RSHIFT": (
+        ">>",
+        "nb_rshift",
+        "BINARY_OPERATION(PyNumber_Rshift, %s, %s)",
+        "BINARY_OPERATION_INPLACE(PyNumber_InPlaceRshift, %s, %s)",
+        False,
+    ),
+    "BITAND": (
+        "&",
+        "nb_and",
+        "BINARY_OPERATION(PyNumber_And, %s, %s)",
+        "BINARY_OPERATION_INPLACE(PyNumber_InPlaceAnd, %s, %s)",
+        False,
+    ),
+    "BITOR": (
+        "|",
+        "nb_or",
+        "BINARY_OPERATION(PyNumber_Or, %s, %s)",
+        "BINARY_OPERATION_INPLACE(PyNumber_InPlaceOr, %s, %s)",
+        False,
+    ),
+    "BITXOR": (
+        "^",
+        "nb_xor",
+        "BINARY_OPERATION(PyNumber_Xor, %s, %s)",
+        "BINARY_OPERATION_INPLACE(PyNumber_InPlaceXor, %s, %s)",
+        False,
+    ),
+}
+
+_int_values_code = """\
+    const long a = PyInt_AS_LONG(operand1);
+    const long b = PyInt_AS_LONG(operand2);
+"""
+
+# Division by zero and the one overflowing division are left to the slot,
+# otherwise this is what CPython does.
+_int_divmod_code = """\
+    if (likely(b != 0 && !(b == -1 && a < 0 && (unsigned long)a == 0 - (unsigned long)a))) {
+        long x_div_y = a / b;
+        long x_mod_y = (long)(a - (unsigned long)x_div_y * b);
+
+        if (x_mod_y && ((b ^ x_mod_y) < 0)) {
+            x_mod_y += b;
+            x_div_y -= 1;
+        }
+
+        return PyInt_FromLong(%s);
+    }
+"""
+
+# Code that handles the common cases without calling the slot, it returns
+# the result, or else the slot does it.
+_fast_path_codes = {
+    ("SUB", "INT"): _int_values_code
+    + """
+    const long x = (long)((unsigned long)a - b);
+
+    // Detect overflow, in which case, a "long" object would have to be
+    // created, which we leave to the slot.
+    if ((x ^ a) >= 0 || (x ^ ~b) >= 0) {
+        return PyInt_FromLong(x);
+    }
+""",
+    ("MUL", "INT"): _int_values_code
+    + """
+    const long longprod = (long)((unsigned long)a * b);
+    const double doubleprod = (double)a * (double)b;
+    const double doubled_longprod = (double)longprod;
+
+    // Same overflow check as CPython does, the fast path being the normal
+    // case of small multiplicands.
+    if (likely(doubled_longprod == doubleprod)) {
+        return PyInt_FromLong(longprod);
+    }
+
+    const double diff = doubled_longprod - doubleprod;
+    const double absdiff = diff >= 0.0 ? diff : -diff;
+    const double absprod = doubleprod >= 0.0 ? doubleprod : -doubleprod;
+
+    if (32.0 * absdiff <= absprod) {
+        return PyInt_FromLong(longprod);
+    }
+""",
+    ("DIV", "INT"): _int_values_code
+    + """
+    // Warnings for classic division are left to the slot.
+    if (likely(!Py_DivisionWarningFlag)) {
+        if (likely(b != 0 && !(b == -1 && a < 0 && (unsigned long)a == 0 - (unsigned long)a))) {
+            long x_div_y = a / b;
+            long x_mod_y = (long)(a - (unsigned long)x_div_y * b);
+
+            if (x_mod_y && ((b ^ x_mod_y) < 0)) {
+                x_div_y -= 1;
+            }
+
+            return PyInt_FromLong(x_div_y);
+        }
+    }
+""",
+    ("FLOORDIV", "INT"): _int_values_code + "\n" + _int_divmod_code % "x_div_y",
+    ("REMAINDER", "INT"): _int_values_code + "\n" + _int_divmod_code % "x_mod_y",
+    ("LSHIFT", "INT"): _int_values_code
+    + """
+    // Negative and large shifts, and overflows are left to the slot.
+    if (likely(b >= 0 && b < LONG_BIT)) {
+        const long x = (long)((unsigned long)a << b);
+
+        if (likely(Py_ARITHMETIC_RIGHT_SHIFT(long, x, b) == a)) {
+            return PyInt_FromLong(x);
+        }
+    }
+""",
+    ("RSHIFT", "INT"): _int_values_code
+    + """
+    // Negative and large shifts are left to the slot.
+    if (likely(b >= 0 && b < LONG_BIT)) {
+        return PyInt_FromLong(Py_ARITHMETIC_RIGHT_SHIFT(long, a, b));
+    }
+""",
+    ("BITAND", "INT"): _int_values_code
+    + """
+    return PyInt_FromLong(a & b);
+""",
+    ("BITOR", "INT"): _int_values_code
+    + """
+    return PyInt_FromLong(a | b);
+""",
+    ("BITXOR", "INT"): _int_values_code
+    + """
+    return PyInt_FromLong(a ^ b);
+""",
+    ("SUB", "FLOAT"): """\
+    return PyFloat_FromDouble(PyFloat_AS_DOUBLE(operand1) - PyFloat_AS_DOUBLE(operand2));
+""",
+    ("MUL", "FLOAT"): """\
+    return PyFloat_FromDouble(PyFloat_AS_DOUBLE(operand1) * PyFloat_AS_DOUBLE(operand2));
+""",
+    ("TRUEDIV", "FLOAT"): """\
+    // Division by zero is left to the slot.
+    if (likely(PyFloat_AS_DOUBLE(operand2) != 0.0)) {
+        return PyFloat_FromDouble(PyFloat_AS_DOUBLE(operand1) / PyFloat_AS_DOUBLE(operand2));
+    }
+""",
+}
+
+# For floats not shared, the value can be updated in-place.
+_float_incremental_codes = {
+    "SUB": ("subtract", "-=", "Py_REFCNT(*operand1) == 1"),
+    "MUL": ("multiply", "*=", "Py_REFCNT(*operand1) == 1"),
+    "TRUEDIV": (
+        "divide",
+        "/=",
+        "Py_REFCNT(*operand1) == 1 && PyFloat_AS_DOUBLE(operand2) != 0.0",
+    ),
+}
+
+
+def _getHelperName(operation, left_type, right_type, suffix=""):
+    return "BINARY_OPERATION_%s_%s_%s%s" % (operation, left_type, right_type, suffix)
+
+
+def _getHelperVariants(type_name):
+    """ The left and right types of the helpers to generate for a type. """
+
+    return (
+        (type_name, type_name),
+        ("OBJECT", type_name),
+        (type_name, "OBJECT"),
+    )
+
+
+def _makeBinaryHelperCode(operation, type_name, left_type, right_type):
+    _operator, slot, generic_code, _generic_inplace_code, _py2_only = _operation_infos[
+        operation
+    ]
+    check, type_object, _py2_only = _type_infos[type_name]
+
+    helper_name = _getHelperName(operation, left_type, right_type)
+
+    lines = [
+        "PyObject *%s(PyObject *operand1, PyObject *operand2) {" % helper_name,
+        "    CHECK_OBJECT(operand1);",
+        "    CHECK_OBJECT(operand2);",
+    ]
+
+    if left_type != "OBJECT":
+        lines.append("    assert(%s(operand1));" % check)
+    if right_type != "OBJECT":
+        lines.append("    assert(%s(operand2));" % check)
+
+    lines.append("")
+
+    if left_type == right_type:
+        fast_path_code = _fast_path_codes.get((operation, type_name))
+
+        if fast_path_code is not None:
+            # Some fast paths cover everything.
+            if fast_path_code.rstrip().split("\n")[-1].startswith("    return"):
+                lines += [fast_path_code.rstrip(), "}"]
+                return "\n".join(lines)
+
+            lines.append(fast_path_code)
+
+        if operation == "POW":
+            slot_args = "operand1, operand2, Py_None"
+        else:
+            slot_args = "operand1, operand2"
+
+        lines += [
+            "    // Cannot be \"NotImplemented\" for the exact same types.",
+            "    PyObject *result = %s.tp_as_number->%s(%s);"
+            % (type_object, slot, slot_args),
+            "    assert(result != Py_NotImplemented);",
+            "",
+            "    return result;",
+        ]
+    else:
+        other_operand = "operand1" if left_type == "OBJECT" else "operand2"
+
+        lines += [
+            "    if (%s(%s)) {" % (check, other_operand),
+            "        return %s(operand1, operand2);"
+            % _getHelperName(operation, type_name, type_name),
+            "    }",
+            "",
+            "    return %s;" % (generic_code % ("operand1", "operand2")),
+        ]
+
+    lines.append("}")
+
+    return "\n".join(lines)
+
+
+def _makeInplaceHelperCode(operation, type_name, left_type, right_type):
+    _operator, _slot, _generic_code, generic_inplace_code, _py2_only = _operation_infos[
+        operation
+    ]
+    check, _type_object, _py2_only = _type_infos[type_name]
+
+    helper_name = _getHelperName(operation, left_type, right_type, "_INPLACE")
+
+    lines = [
+        "bool %s(PyObject **operand1, PyObject *operand2) {" % helper_name,
+        "    assert(operand1);",
+        "    CHECK_OBJECT(*operand1);",
+        "    CHECK_OBJECT(operand2);",
+    ]
+
+    if left_type != "OBJECT":
+        lines.append("    assert(%s(*operand1));" % check)
+    if right_type != "OBJECT":
+        lines.append("    assert(%s(operand2));" % check)
+
+    lines.append("")
+
+    if left_type == right_type:
+        if type_name == "FLOAT" and operation in _float_incremental_codes:
+            name, c_operator, condition = _float_incremental_codes[operation]
+
+            lines += [
+                "    if (%s) {" % condition,
+                '        PyFPE_START_PROTECT("%s", return false);' % name,
+                "        PyFloat_AS_DOUBLE(*operand1) %s PyFloat_AS_DOUBLE(operand2);"
+                % c_operator,
+                "        PyFPE_END_PROTECT(*operand1);",
+                "",
+                "        return true;",
+                "    }",
+                "",
+            ]
+
+        lines += [
+            "    PyObject *result = %s(*operand1, operand2);"
+            % _getHelperName(operation, type_name, type_name),
+            "",
+            "    if (unlikely(result == NULL)) {",
+            "        return false;",
+            "    }",
+            "",
+            "    // We got an object handed, that we have to release.",
+            "    Py_DECREF(*operand1);",
+            "",
+            "    // That's our return value then. As we use a dedicated variable, it's",
+            "    // OK that way.",
+            "    *operand1 = result;",
+            "",
+            "    return true;",
+        ]
+    else:
+        other_operand = "*operand1" if left_type == "OBJECT" else "operand2"
+
+        # The types have no in-place slots, but the other value may.
+        lines += [
+            "    if (%s(%s)) {" % (check, other_operand),
+            "        return %s(operand1, operand2);"
+            % _getHelperName(operation, type_name, type_name, "_INPLACE"),
+            "    }",
+            "",
+            "    return %s;" % (generic_inplace_code % ("operand1", "operand2")),
+        ]
+
+    lines.append("}")
+
+    return "\n".join(lines)
+
+
+def _wrapPython2Only(codes, python2_only):
+    if python2_only:
+        return ["#if PYTHON_VERSION < 300"] + codes + ["#endif"]
+    else:
+        return codes
+
+
+def _wrapPython3Only(codes):
+    return ["#if PYTHON_VERSION >= 300"] + codes + ["#endif"]
+
+
+def _makeHelperFileCode(operator_name, operation, types, maker, in_place):
+    operator, _slot, _generic_code, _generic_inplace_code, py2_only = _operation_infos[
+        operation
+    ]
+
+    codes = []
+
+    for type_name in types:
+        type_codes = [
+            maker(operation, type_name, left_type, right_type)
+            for left_type, right_type in _getHelperVariants(type_name)
+        ]
+
+        codes += _wrapPython2Only(
+            ["\n\n".join(type_codes)], _type_infos[type_name][2] and not py2_only
+        )
+
+    codes = _wrapPython2Only(codes, py2_only)
+
+    return (
+        _license_header
+        + '/* C helpers for type specialized "%s" (%s) operations */\n\n'
+        % (operator + "=" if in_place else operator, operator_name)
+        + "\n\n".join(codes)
+        + "\n"
+    )
+
+
+def _makeHeaderCode():
+    lines = []
+
+    for _operator_name, (operation, types) in sorted(
+        specialized_binary_operators.items()
+    ):
+        operator = _operation_infos[operation][0]
+        py2_only = _operation_infos[operation][4]
+
+        lines.append("")
+        lines.append(
+            '// Helpers to execute "%s" on fully or partially known types.' % operator
+        )
+
+        declarations = []
+
+        for type_name in types:
+            type_declarations = []
+
+            for left_type, right_type in _getHelperVariants(type_name):
+                type_declarations.append(
+                    "extern PyObject *%s(PyObject *operand1, PyObject *operand2);"
+                    % _getHelperName(operation, left_type, right_type)
+                )
+                type_declarations.append(
+                    "extern bool %s(PyObject **operand1, PyObject *operand2);"
+                    % _getHelperName(operation, left_type, right_type, "_INPLACE")
+                )
+
+            declarations += _wrapPython2Only(
+                type_declarations, _type_infos[type_name][2] and not py2_only
+            )
+
+        lines += _wrapPython2Only(declarations, py2_only)
+
+    return (
+        _license_header
+        + "#ifndef __NUITKA_OPERATIONS_BINARY_SPECIALIZED_H__\n"
+        + "#define __NUITKA_OPERATIONS_BINARY_SPECIALIZED_H__\n"
+        + "\n".join(lines)
+        + "\n\n#endif\n"
+    )
+
+
+# Per type of comparison helpers, the exact type check, the type object, the
+# name of its file, and if the slot compares elements, then it can recurse and
+# give other objects than bools.
+_comparison_type_infos = {
+    "LONG": ("PyLong_CheckExact", "PyLong_Type", "Long", False),
+    "FLOAT": ("PyFloat_CheckExact", "PyFloat_Type", "Float", False),
+    "UNICODE": ("PyUnicode_CheckExact", "PyUnicode_Type", "Unicode", False),
+    "BYTES": ("PyBytes_CheckExact", "PyBytes_Type", "Bytes", False),
+    "TUPLE": ("PyTuple_CheckExact", "PyTuple_Type", "Tuple", True),
+}
+
+# Per comparison, the operator, and the operation code for the slot.
+_comparison_infos = (
+    ("LT", "<", "Py_LT"),
+    ("LTE", "<=", "Py_LE"),
+    ("EQ", "==", "Py_EQ"),
+    ("NOTEQ", "!=", "Py_NE"),
+    ("GT", ">", "Py_GT"),
+    ("GTE", ">=", "Py_GE"),
+)
+
+# Result of comparing an object to itself, for types where that is known,
+# i.e. not for float, where "NaN" is not equal to itself.
+_comparison_identity_results = {"LTE": True, "EQ": True, "NOTEQ": False, "GTE": True}
+
+# Code to compare the values without calling the slot, and if it covers all
+# values. The code gives "a" and "b" as C values, that are compared with the
+# operator, or else the slot does it.
+_comparison_values_codes = {
+    "LONG": (
+        """\
+    const Py_ssize_t size1 = Py_SIZE(operand1);
+    const Py_ssize_t size2 = Py_SIZE(operand2);
+
+    // Values of at most one digit are the normal case, and can be compared
+    // as C values.
+    if (likely(size1 >= -1 && size1 <= 1 && size2 >= -1 && size2 <= 1)) {
+        const long a = size1 == 0 ? 0 : size1 * (long)((PyLongObject *)operand1)->ob_digit[0];
+        const long b = size2 == 0 ? 0 : size2 * (long)((PyLongObject *)operand2)->ob_digit[0];
+
+%s
+    }
+""",
+        False,
+    ),
+    "FLOAT": (
+        """\
+    const double a = PyFloat_AS_DOUBLE(operand1);
+    const double b = PyFloat_AS_DOUBLE(operand2);
+
+%s""",
+        True,
+    ),
+}
+
+
+def _getComparisonHelperName(comparison, left_type, right_type, bool_result):
+    return "RICH_COMPARE_%s%s_%s_%s" % (
+        "BOOL_" if bool_result else "",
+        comparison,
+        left_type,
+        right_type,
+    )
+
+
+def _getComparisonHelperVariants(type_name, comparison):
+    """ The left and right types, and suffixes of the helpers to generate. """
+
+    result = []
+
+    for left_type, right_type in _getHelperVariants(type_name):
+        result.append((left_type, right_type, ""))
+
+        # Only equality is done without recursion checks, and for the exact
+        # types, only tuples can recurse at all.
+        if comparison == "EQ" and (
+            left_type != right_type or _comparison_type_infos[type_name][3]
+        ):
+            result.append((left_type, right_type, "_NORECURSE"))
+
+    return result
+
+
+def _indentCode(code, amount):
+    return "\n".join(
+        " " * amount + line if line else line for line in code.split("\n")
+    )
+
+
+def _makeComparisonHelperCode(
+    type_name, comparison, left_type, right_type, suffix, bool_result
+):
+    # Many details to consider, pylint: disable=too-many-branches,too-many-locals
+    check, type_object, _file_name, compares_elements = _comparison_type_infos[
+        type_name
+    ]
+    operator, op_code = [
+        (operator, op_code)
+        for comparison_name, operator, op_code in _comparison_infos
+        if comparison_name == comparison
+    ][0]
+
+    helper_name = (
+        _getComparisonHelperName(comparison, left_type, right_type, bool_result)
+        + suffix
+    )
+
+    lines = [
+        "%s%s(PyObject *operand1, PyObject *operand2) {"
+        % ("int " if bool_result else "PyObject *", helper_name),
+        "    CHECK_OBJECT(operand1);",
+        "    CHECK_OBJECT(operand2);",
+    ]
+
+    if left_type != "OBJECT":
+        lines.append("    assert(%s(operand1));" % check)
+    if right_type != "OBJECT":
+        lines.append("    assert(%s(operand2));" % check)
+
+    lines.append("")
+
+    if left_type != right_type:
+        other_operand = "operand1" if left_type == "OBJECT" else "operand2"
+
+        lines += [
+            "    if (%s(%s)) {" % (check, other_operand),
+            "        return %s%s(operand1, operand2);"
+            % (
+                _getComparisonHelperName(
+                    comparison, type_name, type_name, bool_result
+                ),
+                suffix,
+            ),
+            "    }",
+            "",
+            "    return %s%s(operand1, operand2);"
+            % (
+                _getComparisonHelperName(comparison, "OBJECT", "OBJECT", bool_result),
+                suffix,
+            ),
+            "}",
+        ]
+
+        return "\n".join(lines)
+
+    if bool_result:
+        values_return_code = "    return a %s b;" % operator
+    else:
+        values_return_code = """\
+    PyObject *result = BOOL_FROM(a %s b);
+    Py_INCREF(result);
+    return result;""" % (
+            operator
+        )
+
+    if type_name in _comparison_values_codes:
+        values_code, covers_all = _comparison_values_codes[type_name]
+
+        if covers_all:
+            lines += [values_code % values_return_code, "}"]
+            return "\n".join(lines)
+
+        lines.append(values_code % _indentCode(values_return_code, 4))
+    elif type_name != "FLOAT" and comparison in _comparison_identity_results:
+        identity_result = _comparison_identity_results[comparison]
+
+        lines.append("    // Quick path for avoidable checks, compatible with CPython.")
+        lines.append("    if (operand1 == operand2) {")
+
+        if bool_result:
+            lines.append("        return %d;" % identity_result)
+        else:
+            lines += [
+                "        Py_INCREF(Py_%s);" % identity_result,
+                "        return Py_%s;" % identity_result,
+            ]
+
+        lines += ["    }", ""]
+
+    if compares_elements and not suffix:
+        lines += [
+            '    if (unlikely(Py_EnterRecursiveCall((char *)" in comparison"))) {',
+            "        return %s;" % ("-1" if bool_result else "NULL"),
+            "    }",
+            "",
+        ]
+
+    lines += [
+        "    // Cannot be \"NotImplemented\" for the exact same types.",
+        "    PyObject *result = %s.tp_richcompare(operand1, operand2, %s);"
+        % (type_object, op_code),
+        "    assert(result != Py_NotImplemented);",
+    ]
+
+    if compares_elements and not suffix:
+        lines += ["", "    Py_LeaveRecursiveCall();"]
+
+    if bool_result:
+        lines += [
+            "",
+            "    if (unlikely(result == NULL)) {",
+            "        return -1;",
+            "    }",
+            "",
+        ]
+
+        if compares_elements:
+            lines += [
+                "    // The result of comparing elements, can be any object.",
+                "    int res = CHECK_IF_TRUE(result);",
+            ]
+        else:
+            lines.append("    int res = result == Py_True;")
+
+        lines += ["", "    Py_DECREF(result);", "", "    return res;"]
+    else:
+        lines += ["", "    return result;"]
+
+    lines.append("}")
+
+    return "\n".join(lines)
+
+
+def _makeComparisonFileCode(type_name):
+    codes = []
+
+    for comparison, operator, _op_code in _comparison_infos:
+        for bool_result in (False, True):
+            for left_type, right_type, suffix in _getComparisonHelperVariants(
+                type_name, comparison
+            ):
+                codes.append(
+                    _makeComparisonHelperCode(
+                        type_name,
+                        comparison,
+                        left_type,
+                        right_type,
+                        suffix,
+                        bool_result,
+                    )
+                )
+
+    return (
+        _license_header
+        + '/* C helpers for type specialized "%s" rich comparisons */\n\n'
+        % type_name.lower()
+        + "\n\n".join(_wrapPython3Only(["\n\n".join(codes)]))
+        + "\n"
+    )
+
+
+def _makeComparisonHeaderCode():
+    lines = []
+
+    for type_name in specialized_comparison_types:
+        compares_elements = _comparison_type_infos[type_name][3]
+
+        lines.append("")
+        lines.append(
+            "// Helpers to compare fully or partially known %s values."
+            % type_name.lower()
+        )
+
+        for comparison, _operator, _op_code in _comparison_infos:
+            for bool_result in (False, True):
+                for left_type, right_type, suffix in _getComparisonHelperVariants(
+                    type_name, comparison
+                ):
+                    lines.append(
+                        "extern %s%s%s(PyObject *operand1, PyObject *operand2);"
+                        % (
+                            "int " if bool_result else "PyObject *",
+                            _getComparisonHelperName(
+                                comparison, left_type, right_type, bool_result
+                            ),
+                            suffix,
+                        )
+                    )
+
+                # Without elements, there is no recursion to avoid.
+                if comparison == "EQ" and not compares_elements:
+                    helper_name = _getComparisonHelperName(
+                        comparison, type_name, type_name, bool_result
+                    )
+
+                    lines.append(
+                        "#define %s_NORECURSE %s" % (helper_name, helper_name)
+                    )
+
+    return (
+        _license_header
+        + "#ifndef __NUITKA_RICHCOMPARISONS_SPECIALIZED_H__\n"
+        + "#define __NUITKA_RICHCOMPARISONS_SPECIALIZED_H__\n\n"
+        + "\n".join(_wrapPython3Only(lines))
+        + "\n\n#endif\n"
+    )
+
+
+def _writeFile(filename, contents):
+    my_print("Writing", filename)
+
+    with open(filename, "w") as output_file:
+        output_file.write(contents)
+
+
+def main():
+    goHome()
+
+    static_src = os.path.join("nuitka", "build", "static_src")
+
+    for operator_name, (operation, types) in sorted(
+        specialized_binary_operators.items()
+    ):
+        _writeFile(
+            os.path.join(static_src, "HelpersOperationBinary%s.c" % operator_name),
+            _makeHelperFileCode(
+                operator_name, operation, types, _makeBinaryHelperCode, False
+            ),
+        )
+        _writeFile(
+            os.path.join(
+                static_src, "HelpersOperationBinaryInplace%s.c" % operator_name
+            ),
+            _makeHelperFileCode(
+                operator_name, operation, types, _makeInplaceHelperCode, True
+            ),
+        )
+
+    _writeFile(
+        os.path.join(
+            "nuitka",
+            "build",
+            "include",
+            "nuitka",
+            "helper",
+            "operations_binary_specialized.h",
+        ),
+        _makeHeaderCode(),
+    )
+
+    for type_name in specialized_comparison_types:
+        _writeFile(
+            os.path.join(
+                static_src,
+                "HelpersComparison%s.c" % _comparison_type_infos[type_name][2],
+            ),
+            _makeComparisonFileCode(type_name),
+        )
+
+    _writeFile(
+        os.path.join(
+            "nuitka",
+            "build",
+            "include",
+            "nuitka",
+            "helper",
+            "richcomparisons_specialized.h",
+        ),
+        _makeComparisonHeaderCode(),
+    )
+
+
+if __name__ == "__main__":
+    main()
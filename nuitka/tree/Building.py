@@ -108,6 +108,7 @@ from nuitka.Options import shallWarnUnusualCode
 from nuitka.plugins.Plugins import Plugins
 from nuitka.PythonVersions import python_version
 from nuitka.utils import MemoryUsage
+from nuitka.utils.BuildProfile import withModuleBuildPhase
 from nuitka.utils.FileOperations import splitPath
 
 from . import SyntaxErrors
@@ -960,6 +961,16 @@ class CodeTooComplexCode(Exception):
 
 
 def createModuleTree(module, source_ref, source_code, is_main):
+    with withModuleBuildPhase(module.getFullName(), "tree_building"):
+        _createModuleTree(
+            module=module,
+            source_ref=source_ref,
+            source_code=source_code,
+            is_main=is_main,
+        )
+
+
+def _createModuleTree(module, source_ref, source_code, is_main):
     if Options.isShowMemory():
         memory_watch = MemoryUsage.MemoryWatch()
 
@@ -34,7 +34,7 @@ from nuitka.nodes.AsyncgenNodes import (
 from nuitka.nodes.BuiltinIteratorNodes import (
     ExpressionAsyncIter,
     ExpressionAsyncNext,
-    ExpressionBuiltinIter1,
+    ExpressionBuiltinIterForLoop,
 )
 from nuitka.nodes.BuiltinNextNodes import ExpressionBuiltinNext1
 from nuitka.nodes.CodeObjectSpecs import CodeObjectSpec
@@ -90,7 +90,7 @@ def _makeIteratorCreation(provider, qual, for_asyncgen, source_ref):
 
         return result
     else:
-        return ExpressionBuiltinIter1(
+        return ExpressionBuiltinIterForLoop(
             value=buildNode(provider=provider, node=qual.iter, source_ref=source_ref),
             source_ref=source_ref,
         )
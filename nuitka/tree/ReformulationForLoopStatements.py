@@ -29,7 +29,7 @@ from nuitka.nodes.AssignNodes import (
 from nuitka.nodes.BuiltinIteratorNodes import (
     ExpressionAsyncIter,
     ExpressionAsyncNext,
-    ExpressionBuiltinIter1,
+    ExpressionBuiltinIterForLoop,
 )
 from nuitka.nodes.BuiltinNextNodes import ExpressionBuiltinNext1
 from nuitka.nodes.ComparisonNodes import ExpressionComparisonIs
@@ -165,7 +165,7 @@ def _buildForLoopNode(provider, node, sync, source_ref):
         statements = []
 
     if sync:
-        iter_source = ExpressionBuiltinIter1(
+        iter_source = ExpressionBuiltinIterForLoop(
             value=source, source_ref=source.getSourceReference()
         )
     else:
@@ -0,0 +1,169 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Build profile of Nuitka itself.
+
+Records wall and CPU time, and peak memory for the phases of a compilation,
+and for each module within these phases, and writes them as a JSON report,
+to find out what makes a compilation expensive.
+
+CPU time includes child processes waited for, e.g. the C compilation done
+by Scons. Peak memory is the maximum process memory usage so far, so for a
+module, the increase of it is what is given. Module times are inclusive, e.g.
+optimizing a module includes building the trees of modules it imports for the
+first time.
+"""
+
+import json
+import os
+import sys
+from contextlib import contextmanager
+from timeit import default_timer as timer
+
+from nuitka import Options
+from nuitka.Version import getNuitkaVersion
+
+from .MemoryUsage import getOwnProcessMemoryUsage
+
+# Phases in the order they started, and per module data per phase.
+_phases = []
+_modules = {}
+
+
+def isBuildProfileEnabled():
+    return Options.getBuildProfileReportFilename() is not None
+
+
+def _getCPUTime():
+    times = os.times()
+
+    return times[0] + times[1] + times[2] + times[3]
+
+
+class _Measurement(object):
+    __slots__ = ("wall_time", "cpu_time", "memory")
+
+    def __init__(self):
+        self.wall_time = timer()
+        self.cpu_time = _getCPUTime()
+        self.memory = getOwnProcessMemoryUsage()
+
+    def getDeltas(self):
+        end = _Measurement()
+
+        return (
+            end.wall_time - self.wall_time,
+            end.cpu_time - self.cpu_time,
+            end.memory,
+            end.memory - self.memory,
+        )
+
+
+@contextmanager
+def withBuildPhase(phase_name):
+    """ Record time and memory usage for a phase of the compilation. """
+
+    if not isBuildProfileEnabled():
+        yield
+        return
+
+    start = _Measurement()
+
+    try:
+        yield
+    finally:
+        wall_time, cpu_time, peak_memory, memory_increase = start.getDeltas()
+
+        _phases.append(
+            {
+                "name": phase_name,
+                "wall_time": wall_time,
+                "cpu_time": cpu_time,
+                "peak_memory": peak_memory,
+                "memory_increase": memory_increase,
+            }
+        )
+
+
+def _getModulePhaseRecord(module_name, phase_name):
+    module_record = _modules.setdefault(module_name, {})
+
+    if phase_name not in module_record:
+        module_record[phase_name] = {
+            "wall_time": 0.0,
+            "cpu_time": 0.0,
+            "memory_increase": 0,
+            "passes": 0,
+        }
+
+    return module_record[phase_name]
+
+
+@contextmanager
+def withModuleBuildPhase(module_name, phase_name):
+    """ Record time and memory usage for a module in a phase.
+
+        Repeated work, e.g. in multiple optimization passes, is added up,
+        and the passes are counted.
+    """
+
+    if not isBuildProfileEnabled():
+        yield
+        return
+
+    start = _Measurement()
+
+    try:
+        yield
+    finally:
+        wall_time, cpu_time, _peak_memory, memory_increase = start.getDeltas()
+
+        record = _getModulePhaseRecord(module_name, phase_name)
+
+        record["wall_time"] += wall_time
+        record["cpu_time"] += cpu_time
+        record["memory_increase"] += memory_increase
+        record["passes"] += 1
+
+
+def countModuleBuildStep(module_name, phase_name, step_name):
+    """ Count something happening for a module in a phase.
+
+        For instance the local optimization steps done in a pass.
+    """
+
+    if not isBuildProfileEnabled():
+        return
+
+    record = _getModulePhaseRecord(module_name, phase_name)
+    record[step_name] = record.get(step_name, 0) + 1
+
+
+def writeBuildProfileReport():
+    if not isBuildProfileEnabled():
+        return
+
+    report = {
+        "nuitka_version": getNuitkaVersion(),
+        "python_version": sys.version.split()[0],
+        "arguments": sys.argv[1:],
+        "phases": _phases,
+        "modules": _modules,
+    }
+
+    with open(Options.getBuildProfileReportFilename(), "w") as report_file:
+        json.dump(report, report_file, indent=2, sort_keys=True)
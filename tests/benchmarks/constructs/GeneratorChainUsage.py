@@ -0,0 +1,51 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+from __future__ import print_function
+
+def source(n):
+    for i in range(n):
+        yield i
+
+def stage(iterable, factor):
+    # Every item yielded is a new value computed from the previous stage.
+    for value in iterable:
+        yield value * factor + 1
+
+def calledRepeatedly():
+    # We measure the throughput of a chain of generators.
+    pipeline = source(20)
+    pipeline = stage(pipeline, 2)
+    pipeline = stage(pipeline, 3)
+    pipeline = stage(pipeline, 5)
+
+# construct_begin
+    for x in pipeline:
+        pass
+# construct_alternative
+    x = None
+# construct_end
+
+    return x
+
+import itertools
+for x in itertools.repeat(None, 20000):
+    calledRepeatedly()
+
+print("OK.")
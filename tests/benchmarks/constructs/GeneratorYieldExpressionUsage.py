@@ -0,0 +1,45 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+from __future__ import print_function
+
+def calledRepeatedly():
+    # We measure resuming a generator in the middle of an expression, where
+    # values computed before the yield must survive it.
+    def generator(a, b):
+        while True:
+            yield (a, b, (yield a + b), [a, b])
+
+    gen = generator(1, 2)
+    next(gen)
+
+# construct_begin
+    for x in range(20):
+        gen.send(x)
+# construct_alternative
+    x = None
+# construct_end
+
+    return x
+
+import itertools
+for x in itertools.repeat(None, 20000):
+    calledRepeatedly()
+
+print("OK.")
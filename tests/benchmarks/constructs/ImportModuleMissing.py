@@ -0,0 +1,40 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+
+# Failed import probes go through the whole meta path, including the lookup in
+# the table of embedded modules, which is largest in standalone mode.
+
+module_name = "module_that_does_not_exist"
+
+def calledRepeatedly():
+    try:
+# construct_begin
+        __import__(module_name)
+# construct_alternative
+        raise ImportError
+# construct_end
+    except ImportError:
+        pass
+
+import itertools
+for x in itertools.repeat(None, 5000):
+    calledRepeatedly()
+
+print("OK.")